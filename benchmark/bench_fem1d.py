@@ -0,0 +1,167 @@
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Type, Union
+
+import numpy as np
+import scipy
+
+import module
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d
+from module.fem.fem1d import _laplacian_matrix, _term_matrix
+
+MeshType = Union[Type[LineMesh], Type[LineMeshHighOrder]]
+"""ベンチマーク対象のメッシュのクラスの型"""
+
+MESH_TYPES: Dict[str, MeshType] = {"linear": LineMesh, "quadratic": LineMeshHighOrder}
+"""ベンチマーク対象のメッシュの種類"""
+
+
+def measure(func: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None, repeat: int = 5) -> Dict[str, Any]:
+    """処理時間とピークメモリを計測する関数
+
+    処理時間はtracemallocを無効にした状態で`repeat`回計測し, ピークメモリは別の一回の実行で計測する.
+
+    Args:
+        func (Callable[[Any], Any]): 計測対象の処理（setupの戻り値を引数に取る）
+        setup (Callable[[], Any], optional): 計測対象外の前処理. Defaults to lambda: None.
+        repeat (int, optional): 処理時間の計測回数. Defaults to 5.
+
+    Returns:
+        Dict[str, Any]: 計測結果
+    """
+    times: List[float] = list()
+    for _ in range(repeat):
+        args = setup()
+        gc.collect()
+        start = time.perf_counter()
+        func(args)
+        times.append(time.perf_counter() - start)
+
+    args = setup()
+    gc.collect()
+    tracemalloc.start()
+    func(args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "time_min": min(times),
+        "time_median": statistics.median(times),
+        "time_mean": statistics.fmean(times),
+        "repeat": repeat,
+        "peak_memory_bytes": peak,
+    }
+
+
+def poisson_pipeline(mesh_type: MeshType, n_node: int) -> None:
+    """`example/fem1d.py`のPoisson問題と同じ手順（メッシュ生成から求解まで）
+
+    Args:
+        mesh_type (MeshType): メッシュの種類
+        n_node (int): 節点数
+    """
+    mesh = mesh_type(n_node, 0.0, 1.0, ["D", "N"])
+    fem = Fem1d(mesh)
+    coef = 2.0 * np.pi
+    u = np.cos(coef * mesh.x)
+    g = -np.sin(coef * mesh.x) * coef
+    coefficient = fem.laplacian_matrix
+    rhs = fem.term(np.cos(coef * mesh.x) * coef**2)
+    fem.implement_dirichlet(coefficient, rhs, u)
+    fem.implement_neumann(rhs, g)
+    fem.solve_system(coefficient, rhs)
+
+
+def run(sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    """全てのベンチマークを実行する関数
+
+    Args:
+        sizes (List[int]): 節点数のリスト（二次要素では奇数に切り上げる）
+        repeat (int): 処理時間の計測回数
+
+    Returns:
+        List[Dict[str, Any]]: 計測結果のリスト
+    """
+    results = list()
+    for name, mesh_type in MESH_TYPES.items():
+        for size in sizes:
+            n_node = size + 1 if mesh_type is LineMeshHighOrder and size % 2 == 0 else size
+            mesh = mesh_type(n_node, 0.0, 1.0, ["D", "N"])
+            fem = Fem1d(mesh)
+            values = np.cos(mesh.x)
+            cases: Dict[str, Dict[str, Any]] = {
+                "mesh": measure(lambda _: mesh_type(n_node, 0.0, 1.0), repeat=repeat),
+                "laplacian_matrix": measure(lambda _: _laplacian_matrix(mesh), repeat=repeat),
+                "term_matrix": measure(lambda _: _term_matrix(mesh), repeat=repeat),
+                "fem1d_first_laplacian": measure(lambda _: Fem1d(mesh).laplacian_matrix, repeat=repeat),
+                "implement_dirichlet": measure(
+                    lambda a: fem.implement_dirichlet(a[0], a[1], values),
+                    setup=lambda: (fem.laplacian_matrix, np.zeros(n_node)),
+                    repeat=repeat,
+                ),
+                "implement_neumann": measure(
+                    lambda rhs: fem.implement_neumann(rhs, values), setup=lambda: np.zeros(n_node), repeat=repeat
+                ),
+                "poisson_pipeline": measure(lambda _: poisson_pipeline(mesh_type, n_node), repeat=repeat),
+            }
+            for case, result in cases.items():
+                results.append({"case": case, "mesh": name, "n_node": n_node, **result})
+                print(f"{name:>9s} {case:>20s} n_node={n_node:>9d} {result['time_median'] * 1e3:10.3f} ms")
+            del mesh, fem, values
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> None:
+    """基準となる計測結果との比を表示する関数
+
+    Args:
+        results (List[Dict[str, Any]]): 今回の計測結果
+        baseline (List[Dict[str, Any]]): 基準となる計測結果
+    """
+    reference = {(r["case"], r["mesh"], r["n_node"]): r for r in baseline}
+    print("case                 mesh       n_node     time ratio  memory ratio")
+    for r in results:
+        key = (r["case"], r["mesh"], r["n_node"])
+        if key not in reference:
+            continue
+        base = reference[key]
+        time_ratio = r["time_median"] / base["time_median"]
+        memory_ratio = r["peak_memory_bytes"] / max(base["peak_memory_bytes"], 1)
+        print(f"{r['case']:20s} {r['mesh']:10s} {r['n_node']:<10d} {time_ratio:10.3f} {memory_ratio:13.3f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark of one dimensional finite element analysis")
+    sizes = [10**3, 10**4, 10**5, 10**6, 10**7]
+    parser.add_argument("--sizes", type=int, nargs="+", default=sizes, help="Numbers of nodes.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repetitions.")
+    parser.add_argument("--output", type=str, default="", help="Save results as JSON.")
+    parser.add_argument("--compare", type=str, default="", help="JSON file of a previous run to compare with.")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    report = {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "module_version": module.__version__,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf8"))
+        compare(results, baseline["results"])
@@ -1,7 +1,5 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.sparse import csc_matrix, lil_matrix
-from scipy.sparse.linalg import splu
 
 from module.discretization import LineMesh, LineMeshHighOrder
 from module.fem import Fem1d
@@ -49,14 +47,13 @@ if __name__ == "__main__":
         coef_x = coef * mesh.x
         u = np.cos(coef_x)
         g = -np.sin(coef_x) * coef
-        coefficient = fem.laplacian_matrix
-        coefficient -= (coef**2) * lil_matrix(fem.term_matrix)
+        coefficient = fem.operator(1.0, -(coef**2))
         rhs = np.zeros_like(mesh.x)
 
     fem.implement_dirichlet(coefficient, rhs, u)
     fem.implement_neumann(rhs, g)
 
-    sol = splu(csc_matrix(coefficient)).solve(rhs)
+    sol = fem.solve_system(coefficient, rhs)
     relative_error = np.max(np.abs(u - sol) / np.abs(u).max())
 
     print("Program:", __file__)
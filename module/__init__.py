@@ -5,4 +5,4 @@ __author__ = "Haruno Yuzunoki"
 __author_email__ = "yuzunoki.haruno@gmail.com"
 __url__ = "https://github.com/yuzunoki-haruno/numerical-analysis-modules"
 
-__all__ = ["discretization", "fem"]
+__all__ = ["discretization", "fem", "profiling", "storage"]
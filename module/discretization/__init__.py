@@ -1,5 +1,5 @@
 from .boundary_condition import BoundaryCondition
 from .discretized_region import DiscretizedRegion1D
-from .mesh1d import LineMesh, LineMeshHighOrder
+from .mesh1d import LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
 
-__all__ = ["BoundaryCondition", "DiscretizedRegion1D", "LineMesh", "LineMeshHighOrder"]
+__all__ = ["BoundaryCondition", "DiscretizedRegion1D", "LineMesh", "LineMeshHighOrder", "LineMeshLagrange", "Mesh1D"]
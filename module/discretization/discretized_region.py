@@ -9,6 +9,8 @@ from .boundary_condition import BoundaryCondition
 class DiscretizedRegion1D:
     """離散化された一次元領域"""
 
+    __slots__ = ("_x", "_boundary_nodes", "_conditions", "_unit_normals")
+
     def __init__(self, n_node: int, xmin: float, xmax: float, conditions: List[str] | None = None) -> None:
         """離散化された一次元領域の生成
 
@@ -1,11 +1,16 @@
 from typing import List
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from .discretized_region import DiscretizedRegion1D
 
 
 class LineMesh(DiscretizedRegion1D):
     """一次元有限要素（一次要素）"""
 
+    __slots__ = ("_element_nodes",)
+
     def __init__(self, n_node: int, xmin: float, xmax: float, conditions: List[str] | None = None) -> None:
         """一次元有限要素（一次要素）
 
@@ -17,7 +22,47 @@ class LineMesh(DiscretizedRegion1D):
         """
         super().__init__(n_node, xmin, xmax, conditions)
         n_element = n_node - 1
-        self._element_nodes = [[i, i + 1] for i in range(n_element)]
+        self._element_nodes = np.empty((n_element, 2), dtype=np.intp)
+        self._element_nodes[:, 0] = np.arange(n_element)
+        self._element_nodes[:, 1] = self._element_nodes[:, 0] + 1
+        self._element_nodes.setflags(write=False)
+
+    @classmethod
+    def from_vertices(cls, vertices: ArrayLike, conditions: List[str] | None = None) -> "LineMesh":
+        """要素の端点の座標から不等間隔のメッシュを生成する関数
+
+        Args:
+            vertices (ArrayLike): 要素の端点の座標（狭義単調増加）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Returns:
+            LineMesh: 一次元有限要素（一次要素）
+        """
+        x = _node_coordinates(vertices, 1)
+        mesh = cls(x.size, x[0], x[-1], conditions)
+        mesh._x = x
+        return mesh
+
+    @classmethod
+    def from_arrays(cls, x: NDArray, element_nodes: NDArray, conditions: List[str] | None = None) -> "LineMesh":
+        """節点座標と要素節点番号の配列から, 配列を複製せずにメッシュを生成する関数
+
+        配列の内容は走査せず形状のみを検査するため, メモリマップした配列でも節点数によらず即座に生成できる.
+
+        Args:
+            x (NDArray): 節点座標（形状は(節点数,)）
+            element_nodes (NDArray): 要素を構成する節点番号の配列（形状は(要素数, 2)）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Raises:
+            ValueError: 配列の形状が一次要素のメッシュと一致しない場合に発生
+
+        Returns:
+            LineMesh: 一次元有限要素（一次要素）
+        """
+        mesh = cls.__new__(cls)
+        _set_arrays(mesh, x, element_nodes, 1, conditions)
+        return mesh
 
     @property
     def n_element(self) -> int:
@@ -26,32 +71,34 @@ class LineMesh(DiscretizedRegion1D):
         Returns:
             int: 要素数
         """
-        return len(self._element_nodes)
+        return int(self._element_nodes.shape[0])
 
     @property
-    def element_nodes(self) -> List[List[int]]:
-        """要素を構成する節点番号のリスト
+    def element_nodes(self) -> NDArray:
+        """要素を構成する節点番号の配列
 
         Returns:
-            List[List[int]]: _description_
+            NDArray: 要素を構成する節点番号の配列（形状は(要素数, 2)）
         """
         return self._element_nodes
 
-    def __getitem__(self, index: int) -> List[int]:
-        """_summary_
+    def __getitem__(self, index: int) -> NDArray:
+        """要素を構成する節点番号を取得する関数
 
         Args:
             index (int): 要素番号
 
         Returns:
-            List[int]: 要素を構成する節点番号
+            NDArray: 要素を構成する節点番号
         """
-        return self._element_nodes[index]
+        return np.asarray(self._element_nodes[index])
 
 
 class LineMeshHighOrder(DiscretizedRegion1D):
     """一次元有限要素（二次要素）"""
 
+    __slots__ = ("_element_nodes",)
+
     def __init__(self, n_node: int, xmin: float, xmax: float, conditions: List[str] | None = None) -> None:
         """一次元有限要素（二次要素）
 
@@ -70,7 +117,50 @@ class LineMeshHighOrder(DiscretizedRegion1D):
 
         super().__init__(n_node, xmin, xmax, conditions)
         n_element = n_node // 2
-        self._element_nodes = [[2 * i, 2 * (i + 1), 2 * i + 1] for i in range(n_element)]
+        self._element_nodes = np.empty((n_element, 3), dtype=np.intp)
+        self._element_nodes[:, 0] = np.arange(0, n_node - 1, 2)
+        self._element_nodes[:, 1] = self._element_nodes[:, 0] + 2
+        self._element_nodes[:, 2] = self._element_nodes[:, 0] + 1
+        self._element_nodes.setflags(write=False)
+
+    @classmethod
+    def from_vertices(cls, vertices: ArrayLike, conditions: List[str] | None = None) -> "LineMeshHighOrder":
+        """要素の端点の座標から不等間隔のメッシュを生成する関数（内部節点は各要素の中点）
+
+        Args:
+            vertices (ArrayLike): 要素の端点の座標（狭義単調増加）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Returns:
+            LineMeshHighOrder: 一次元有限要素（二次要素）
+        """
+        x = _node_coordinates(vertices, 2)
+        mesh = cls(x.size, x[0], x[-1], conditions)
+        mesh._x = x
+        return mesh
+
+    @classmethod
+    def from_arrays(
+        cls, x: NDArray, element_nodes: NDArray, conditions: List[str] | None = None
+    ) -> "LineMeshHighOrder":
+        """節点座標と要素節点番号の配列から, 配列を複製せずにメッシュを生成する関数
+
+        配列の内容は走査せず形状のみを検査するため, メモリマップした配列でも節点数によらず即座に生成できる.
+
+        Args:
+            x (NDArray): 節点座標（形状は(節点数,)）
+            element_nodes (NDArray): 要素を構成する節点番号の配列（形状は(要素数, 3)）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Raises:
+            ValueError: 配列の形状が二次要素のメッシュと一致しない場合に発生
+
+        Returns:
+            LineMeshHighOrder: 一次元有限要素（二次要素）
+        """
+        mesh = cls.__new__(cls)
+        _set_arrays(mesh, x, element_nodes, 2, conditions)
+        return mesh
 
     @property
     def n_element(self) -> int:
@@ -79,24 +169,212 @@ class LineMeshHighOrder(DiscretizedRegion1D):
         Returns:
             int: 要素数
         """
-        return len(self._element_nodes)
+        return int(self._element_nodes.shape[0])
 
     @property
-    def element_nodes(self) -> List[List[int]]:
-        """要素を構成する節点番号のリスト
+    def element_nodes(self) -> NDArray:
+        """要素を構成する節点番号の配列
 
         Returns:
-            List[List[int]]: 要素を構成する節点番号のリスト
+            NDArray: 要素を構成する節点番号の配列（形状は(要素数, 3)）
         """
         return self._element_nodes
 
-    def __getitem__(self, index: int) -> List[int]:
-        """_summary_
+    def __getitem__(self, index: int) -> NDArray:
+        """要素を構成する節点番号を取得する関数
 
         Args:
             index (int): 要素番号
 
         Returns:
-            List[int]: 要素を構成する節点番号
+            NDArray: 要素を構成する節点番号
         """
-        return self._element_nodes[index]
+        return np.asarray(self._element_nodes[index])
+
+
+class LineMeshLagrange(DiscretizedRegion1D):
+    """一次元有限要素（任意次数のLagrange要素）"""
+
+    __slots__ = ("_element_nodes", "_degree")
+
+    def __init__(
+        self, n_node: int, xmin: float, xmax: float, degree: int, conditions: List[str] | None = None
+    ) -> None:
+        """一次元有限要素（任意次数のLagrange要素）
+
+        要素を構成する節点番号は両端の節点の後に内部節点を昇順に並べたものである.
+        次数1は`LineMesh`, 次数2は`LineMeshHighOrder`と同じ節点番号になる.
+
+        Args:
+            n_node (int): 節点数（degreeの倍数に1を加えた数）
+            xmin (float): 一次元領域の下限
+            xmax (float): 一次元領域の上限
+            degree (int): 多項式の次数（1以上）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+        """
+        if degree < 1:
+            message = "The polynomial degree `degree` must be an integer greater than or equal to 1."
+            raise ValueError(message)
+        if n_node < degree + 1 or (n_node - 1) % degree != 0:
+            message = f"The number of nodes `n_node` must be a multiple of {degree} plus 1 and at least {degree + 1}."
+            raise ValueError(message)
+
+        super().__init__(n_node, xmin, xmax, conditions)
+        n_element = (n_node - 1) // degree
+        self._degree = degree
+        self._element_nodes = np.empty((n_element, degree + 1), dtype=np.intp)
+        self._element_nodes[:, 0] = np.arange(0, n_node - 1, degree)
+        self._element_nodes[:, 1] = self._element_nodes[:, 0] + degree
+        self._element_nodes[:, 2:] = self._element_nodes[:, :1] + np.arange(1, degree)
+        self._element_nodes.setflags(write=False)
+
+    @classmethod
+    def from_vertices(
+        cls, vertices: ArrayLike, degree: int, conditions: List[str] | None = None
+    ) -> "LineMeshLagrange":
+        """要素の端点の座標から不等間隔のメッシュを生成する関数（内部節点は各要素の等分点）
+
+        Args:
+            vertices (ArrayLike): 要素の端点の座標（狭義単調増加）
+            degree (int): 多項式の次数（1以上）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Returns:
+            LineMeshLagrange: 一次元有限要素（任意次数のLagrange要素）
+        """
+        if degree < 1:
+            message = "The polynomial degree `degree` must be an integer greater than or equal to 1."
+            raise ValueError(message)
+        x = _node_coordinates(vertices, degree)
+        mesh = cls(x.size, x[0], x[-1], degree, conditions)
+        mesh._x = x
+        return mesh
+
+    @classmethod
+    def from_arrays(
+        cls, x: NDArray, element_nodes: NDArray, degree: int, conditions: List[str] | None = None
+    ) -> "LineMeshLagrange":
+        """節点座標と要素節点番号の配列から, 配列を複製せずにメッシュを生成する関数
+
+        配列の内容は走査せず形状のみを検査するため, メモリマップした配列でも節点数によらず即座に生成できる.
+
+        Args:
+            x (NDArray): 節点座標（形状は(節点数,)）
+            element_nodes (NDArray): 要素を構成する節点番号の配列（形状は(要素数, 次数 + 1)）
+            degree (int): 多項式の次数（1以上）
+            conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+
+        Raises:
+            ValueError: 次数が1未満の場合または配列の形状が次数と一致しない場合に発生
+
+        Returns:
+            LineMeshLagrange: 一次元有限要素（任意次数のLagrange要素）
+        """
+        if degree < 1:
+            message = "The polynomial degree `degree` must be an integer greater than or equal to 1."
+            raise ValueError(message)
+        mesh = cls.__new__(cls)
+        mesh._degree = degree
+        _set_arrays(mesh, x, element_nodes, degree, conditions)
+        return mesh
+
+    @property
+    def degree(self) -> int:
+        """多項式の次数
+
+        Returns:
+            int: 多項式の次数
+        """
+        return self._degree
+
+    @property
+    def n_element(self) -> int:
+        """要素数
+
+        Returns:
+            int: 要素数
+        """
+        return int(self._element_nodes.shape[0])
+
+    @property
+    def element_nodes(self) -> NDArray:
+        """要素を構成する節点番号の配列
+
+        Returns:
+            NDArray: 要素を構成する節点番号の配列（形状は(要素数, 次数 + 1)）
+        """
+        return self._element_nodes
+
+    def __getitem__(self, index: int) -> NDArray:
+        """要素を構成する節点番号を取得する関数
+
+        Args:
+            index (int): 要素番号
+
+        Returns:
+            NDArray: 要素を構成する節点番号
+        """
+        return np.asarray(self._element_nodes[index])
+
+
+Mesh1D = LineMesh | LineMeshHighOrder | LineMeshLagrange
+"""一次元有限要素メッシュの型"""
+
+
+def _set_arrays(mesh: Mesh1D, x: NDArray, element_nodes: NDArray, degree: int, conditions: List[str] | None) -> None:
+    """初期化していないメッシュに節点座標と要素節点番号の配列を設定する関数
+
+    要素節点番号は書き込み不可のビューとして保持するため, 入力した配列の書き込み可否は変更しない.
+
+    Args:
+        mesh (Mesh1D): `__new__`で生成したメッシュ
+        x (NDArray): 節点座標
+        element_nodes (NDArray): 要素を構成する節点番号の配列
+        degree (int): 多項式の次数
+        conditions (List[str] | None): 一次元領域に課された境界条件
+
+    Raises:
+        ValueError: 配列の形状が次数と一致しない場合に発生
+    """
+    if x.ndim != 1 or x.shape[0] < 2:
+        message = "The node coordinates `x` must be a one-dimensional array with at least 2 entries."
+        raise ValueError(message)
+    n_element = (x.shape[0] - 1) // degree
+    if n_element * degree != x.shape[0] - 1 or element_nodes.shape != (n_element, degree + 1):
+        message = f"The shape of `element_nodes` must be {(n_element, degree + 1)} for {x.shape[0]} nodes."
+        raise ValueError(message)
+    mesh._x = x
+    mesh._boundary_nodes = [0, int(x.shape[0]) - 1]
+    mesh._conditions = mesh._set_boundary_conditions(conditions)
+    mesh._unit_normals = np.array([-1.0, 1.0], dtype=float)
+    mesh._element_nodes = element_nodes.view()
+    mesh._element_nodes.setflags(write=False)
+
+
+def _node_coordinates(vertices: ArrayLike, degree: int) -> NDArray:
+    """要素の端点の座標から節点座標を生成する関数
+
+    節点は座標の昇順に並び, `degree * e`番目の節点がe番目の要素の左端点となる.
+
+    Args:
+        vertices (ArrayLike): 要素の端点の座標
+        degree (int): 多項式の次数
+
+    Raises:
+        ValueError: 端点の座標が2個未満の一次元配列でない場合または狭義単調増加でない場合に発生
+
+    Returns:
+        NDArray: 節点座標
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    if vertices.ndim != 1 or vertices.size < 2:
+        message = "The coordinates `vertices` must be a one dimensional array with at least 2 entries."
+        raise ValueError(message)
+    h = np.diff(vertices)
+    if not np.all(h > 0.0):
+        message = "The coordinates `vertices` must be strictly increasing."
+        raise ValueError(message)
+    x = np.empty((vertices.size - 1) * degree + 1, dtype=float)
+    x[:-1] = (vertices[:-1, np.newaxis] + h[:, np.newaxis] * (np.arange(degree) / degree)).ravel()
+    x[-1] = vertices[-1]
+    return x
@@ -1,3 +1,23 @@
+from .adaptive import AdaptiveRefinement
+from .decomposition import decomposition_solve
 from .fem1d import Fem1d
+from .multigrid import GeometricMultigrid
+from .nonlinear import NewtonSolver
+from .operator_cache import OperatorCache
+from .out_of_core import out_of_core_solve
+from .spectral import spectral_solve
+from .sweep import helmholtz_sweep
+from .transient import ThetaMethod
 
-__all__ = ["Fem1d"]
+__all__ = [
+    "AdaptiveRefinement",
+    "Fem1d",
+    "GeometricMultigrid",
+    "NewtonSolver",
+    "OperatorCache",
+    "ThetaMethod",
+    "decomposition_solve",
+    "helmholtz_sweep",
+    "out_of_core_solve",
+    "spectral_solve",
+]
@@ -0,0 +1,348 @@
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import coo_matrix, csr_matrix
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
+
+from .fem1d import Fem1d, _element_degree, _element_lengths, _reference_matrices
+from .reference_element import lagrange_basis, lagrange_nodes
+
+
+class AdaptiveRefinement:
+    """誤差推定と要素の二分割を繰り返す適応的h細分化"""
+
+    def __init__(
+        self,
+        mesh: Mesh1D,
+        source: Callable[[NDArray], NDArray],
+        boundary_values: Sequence[float],
+        alpha: float = 1.0,
+        beta: float = 0.0,
+        theta: float = 0.5,
+        tol: float = 1e-3,
+        max_iter: int = 30,
+        max_nodes: int = 1_000_000,
+        estimator: str = "residual",
+    ) -> None:
+        """誤差推定と要素の二分割を繰り返す適応的h細分化
+
+        `-alpha u'' + beta u = source`を解き, 要素ごとの誤差を残差型または勾配回復型の誤差推定量で見積もり,
+        Dörflerの基準で選んだ要素を二分割する手順を, 推定誤差が`tol`以下になるまで繰り返す.
+        推定誤差はエネルギーノルム`sqrt(alpha ||u'||^2 + |beta| ||u||^2)`で測り, 解のエネルギーノルムで割った相対値とする.
+        細分化後の行列は変化した要素のみを組み立て直し, それ以外の成分は細分化前の行列から節点番号を付け替えて再利用する.
+
+        Args:
+            mesh (Mesh1D): 初期メッシュ
+            source (Callable[[NDArray], NDArray]): 外力項（節点座標を引数に取る）
+            boundary_values (Sequence[float]): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値）
+            alpha (float, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+            beta (float, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
+            theta (float, optional): 細分化する要素の推定誤差の二乗和が全体に占める割合（0より大きく1以下）. Defaults to 0.5.
+            tol (float, optional): 推定誤差に対する収束判定値（解のエネルギーノルムに対する相対値）. Defaults to 1e-3.
+            max_iter (int, optional): 細分化の最大回数. Defaults to 30.
+            max_nodes (int, optional): 節点数の上限. Defaults to 1_000_000.
+            estimator (str, optional): 誤差推定量（"residual"または"recovery"）. Defaults to "residual".
+
+        Raises:
+            ValueError: 境界値データの個数が境界節点数と一致しない場合に発生
+            ValueError: 割合thetaが0より大きく1以下でない場合に発生
+            ValueError: 未知の誤差推定量を指定した場合に発生
+        """
+        if len(boundary_values) != len(mesh.boundary_nodes):
+            message = f"The number of boundary values must be {len(mesh.boundary_nodes)}."
+            raise ValueError(message)
+        if not 0.0 < theta <= 1.0:
+            message = "The fraction `theta` must satisfy 0 < theta <= 1."
+            raise ValueError(message)
+        if estimator not in ("residual", "recovery"):
+            message = f"Unknown error estimator: {estimator}. Use 'residual' or 'recovery'."
+            raise ValueError(message)
+        self.fem = Fem1d(mesh)
+        self.source = source
+        self.boundary_values = [float(value) for value in boundary_values]
+        self.alpha = alpha
+        self.beta = beta
+        self.theta = theta
+        self.tol = tol
+        self.max_iter = max_iter
+        self.max_nodes = max_nodes
+        self.estimator = estimator
+        self.estimates: List[float] = list()
+        self.n_nodes: List[int] = list()
+
+    @property
+    def mesh(self) -> Mesh1D:
+        """現在のメッシュ"""
+        return self.fem.mesh
+
+    def solve(self) -> NDArray:
+        """細分化と求解を繰り返す関数
+
+        Raises:
+            RuntimeError: 最大細分化回数または節点数の上限以内に収束しなかった場合に発生
+
+        Returns:
+            NDArray: 最後のメッシュ（`self.mesh`）上の解ベクトル
+        """
+        self.estimates = list()
+        self.n_nodes = list()
+        for iteration in range(self.max_iter + 1):
+            mesh = self.fem.mesh
+            values = np.zeros(mesh.n_node)
+            values[mesh.boundary_nodes] = self.boundary_values
+            source = np.asarray(self.source(mesh.x), dtype=float)
+            u = self.fem.solve(self.fem.term(source), values, self.alpha, self.beta)
+            if self.estimator == "residual":
+                indicators = residual_estimate(mesh, u, source, self.alpha, self.beta)
+            else:
+                indicators = np.sqrt(self.alpha) * recovery_estimate(mesh, u)
+            energy = self.alpha * u.dot(self.fem.laplacian_view.dot(u))
+            energy += abs(self.beta) * u.dot(self.fem.term_view.dot(u))
+            scale = float(np.sqrt(max(energy, 0.0)))
+            self.estimates.append(float(np.sqrt(np.sum(indicators**2))) / max(scale, np.finfo(float).tiny))
+            self.n_nodes.append(mesh.n_node)
+            if self.estimates[-1] <= self.tol:
+                return u
+            if iteration == self.max_iter or mesh.n_node >= self.max_nodes:
+                break
+            self.fem = refine(self.fem, mark_elements(indicators, self.theta))
+
+        message = f"Adaptive refinement did not reach the tolerance within {len(self.estimates) - 1} refinements."
+        raise RuntimeError(message)
+
+
+def recovery_estimate(mesh: Mesh1D, u: NDArray) -> NDArray:
+    """勾配回復型（Zienkiewicz-Zhu型）の要素ごとの誤差推定量
+
+    各頂点で隣接要素の片側微分値を要素長で重み付けして平均した回復勾配`G`を, 要素内で線形補間し,
+    要素ごとに`||G - u_h'||_{L2}`をGauss求積で全要素一括に計算する.
+    境界の頂点では片側微分値のみでは端の要素の誤差が0と見積もられるため, 隣の頂点の回復勾配から線形に外挿する.
+    解が解像されていない（境界層を要素が覆っていないなど）場合は誤差を過小評価しやすい.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        u (NDArray): 解ベクトル
+
+    Returns:
+        NDArray: 要素ごとの誤差推定量
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    h = _element_lengths(mesh)
+    n_element = element_nodes.shape[0]
+    one_sided = _element_gradients(mesh, u, np.array([0.0, 1.0]))
+    weighted = one_sided * h[:, np.newaxis]
+    recovered = np.zeros(n_element + 1)
+    weights = np.zeros(n_element + 1)
+    recovered[:-1] += weighted[:, 0]
+    recovered[1:] += weighted[:, 1]
+    weights[:-1] += h
+    weights[1:] += h
+    recovered /= weights
+    if n_element > 1:
+        recovered[0] = 2.0 * one_sided[0, 0] - recovered[1]
+        recovered[-1] = 2.0 * one_sided[-1, 1] - recovered[-2]
+
+    points, quadrature_weights = np.polynomial.legendre.leggauss(_element_degree(mesh) + 1)
+    xi = 0.5 * (points + 1.0)
+    gradients = _element_gradients(mesh, u, xi)
+    interpolated = recovered[:-1, np.newaxis] * (1.0 - xi) + recovered[1:, np.newaxis] * xi
+    squared = 0.5 * h * ((interpolated - gradients) ** 2 @ quadrature_weights)
+    return np.asarray(np.sqrt(squared))
+
+
+def residual_estimate(mesh: Mesh1D, u: NDArray, source: NDArray, alpha: float = 1.0, beta: float = 0.0) -> NDArray:
+    """残差型の要素ごとの誤差推定量
+
+    要素内部の残差`R = f - beta u_h + alpha u_h''`と頂点での流束の跳び`J = alpha [u_h']`から,
+    `η_e^2 = h_e^2 ||R||_{L2(e)}^2 / alpha + h_e Σ J^2 / (2 alpha)`（和は要素の内部側の頂点について取る）を
+    Gauss求積で全要素一括に計算する. 外力項は節点値を要素の基底関数で補間して用いる.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        u (NDArray): 解ベクトル
+        source (NDArray): 外力項の節点値
+        alpha (float, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+        beta (float, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
+
+    Returns:
+        NDArray: 要素ごとの誤差推定量
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    h = _element_lengths(mesh)
+    degree = _element_degree(mesh)
+    points, quadrature_weights = np.polynomial.legendre.leggauss(degree + 1)
+    xi = 0.5 * (points + 1.0)
+    basis, _ = lagrange_basis(degree, xi)
+    u_local = np.asarray(u)[element_nodes]
+    residual = np.asarray(source)[element_nodes] @ basis.T - beta * (u_local @ basis.T)
+    if degree > 1:
+        residual += alpha * (u_local @ _second_derivatives(degree, xi).T) / h[:, np.newaxis] ** 2
+    squared = h**2 / alpha * (0.5 * h * (residual**2 @ quadrature_weights))
+
+    one_sided = _element_gradients(mesh, u, np.array([0.0, 1.0]))
+    jumps = alpha * (one_sided[1:, 0] - one_sided[:-1, 1])
+    squared[:-1] += 0.5 * h[:-1] * jumps**2 / alpha
+    squared[1:] += 0.5 * h[1:] * jumps**2 / alpha
+    return np.asarray(np.sqrt(squared))
+
+
+def mark_elements(indicators: NDArray, theta: float = 0.5) -> NDArray:
+    """Dörflerの基準で細分化する要素を選ぶ関数
+
+    推定誤差の二乗和が全体の`theta`倍以上となる, 推定誤差の大きい順に並べた最小個数の要素を選ぶ.
+
+    Args:
+        indicators (NDArray): 要素ごとの誤差推定量
+        theta (float, optional): 選ぶ要素の推定誤差の二乗和が全体に占める割合. Defaults to 0.5.
+
+    Returns:
+        NDArray: 細分化する要素を表す真偽値の配列
+    """
+    squared = np.asarray(indicators, dtype=float) ** 2
+    order = np.argsort(squared)[::-1]
+    cumulative = np.cumsum(squared[order])
+    n_marked = int(np.searchsorted(cumulative, theta * cumulative[-1], side="left")) + 1
+    marked = np.zeros(squared.size, dtype=bool)
+    marked[order[: min(n_marked, squared.size)]] = True
+    return marked
+
+
+def refine_mesh(mesh: Mesh1D, marked: NDArray) -> Tuple[Mesh1D, NDArray, NDArray]:
+    """選んだ要素を二分割したメッシュを作る関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        marked (NDArray): 細分化する要素を表す真偽値の配列
+
+    Raises:
+        ValueError: 真偽値の配列の形状が要素数と一致しない場合に発生
+
+    Returns:
+        Tuple[Mesh1D, NDArray, NDArray]: 細分化後のメッシュ, 細分化前の節点番号から細分化後の節点番号への対応
+        （二分割した要素の内部節点は-1）, 二分割で生じた要素の番号
+    """
+    marked = np.asarray(marked, dtype=bool)
+    element_nodes = np.asarray(mesh.element_nodes)
+    n_element = element_nodes.shape[0]
+    if marked.shape != (n_element,):
+        message = f"The shape of the array `marked` must be {(n_element,)}."
+        raise ValueError(message)
+    degree = _element_degree(mesh)
+    vertices = mesh.x[np.append(element_nodes[:, 0], element_nodes[-1, 1])]
+    position = np.arange(n_element + 1) + np.concatenate(([0], np.cumsum(marked)))
+    refined_vertices = np.empty(position[-1] + 1)
+    refined_vertices[position] = vertices
+    parents = np.flatnonzero(marked)
+    refined_vertices[position[parents] + 1] = 0.5 * (vertices[parents] + vertices[parents + 1])
+
+    refined: Mesh1D
+    if isinstance(mesh, LineMesh):
+        refined = LineMesh.from_vertices(refined_vertices, mesh.conditions)
+    elif isinstance(mesh, LineMeshHighOrder):
+        refined = LineMeshHighOrder.from_vertices(refined_vertices, mesh.conditions)
+    elif isinstance(mesh, LineMeshLagrange):
+        refined = LineMeshLagrange.from_vertices(refined_vertices, mesh.degree, mesh.conditions)
+    else:
+        raise ValueError
+
+    node_map = np.full(mesh.n_node, -1, dtype=np.intp)
+    node_map[element_nodes[:, 0]] = degree * position[:-1]
+    node_map[element_nodes[-1, 1]] = degree * position[-1]
+    kept = np.flatnonzero(~marked)
+    new_elements = np.asarray(refined.element_nodes)
+    node_map[element_nodes[kept, 2:]] = new_elements[position[kept], 2:]
+    children = np.sort(np.concatenate((position[parents], position[parents] + 1)))
+    return refined, node_map, children
+
+
+def refine(fem: Fem1d, marked: NDArray) -> Fem1d:
+    """選んだ要素を二分割し, 変化した要素のみを組み立て直した有限要素法を作る関数
+
+    二分割で生じた要素の節点に対応する行のみを, それらの節点を含む要素から組み立て直す.
+    一次元では節点に対応する行の成分はその節点を含む要素のみから定まるため, それ以外の行は細分化前の行列の行を
+    列番号を付け替えてそのまま写す. 二つの行列は共通の非零構造を持つため, 非零構造は一度だけ作って共有する.
+    行列フリーモードの場合は行列を保持しないため, 細分化後のメッシュで同じモードの有限要素法を作る.
+
+    Args:
+        fem (Fem1d): 細分化前の一次元有限要素法
+        marked (NDArray): 細分化する要素を表す真偽値の配列
+
+    Returns:
+        Fem1d: 細分化後のメッシュの一次元有限要素法
+    """
+    mesh, node_map, children = refine_mesh(fem.mesh, marked)
+    if fem.matrix_free:
+        return Fem1d(mesh, matrix_free=True, stats=fem.stats)
+    element_nodes = np.asarray(mesh.element_nodes)
+    affected = np.zeros(mesh.n_node, dtype=bool)
+    affected[element_nodes[children]] = True
+    neighbours = np.concatenate((children - 1, children, children + 1))
+    elements = np.unique(neighbours[(neighbours >= 0) & (neighbours < element_nodes.shape[0])])
+    n_local = element_nodes.shape[1]
+    rows = np.repeat(element_nodes[elements], n_local, axis=1).ravel()
+    cols = np.tile(element_nodes[elements], (1, n_local)).ravel()
+    changed = affected[rows]
+    rows, cols = rows[changed], cols[changed]
+
+    laplacian_reference, term_reference = _reference_matrices(mesh)
+    h = (mesh.x[element_nodes[elements, 1]] - mesh.x[element_nodes[elements, 0]])[:, np.newaxis, np.newaxis]
+    shape = (mesh.n_node, mesh.n_node)
+    laplacian = coo_matrix(((laplacian_reference / h).ravel()[changed], (rows, cols)), shape=shape).tocsr()
+    term = coo_matrix(((term_reference * h).ravel()[changed], (rows, cols)), shape=shape).tocsr()
+
+    old_laplacian = fem.laplacian_view
+    old_term = fem.term_view
+    # 細分化前の二つの行列も共通の非零構造を持つ（行列の組み立てと`refine`はいずれも共通の非零構造を作る）
+    kept_rows = node_map >= 0
+    kept_rows[kept_rows] = ~affected[node_map[kept_rows]]
+    kept_entries = np.repeat(kept_rows, np.diff(old_laplacian.indptr))
+    lengths = np.diff(laplacian.indptr)
+    lengths[node_map[kept_rows]] = np.diff(old_laplacian.indptr)[kept_rows]
+    indptr = np.concatenate(([0], np.cumsum(lengths))).astype(old_laplacian.indptr.dtype)
+    nnz = int(indptr[-1])
+    copied = np.repeat(~affected, lengths)
+
+    indices = np.empty(nnz, dtype=old_laplacian.indices.dtype)
+    indices[copied] = node_map[old_laplacian.indices[kept_entries]]
+    indices[~copied] = laplacian.indices
+    matrices = list()
+    for old, new in ((old_laplacian, laplacian), (old_term, term)):
+        data = np.empty(nnz)
+        data[copied] = old.data[kept_entries]
+        data[~copied] = new.data
+        matrices.append(csr_matrix((data, indices, indptr), shape=shape))
+    return Fem1d(mesh, stats=fem.stats, matrices=(matrices[0], matrices[1]))
+
+
+def _element_gradients(mesh: Mesh1D, u: NDArray, xi: NDArray) -> NDArray:
+    """参照要素上の評価点における有限要素解の微分値を全要素一括で計算する関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        u (NDArray): 解ベクトル
+        xi (NDArray): 参照要素[0, 1]上の評価点の座標
+
+    Returns:
+        NDArray: 微分値（形状は(要素数, 評価点数)）
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    _, derivatives = lagrange_basis(_element_degree(mesh), xi)
+    return np.asarray((np.asarray(u)[element_nodes] @ derivatives.T) / _element_lengths(mesh)[:, np.newaxis])
+
+
+def _second_derivatives(degree: int, xi: NDArray) -> NDArray:
+    """参照要素[0, 1]上のLagrange基底関数の二階導関数の値
+
+    Args:
+        degree (int): 多項式の次数
+        xi (NDArray): 評価点の座標
+
+    Returns:
+        NDArray: 二階導関数の値（形状は(評価点数, 節点数)）
+    """
+    nodes = lagrange_nodes(degree)
+    coefficients = np.linalg.inv(np.vander(nodes, increasing=True))
+    derivatives = np.polynomial.polynomial.polyder(coefficients, 2, axis=0)
+    return np.polynomial.polynomial.polyval(np.asarray(xi, dtype=float), derivatives).T
@@ -0,0 +1,128 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.linalg import LinAlgError, solve_banded
+from scipy.linalg.lapack import dgbtrf, dgbtrs
+from scipy.sparse import coo_matrix, csc_matrix, spmatrix
+from scipy.sparse.linalg import SuperLU, splu
+
+
+def matrix_bandwidth(matrix: spmatrix) -> Tuple[int, int]:
+    """疎行列の下側・上側帯幅を計算する関数
+
+    Args:
+        matrix (spmatrix): 疎行列
+
+    Returns:
+        Tuple[int, int]: 下側帯幅と上側帯幅
+    """
+    coo = coo_matrix(matrix)
+    if coo.nnz == 0:
+        return 0, 0
+    offset = coo.row.astype(np.int64) - coo.col.astype(np.int64)
+    return int(max(offset.max(), 0)), int(max(-offset.min(), 0))
+
+
+def to_banded(matrix: spmatrix, lower: int, upper: int) -> NDArray:
+    """疎行列をLAPACKの帯行列格納形式に変換する関数
+
+    格納形式は`ab[upper + i - j, j] = matrix[i, j]`であり, `scipy.linalg.solve_banded`に渡すことができる.
+
+    Args:
+        matrix (spmatrix): 疎行列
+        lower (int): 下側帯幅
+        upper (int): 上側帯幅
+
+    Raises:
+        ValueError: 帯幅の外側に非零成分が存在する場合に発生
+
+    Returns:
+        NDArray: 帯行列格納形式の配列（形状は(lower + upper + 1, 列数)）
+    """
+    coo = coo_matrix(matrix)
+    offset = upper + coo.row.astype(np.int64) - coo.col.astype(np.int64)
+    if np.any(offset < 0) or np.any(offset > lower + upper):
+        message = f"The matrix has nonzero entries outside of the band (lower={lower}, upper={upper})."
+        raise ValueError(message)
+    ab = np.zeros((lower + upper + 1, coo.shape[1]), dtype=np.result_type(coo.dtype, float))
+    np.add.at(ab, (offset, coo.col), coo.data)
+    return ab
+
+
+def solve_banded_or_sparse(matrix: spmatrix, rhs: NDArray, max_bandwidth: int) -> NDArray:
+    """帯行列ソルバーで連立一次方程式を解く関数
+
+    係数行列の帯幅が`max_bandwidth`以下であればLAPACKの帯行列ソルバー（O(n)）を用い,
+    そうでなければ疎行列LU分解に切り替える.
+
+    Args:
+        matrix (spmatrix): 係数行列
+        rhs (NDArray): 右辺ベクトル（形状は(行数,)または(行数, ベクトル数)）
+        max_bandwidth (int): 帯行列ソルバーを用いる帯幅の上限
+
+    Returns:
+        NDArray: 解ベクトル
+    """
+    lower, upper = matrix_bandwidth(matrix)
+    if max(lower, upper) <= max_bandwidth:
+        ab = to_banded(matrix, lower, upper)
+        return np.asarray(solve_banded((lower, upper), ab, rhs, overwrite_ab=True, check_finite=False))
+    return np.asarray(splu(csc_matrix(matrix)).solve(np.asarray(rhs, dtype=float)))
+
+
+class BandedLU:
+    """帯行列のLU分解（LAPACKの`gbtrf`/`gbtrs`）"""
+
+    def __init__(self, matrix: spmatrix, lower: int, upper: int) -> None:
+        """帯行列のLU分解
+
+        Args:
+            matrix (spmatrix): 係数行列
+            lower (int): 下側帯幅
+            upper (int): 上側帯幅
+
+        Raises:
+            LinAlgError: 係数行列が特異な場合に発生
+        """
+        ab = to_banded(matrix, lower, upper)
+        work = np.zeros((2 * lower + upper + 1, ab.shape[1]), dtype=float)
+        work[lower:, :] = ab
+        self._lower = lower
+        self._upper = upper
+        self._lu, self._piv, info = dgbtrf(work, lower, upper, overwrite_ab=True)
+        if info > 0:
+            message = f"The coefficient matrix is singular (U[{info - 1}, {info - 1}] is zero)."
+            raise LinAlgError(message)
+
+    def solve(self, rhs: NDArray) -> NDArray:
+        """分解済みの係数行列で前進・後退代入を行う関数
+
+        Args:
+            rhs (NDArray): 右辺ベクトル（形状は(行数,)または(行数, ベクトル数)）
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        b = np.asarray(rhs, dtype=float)
+        x, _ = dgbtrs(self._lu, self._lower, self._upper, b.reshape(b.shape[0], -1), self._piv)
+        return np.asarray(x).reshape(b.shape)
+
+
+def factorize(matrix: spmatrix, max_bandwidth: int) -> BandedLU | SuperLU:
+    """係数行列を分解する関数
+
+    係数行列の帯幅が`max_bandwidth`以下であれば帯行列のLU分解を用い,
+    そうでなければ疎行列LU分解に切り替える.
+
+    Args:
+        matrix (spmatrix): 係数行列
+        max_bandwidth (int): 帯行列のLU分解を用いる帯幅の上限
+
+    Returns:
+        BandedLU | SuperLU: `solve`メソッドを持つ分解オブジェクト
+    """
+    lower, upper = matrix_bandwidth(matrix)
+    if max(lower, upper) <= max_bandwidth:
+        return BandedLU(matrix, lower, upper)
+    return splu(csc_matrix(matrix))
@@ -0,0 +1,105 @@
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import SuperLU
+
+from module.discretization import BoundaryCondition, Mesh1D
+
+from .banded import BandedLU, factorize
+
+
+class StaticCondensation:
+    """要素内部節点の静的縮約による求解"""
+
+    def __init__(self, mesh: Mesh1D, element_matrices: NDArray) -> None:
+        """要素内部節点の静的縮約による求解
+
+        要素内部節点（要素節点番号の3番目以降）は自身の要素内の節点とのみ結合するため, 全要素の要素行列を一括で
+        `S_e = A_vv - A_vi A_ii^{-1} A_iv`に縮約し, 頂点節点のみの三重対角行列を組み立てて分解する.
+        内部節点の値は頂点節点の値から要素ごとに復元する. 二次要素では全体の連立一次方程式の大きさが約半分になる.
+        境界条件は生成時の`mesh.conditions`に従って課される.
+
+        Args:
+            mesh (Mesh1D): 要素内部節点を持つメッシュデータ（`LineMeshHighOrder`, `LineMeshLagrange`）
+            element_matrices (NDArray): 要素行列の配列（形状は(要素数, 要素節点数, 要素節点数)）
+
+        Raises:
+            ValueError: 要素内部節点を持たないメッシュを入力した場合に発生
+        """
+        element_nodes = np.asarray(mesh.element_nodes)
+        if element_nodes.shape[1] < 3:
+            message = "Static condensation requires elements with interior nodes."
+            raise ValueError(message)
+        self.mesh = mesh
+        self._vertex_nodes = element_nodes[:, :2]
+        self._interior_nodes = element_nodes[:, 2:]
+        is_vertex = np.zeros(mesh.n_node, dtype=bool)
+        is_vertex[self._vertex_nodes] = True
+        vertices = np.flatnonzero(is_vertex)
+        self._vertices = vertices
+        vertex_index = np.full(mesh.n_node, -1, dtype=np.intp)
+        vertex_index[vertices] = np.arange(vertices.size)
+        self._vertex_index = vertex_index
+        self._element_vertices = vertex_index[self._vertex_nodes]
+
+        a_vv = element_matrices[:, :2, :2]
+        a_vi = element_matrices[:, :2, 2:]
+        a_iv = element_matrices[:, 2:, :2]
+        self._inverse = np.linalg.inv(element_matrices[:, 2:, 2:])
+        self._transfer = self._inverse @ a_iv
+        self._coupling = a_vi @ self._inverse
+        schur = a_vv - a_vi @ self._transfer
+
+        rows = np.repeat(self._element_vertices, 2, axis=1).ravel()
+        cols = np.tile(self._element_vertices, (1, 2)).ravel()
+        n_vertex = vertices.size
+        matrix = coo_matrix((schur.ravel(), (rows, cols)), shape=(n_vertex, n_vertex)).tocsr()
+
+        local_index = BoundaryCondition.to_indices(BoundaryCondition.DIRICHLET, mesh.conditions)
+        self._dirichlet = [mesh.boundary_nodes[i] for i in local_index]
+        self._dirichlet_vertices = vertex_index[self._dirichlet]
+        self._lift = matrix.tocsc()[:, self._dirichlet_vertices]
+        fixed = np.zeros(n_vertex, dtype=bool)
+        fixed[self._dirichlet_vertices] = True
+        matrix.data[fixed[matrix.indices]] = 0.0
+        for c in self._dirichlet_vertices:
+            row = slice(matrix.indptr[c], matrix.indptr[c + 1])
+            matrix.data[row] = np.where(matrix.indices[row] == c, 1.0, 0.0)
+        self._factorization: BandedLU | SuperLU = factorize(matrix, 1)
+
+    @property
+    def n_vertex(self) -> int:
+        """縮約後の連立一次方程式の大きさ（頂点節点数）"""
+        return int(self._vertices.size)
+
+    def solve(self, rhs: NDArray, values: NDArray) -> NDArray:
+        """縮約した連立一次方程式を解き, 内部節点の値を復元する関数
+
+        Args:
+            rhs (NDArray): 境界条件を課す前の右辺ベクトル（形状は(節点数,)または(節点数, ベクトル数)）
+            values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値, rhsと同じ形状）
+
+        Returns:
+            NDArray: 全節点の解ベクトル
+        """
+        rhs = np.asarray(rhs, dtype=float)
+        interior_rhs = rhs[self._interior_nodes]
+        condensed = np.array(rhs[self._vertices])
+        contribution = np.einsum("eam,em...->ea...", self._coupling, interior_rhs)
+        for a in range(2):
+            condensed[self._element_vertices[:, a]] -= contribution[:, a]
+
+        local_index = BoundaryCondition.to_indices(BoundaryCondition.NEUMANN, self.mesh.conditions)
+        for m in local_index:
+            i = self.mesh.boundary_nodes[m]
+            condensed[self._vertex_index[i]] += self.mesh.unit_normals[m] * values[i]
+        condensed -= self._lift.dot(values[self._dirichlet])
+        condensed[self._dirichlet_vertices] = values[self._dirichlet]
+        vertex_solution = np.asarray(self._factorization.solve(condensed))
+
+        solution = np.empty(rhs.shape, dtype=float)
+        solution[self._vertices] = vertex_solution
+        solution[self._interior_nodes] = np.einsum("emn,en...->em...", self._inverse, interior_rhs) - np.einsum(
+            "ema,ea...->em...", self._transfer, vertex_solution[self._element_vertices]
+        )
+        return solution
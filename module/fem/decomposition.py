@@ -0,0 +1,311 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix
+
+from module.discretization import BoundaryCondition, LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
+
+from .banded import factorize
+from .fem1d import Fem1d, _element_degree
+
+_WORKER_STATE: Dict[str, Any] = dict()
+"""ワーカープロセスで共有するメッシュデータと共有メモリ"""
+
+_SHARED_ARRAYS = ("x", "rhs", "solution", "left", "right")
+"""共有メモリに置く配列（節点数の長さを持つ）"""
+
+
+def decomposition_solve(
+    mesh: Mesh1D,
+    rhs: NDArray,
+    values: NDArray,
+    alpha: float = 1.0,
+    beta: float = 0.0,
+    n_subdomain: int | None = None,
+    n_workers: int | None = None,
+) -> NDArray:
+    """領域分割により係数行列`alpha * K + beta * M`の境界値問題を並列に解く関数
+
+    要素を連続した部分領域に分割し, 隣り合う部分領域が共有する頂点節点をインターフェース節点とする.
+    各ワーカープロセスは共有メモリ上の節点座標から自身の部分領域の行列を組み立てて内部節点の帯行列をLU分解し,
+    右辺ベクトルと左右のインターフェース節点との結合に対する解を共有メモリへ書き込む.
+    一次元ではインターフェース節点に関するSchur補元は三重対角行列となるため, 主プロセスで直接解き,
+    最後に各ワーカープロセスが内部節点の解をインターフェース節点の値で補正する.
+    解は逐次の求解（`Fem1d.solve`）と丸め誤差の範囲で一致する.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ（`LineMesh`, `LineMeshHighOrder`, `LineMeshLagrange`）
+        rhs (NDArray): 境界条件を課す前の右辺ベクトル
+        values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値）
+        alpha (float, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+        beta (float, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
+        n_subdomain (int | None, optional): 部分領域数（Noneの場合はワーカープロセス数）. Defaults to None.
+        n_workers (int | None, optional): ワーカープロセス数（Noneの場合はCPU数）. Defaults to None.
+
+    Raises:
+        ValueError: 部分領域数n_subdomainが1未満の場合に発生
+
+    Returns:
+        NDArray: 解ベクトル
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_subdomain is None:
+        n_subdomain = n_workers
+    if n_subdomain < 1:
+        message = "The number of subdomains `n_subdomain` must be an integer greater than or equal to 1."
+        raise ValueError(message)
+    n_element = mesh.n_element
+    n_subdomain = max(1, min(n_subdomain, n_element // 2))
+    n_workers = max(1, min(n_workers, n_subdomain))
+    bounds = np.linspace(0, n_element, n_subdomain + 1).astype(int)
+    subdomains: List[Tuple[int, int, int]] = [
+        (n, int(start), int(stop)) for n, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
+
+    values = np.asarray(values, dtype=float)
+    boundaries = list()
+    for m, condition in enumerate(BoundaryCondition.from_strings(mesh.conditions)):
+        node = mesh.boundary_nodes[m]
+        boundaries.append((condition == BoundaryCondition.DIRICHLET, float(mesh.unit_normals[m]), float(values[node])))
+    degree = _element_degree(mesh)
+    memories: Dict[str, SharedMemory] = dict()
+    try:
+        for name in _SHARED_ARRAYS:
+            memories[name] = SharedMemory(create=True, size=max(mesh.n_node, 1) * np.dtype(float).itemsize)
+        state = {
+            "names": {name: memory.name for name, memory in memories.items()},
+            "n_node": mesh.n_node,
+            "n_element": n_element,
+            "mesh_type": type(mesh),
+            "degree": degree,
+            "boundaries": boundaries,
+            "alpha": float(alpha),
+            "beta": float(beta),
+        }
+        shared = {name: _shared_array(memory, mesh.n_node) for name, memory in memories.items()}
+        shared["x"][:] = mesh.x
+        shared["rhs"][:] = rhs
+
+        if n_workers == 1:
+            _initialize_worker(state)
+            try:
+                schur = [_factorize_subdomain(*subdomain) for subdomain in subdomains]
+                interface = _solve_interface(schur, shared["rhs"][degree * bounds[1:-1]])
+                tasks = _update_tasks(subdomains, interface)
+                for task in tasks:
+                    _update_subdomain(*task)
+            finally:
+                _release_worker()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_initialize_worker, initargs=(state,)
+            ) as executor:
+                schur = list(executor.map(_factorize_subdomain, *zip(*subdomains)))
+                interface = _solve_interface(schur, shared["rhs"][degree * bounds[1:-1]])
+                tasks = _update_tasks(subdomains, interface)
+                list(executor.map(_update_subdomain, *zip(*tasks)))
+
+        solution = np.array(shared["solution"])
+        solution[degree * bounds[1:-1]] = interface
+        del shared
+        return solution
+    finally:
+        for memory in memories.values():
+            memory.close()
+            memory.unlink()
+
+
+def _shared_array(memory: SharedMemory, n_node: int) -> NDArray:
+    """共有メモリ上の配列を取得する関数
+
+    Args:
+        memory (SharedMemory): 共有メモリ
+        n_node (int): 節点数
+
+    Returns:
+        NDArray: 共有メモリを参照する配列
+    """
+    return np.ndarray((n_node,), dtype=float, buffer=memory.buf)
+
+
+def _initialize_worker(state: Dict[str, Any]) -> None:
+    """ワーカープロセスに共有メモリとメッシュデータを登録する関数
+
+    Args:
+        state (Dict[str, Any]): 共有メモリの名前とメッシュデータ
+    """
+    _release_worker()
+    _WORKER_STATE.update(state)
+    memories = {name: SharedMemory(name=memory_name) for name, memory_name in state["names"].items()}
+    _WORKER_STATE["memories"] = memories
+    _WORKER_STATE["arrays"] = {name: _shared_array(memory, state["n_node"]) for name, memory in memories.items()}
+
+
+def _release_worker() -> None:
+    """ワーカープロセスの共有メモリへの参照を解放する関数"""
+    _WORKER_STATE.pop("arrays", None)
+    for memory in _WORKER_STATE.pop("memories", dict()).values():
+        memory.close()
+    _WORKER_STATE.clear()
+
+
+def _factorize_subdomain(n: int, start: int, stop: int) -> Tuple[List[int], NDArray, NDArray]:
+    """部分領域の行列を組み立てて分解し, インターフェース節点に関するSchur補元への寄与を求める関数
+
+    右辺ベクトルに対する内部節点の解を`solution`に, 左右のインターフェース節点との結合に対する解を
+    `left`と`right`に書き込む. Dirichlet境界の節点には境界値を書き込む.
+
+    部分領域nの左右のインターフェース節点の番号はそれぞれn-1とnである.
+
+    Args:
+        n (int): 部分領域の番号
+        start (int): 部分領域の最初の要素番号
+        stop (int): 部分領域の最後の要素番号の次
+
+    Returns:
+        Tuple[List[int], NDArray, NDArray]: インターフェース節点の番号（左右の順, 存在しない側は含まない）,
+        Schur補元への寄与（二次元配列）, 右辺ベクトルへの寄与
+    """
+    state = _WORKER_STATE
+    arrays = state["arrays"]
+    degree = state["degree"]
+    first, last = degree * start, degree * stop
+    mesh = _local_mesh(state["mesh_type"], arrays["x"][first : last + 1 : degree], degree)
+    matrix = Fem1d(mesh).operator(state["alpha"], state["beta"])
+    f = np.array(arrays["rhs"][first : last + 1])
+    n_local = f.size
+
+    outer = [0, n_local - 1]
+    on_boundary = [start == 0, stop == state["n_element"]]
+    interfaces: List[int] = list()
+    dirichlet: List[Tuple[int, float]] = list()
+    for side in range(2):
+        if not on_boundary[side]:
+            interfaces.append(side)
+            continue
+        is_dirichlet, normal, value = state["boundaries"][side]
+        if is_dirichlet:
+            dirichlet.append((side, value))
+            arrays["solution"][first + outer[side]] = value
+            arrays["left"][first + outer[side]] = arrays["right"][first + outer[side]] = 0.0
+        else:
+            f[outer[side]] += normal * value
+    fixed = set(side for side, _ in dirichlet) | set(interfaces)
+    lo = 1 if 0 in fixed else 0
+    hi = n_local - 1 if 1 in fixed else n_local
+
+    interior = csr_matrix(matrix[lo:hi, lo:hi])
+    rows = matrix[outer][:, lo:hi]
+    columns = rows.T.toarray()  # 係数行列は対称
+    corner = matrix[outer][:, outer].toarray()
+    load = f[lo:hi]
+    for side, value in dirichlet:
+        load = load - columns[:, side] * value
+    factorization = factorize(interior, degree)
+    solved = np.asarray(factorization.solve(np.column_stack([load] + [columns[:, side] for side in interfaces])))
+    arrays["solution"][first + lo : first + hi] = solved[:, 0]
+    for k, side in enumerate(interfaces):
+        arrays["left" if side == 0 else "right"][first + lo : first + hi] = solved[:, k + 1]
+
+    coupled = rows.dot(solved)
+    schur = np.empty((len(interfaces), len(interfaces)))
+    contribution = np.empty(len(interfaces))
+    for m, side in enumerate(interfaces):
+        contribution[m] = -coupled[side, 0] - sum(corner[side, d] * value for d, value in dirichlet)
+        for k, other in enumerate(interfaces):
+            schur[m, k] = corner[side, other] - coupled[side, k + 1]
+    index = [n - 1 if side == 0 else n for side in interfaces]
+    return index, schur, contribution
+
+
+def _solve_interface(schur: List[Tuple[List[int], NDArray, NDArray]], rhs: NDArray) -> NDArray:
+    """インターフェース節点に関する三重対角のSchur補元の連立一次方程式を解く関数
+
+    Args:
+        schur (List[Tuple[List[int], NDArray, NDArray]]): 部分領域ごとのSchur補元と右辺ベクトルへの寄与
+        rhs (NDArray): インターフェース節点の右辺ベクトル
+
+    Returns:
+        NDArray: インターフェース節点の解
+    """
+    n_interface = rhs.size
+    if n_interface == 0:
+        return np.zeros(0)
+    rows: List[int] = list()
+    cols: List[int] = list()
+    data: List[float] = list()
+    load = np.array(rhs, dtype=float)
+    for index, matrix, contribution in schur:
+        for m, row in enumerate(index):
+            load[row] += contribution[m]
+            for k, col in enumerate(index):
+                rows.append(row)
+                cols.append(col)
+                data.append(matrix[m, k])
+    system = csr_matrix((data, (rows, cols)), shape=(n_interface, n_interface))
+    return np.asarray(factorize(system, 1).solve(load))
+
+
+def _update_tasks(subdomains: List[Tuple[int, int, int]], interface: NDArray) -> List[Tuple[int, int, float, float]]:
+    """内部節点の解を補正するタスクを作る関数
+
+    Args:
+        subdomains (List[Tuple[int, int, int]]): 部分領域の番号と要素番号の範囲
+        interface (NDArray): インターフェース節点の解
+
+    Returns:
+        List[Tuple[int, int, float, float]]: 要素番号の範囲と左右のインターフェース節点の解の組
+    """
+    tasks = list()
+    for n, start, stop in subdomains:
+        left = float(interface[n - 1]) if n > 0 else 0.0
+        right = float(interface[n]) if n < len(subdomains) - 1 else 0.0
+        tasks.append((start, stop, left, right))
+    return tasks
+
+
+def _update_subdomain(start: int, stop: int, left: float, right: float) -> None:
+    """インターフェース節点の解から部分領域の内部節点の解を補正する関数
+
+    Args:
+        start (int): 部分領域の最初の要素番号
+        stop (int): 部分領域の最後の要素番号の次
+        left (float): 左側のインターフェース節点の解
+        right (float): 右側のインターフェース節点の解
+    """
+    state = _WORKER_STATE
+    arrays = state["arrays"]
+    degree = state["degree"]
+    first = degree * start + (1 if start > 0 else 0)
+    last = degree * stop - (1 if stop < state["n_element"] else 0)
+    solution = arrays["solution"][first : last + 1]
+    if start > 0:
+        solution -= left * arrays["left"][first : last + 1]
+    if stop < state["n_element"]:
+        solution -= right * arrays["right"][first : last + 1]
+
+
+def _local_mesh(mesh_type: type, vertices: NDArray, degree: int) -> Mesh1D:
+    """部分領域のメッシュを作る関数
+
+    Args:
+        mesh_type (type): メッシュの種類
+        vertices (NDArray): 部分領域の要素の端点の座標
+        degree (int): 多項式の次数
+
+    Returns:
+        Mesh1D: 部分領域のメッシュ
+    """
+    if mesh_type is LineMesh:
+        return LineMesh.from_vertices(vertices)
+    elif mesh_type is LineMeshHighOrder:
+        return LineMeshHighOrder.from_vertices(vertices)
+    elif mesh_type is LineMeshLagrange:
+        return LineMeshLagrange.from_vertices(vertices, degree)
+    else:
+        raise ValueError
@@ -0,0 +1,47 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.linalg import eigh
+from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator, eigsh
+
+from .banded import factorize
+
+
+def shift_invert_eigsh(
+    stiffness: spmatrix, mass: spmatrix, n_eigen: int, sigma: float, max_bandwidth: int
+) -> Tuple[NDArray, NDArray]:
+    """一般化固有値問題`K v = λ M v`のσに最も近い固有対を求める関数
+
+    `K - σM`を帯行列のLU分解（帯幅が`max_bandwidth`を超える場合は疎行列LU分解）で分解し,
+    シフト・インバート法のLanczos反復に与える. 行列が小さい場合は密行列の固有値解法を用いる.
+
+    Args:
+        stiffness (spmatrix): 対称な行列`K`
+        mass (spmatrix): 対称正定値な行列`M`
+        n_eigen (int): 求める固有対の数
+        sigma (float): シフト量
+        max_bandwidth (int): 帯行列のLU分解を用いる帯幅の上限
+
+    Raises:
+        ValueError: 求める固有対の数が行列の大きさを超える場合に発生
+
+    Returns:
+        Tuple[NDArray, NDArray]: 昇順に並べた固有値と対応する固有ベクトル（形状は(行数, n_eigen)）
+    """
+    size = stiffness.shape[0]
+    if not 0 < n_eigen <= size:
+        message = f"The number of eigenpairs `n_eigen` must be in the range [1, {size}]."
+        raise ValueError(message)
+
+    if n_eigen >= size - 1:
+        eigenvalues, eigenvectors = eigh(stiffness.toarray(), mass.toarray())
+        order = np.argsort(np.abs(eigenvalues - sigma))[:n_eigen]
+    else:
+        factorization = factorize((stiffness - sigma * mass).tocsr(), max_bandwidth)
+        inverse = LinearOperator((size, size), matvec=factorization.solve, dtype=float)
+        eigenvalues, eigenvectors = eigsh(stiffness, n_eigen, mass, sigma=sigma, which="LM", OPinv=inverse)
+        order = np.arange(n_eigen)
+    order = order[np.argsort(eigenvalues[order])]
+    return eigenvalues[order], eigenvectors[:, order]
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class FactorizationCache:
+    """係数行列の分解を保持するLRUキャッシュ"""
+
+    def __init__(self, maxsize: int = 8) -> None:
+        """係数行列の分解を保持するLRUキャッシュ
+
+        Args:
+            maxsize (int, optional): 保持する分解の最大数. Defaults to 8.
+
+        Raises:
+            ValueError: 最大数maxsizeが負の場合に発生
+        """
+        if maxsize < 0:
+            message = "The cache size `maxsize` must be a non-negative integer."
+            raise ValueError(message)
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    @property
+    def maxsize(self) -> int:
+        """保持する分解の最大数"""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any | None:
+        """キャッシュから分解を取り出す関数
+
+        Args:
+            key (Hashable): キャッシュのキー
+
+        Returns:
+            Any | None: 分解（キャッシュに存在しない場合はNone）
+        """
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """キャッシュに分解を登録する関数
+
+        最大数を超えた場合は最も長く使われていない分解を破棄する.
+
+        Args:
+            key (Hashable): キャッシュのキー
+            value (Any): 分解
+        """
+        if self._maxsize == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """キャッシュを無効化する関数
+
+        Args:
+            key (Hashable | None, optional): 無効化するキー（Noneの場合は全て無効化）. Defaults to None.
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -1,188 +1,810 @@
+from typing import Callable, List, Tuple
+
 import numpy as np
 from numpy.typing import NDArray
-from scipy.sparse import lil_matrix
+from scipy.sparse import coo_matrix, csr_matrix, spmatrix
+from scipy.sparse.linalg import LinearOperator
+
+from module.discretization import BoundaryCondition, LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
+from module.profiling import Stats
+
+from .banded import factorize, solve_banded_or_sparse
+from .condensation import StaticCondensation
+from .eigen import shift_invert_eigsh
+from .factorization import FactorizationCache
+from .operator_cache import OperatorCache
+from .reference_element import lagrange_basis, lagrange_reference_matrices
+from .spectral import spectral_solve
 
-from module.discretization import BoundaryCondition, LineMesh, LineMeshHighOrder
+Coefficient = Callable[[NDArray], NDArray] | NDArray | float
+"""係数の型（関数, 節点値の配列, 要素ごとの値の配列または定数）"""
 
 
 class Fem1d:
     """一次元有限要素法"""
 
-    def __init__(self, mesh: LineMesh | LineMeshHighOrder) -> None:
+    def __init__(
+        self,
+        mesh: Mesh1D,
+        cache_size: int = 8,
+        matrix_free: bool = False,
+        stats: Stats | None = None,
+        matrices: Tuple[csr_matrix, csr_matrix] | None = None,
+        operator_cache: OperatorCache | None = None,
+    ) -> None:
         """一次元有限要素法
 
+        全体行列は初めて必要になった時点で組み立てる（`laplacian`のみを使う場合は`term`の行列は組み立てない）.
+        行列フリーモードでは全体行列を保持せず, `laplacian`・`term`は節点座標から要素行列を直接作用させる.
+        行列が必要な処理（`solve`など）では呼び出しごとに組み立てる.
+        各処理段階の時間・回数・行列のバイト数は`stats`に記録される（既定では無効）.
+        組み立て済みの行列を`matrices`に与えると組み立てを省略し, 行列を複製せずに保持する
+        （メモリマップした行列など, 書き込み不可の行列でもよい）.
+        `operator_cache`を与えると, 同じ種類・形状のメッシュを持つ他のインスタンスと組み立て済みの行列を共有する.
+
         Args:
-            mesh (LineMesh | LineMeshHighOrder): メッシュデータ
+            mesh (Mesh1D): メッシュデータ
+            cache_size (int, optional): 保持する係数行列の分解の最大数. Defaults to 8.
+            matrix_free (bool, optional): 行列フリーモードを用いるか否か. Defaults to False.
+            stats (Stats | None, optional): 計測値の記録先（Noneの場合は無効な計測を作成）. Defaults to None.
+            matrices (Tuple[csr_matrix, csr_matrix] | None, optional):
+                組み立て済みのLaplace作用素と一般的な項に対応する行列. Defaults to None.
+            operator_cache (OperatorCache | None, optional): 組み立て済みの行列を共有するキャッシュ. Defaults to None.
 
         Raises:
             ValueError: 不正なメッシュデータを入力した場合に発生
+            ValueError: 組み立て済みの行列の形状が節点数と一致しない場合に発生
+            ValueError: 行列フリーモードで組み立て済みの行列を与えた場合に発生
         """
         self.mesh = mesh
-        if isinstance(mesh, LineMesh):
-            self._laplacian = _laplacian_matrix(mesh)
-            self._term = _term_matrix(mesh)
-        elif isinstance(mesh, LineMeshHighOrder):
-            self._laplacian = _laplacian_matrix_high_order(mesh)
-            self._term = _term_matrix_high_order(mesh)
-        else:
-            raise ValueError
+        self.stats = Stats(enabled=False) if stats is None else stats
+        _reference_matrices(mesh)
+        self._matrix_free = matrix_free
+        self._operator_cache = None if matrix_free else operator_cache
+        self._laplacian: csr_matrix | None = None
+        self._term: csr_matrix | None = None
+        if matrices is not None:
+            if matrix_free:
+                message = "Assembled `matrices` cannot be used in the matrix-free mode."
+                raise ValueError(message)
+            shape = (mesh.n_node, mesh.n_node)
+            if any(matrix.shape != shape for matrix in matrices):
+                message = f"The shapes of the assembled `matrices` must be {shape}."
+                raise ValueError(message)
+            self._laplacian, self._term = (csr_matrix(matrix) for matrix in matrices)
+        self._bandwidth = _element_degree(mesh)
+        self._factorizations = FactorizationCache(cache_size)
+
+    @property
+    def laplacian_matrix(self) -> csr_matrix:
+        """Laplace作用素に対応する行列（書き換え可能な複製）
+
+        Returns:
+            csr_matrix: Laplace作用素に対応する行列
+        """
+        if self._matrix_free:
+            return self._assemble_laplacian()
+        matrix = self._stiffness()
+        with self.stats.phase("copy.laplacian_matrix"):
+            return matrix.copy()
+
+    @property
+    def term_matrix(self) -> csr_matrix:
+        """一般的な項に対応する行列（書き換え可能な複製）
+
+        Returns:
+            csr_matrix: 一般的な項に対応する行列
+        """
+        if self._matrix_free:
+            return self._assemble_term()
+        matrix = self._mass()
+        with self.stats.phase("copy.term_matrix"):
+            return matrix.copy()
+
+    @property
+    def laplacian_view(self) -> csr_matrix:
+        """Laplace作用素に対応する行列の読み取り専用ビュー（保持している行列を複製しない）
+
+        Returns:
+            csr_matrix: 非零成分・非零構造の配列が書き込み不可の行列
+        """
+        return _read_only_view(self._stiffness())
 
     @property
-    def laplacian_matrix(self) -> lil_matrix:
-        """Laplace作用素に対応する行列
+    def term_view(self) -> csr_matrix:
+        """一般的な項に対応する行列の読み取り専用ビュー（保持している行列を複製しない）
 
         Returns:
-            lil_matrix: _description_
+            csr_matrix: 非零成分・非零構造の配列が書き込み不可の行列
         """
-        return self._laplacian.copy()
+        return _read_only_view(self._mass())
+
+    @property
+    def matrix_free(self) -> bool:
+        """行列フリーモードか否か"""
+        return self._matrix_free
 
     @property
-    def term_matrix(self) -> lil_matrix:
-        """一般的な項に対応する行列
+    def laplacian_operator(self) -> LinearOperator:
+        """Laplace作用素に対応する線形作用素（反復解法用）
 
         Returns:
-            lil_matrix: _description_
+            LinearOperator: Laplace作用素に対応する線形作用素
         """
-        return self._term.copy()
+        n_node = self.mesh.n_node
+        return LinearOperator((n_node, n_node), matvec=self.laplacian, matmat=self.laplacian, dtype=float)
+
+    @property
+    def term_operator(self) -> LinearOperator:
+        """一般的な項に対応する線形作用素（反復解法用）
+
+        Returns:
+            LinearOperator: 一般的な項に対応する線形作用素
+        """
+        n_node = self.mesh.n_node
+        return LinearOperator((n_node, n_node), matvec=self.term, matmat=self.term, dtype=float)
 
     def laplacian(self, vec: NDArray) -> NDArray:
         """ラプラス作用素を適用する関数
 
         Args:
-            vec (NDArray): 関数値データ
+            vec (NDArray): 関数値データ（形状は(節点数,)または(節点数, ベクトル数)）
 
         Returns:
             NDArray: ラプラス作用素を適用した結果の離散データ
         """
-        return np.array(self._laplacian.dot(vec))
+        if self._matrix_free:
+            with self.stats.phase("apply.laplacian"):
+                return _apply_laplacian(self.mesh, vec)
+        matrix = self._stiffness()
+        with self.stats.phase("apply.laplacian"):
+            return np.asarray(matrix.dot(vec))
 
     def term(self, vec: NDArray) -> NDArray:
         """一般的な項の離散データを計算する関数
 
         Args:
-            vec (NDArray): 関数値データ
+            vec (NDArray): 関数値データ（形状は(節点数,)または(節点数, ベクトル数)）
 
         Returns:
             NDArray: 一般的な項の離散データ
         """
-        return np.array(self._term.dot(vec))
+        if self._matrix_free:
+            with self.stats.phase("apply.term"):
+                return _apply_term(self.mesh, vec)
+        matrix = self._mass()
+        with self.stats.phase("apply.term"):
+            return np.asarray(matrix.dot(vec))
+
+    def operator(self, alpha: float = 1.0, beta: float = 0.0) -> csr_matrix:
+        """係数行列`alpha * K + beta * M`を組み立てる関数
+
+        `K`はLaplace作用素に対応する行列, `M`は一般的な項に対応する行列である.
+        両行列の共通の非零構造を利用して非零成分の配列のみを一度に計算するため, 中間の行列を作らない.
+        `beta`が0の場合は`M`を組み立てない. 返す行列は書き換え可能であり, そのまま`implement_dirichlet`に渡せる.
+
+        Args:
+            alpha (float, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+            beta (float, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
 
-    def implement_dirichlet(self, coefficient: lil_matrix, rhs: NDArray, values: NDArray) -> None:
+        Returns:
+            csr_matrix: 係数行列
+        """
+        if beta == 0.0:
+            stiffness = self._stiffness()
+            indptr, indices, laplacian = stiffness.indptr, stiffness.indices, stiffness.data
+        else:
+            indptr, indices, laplacian, term = self._shared_structure()
+        with self.stats.phase("assembly.operator"):
+            data = np.multiply(laplacian, alpha)
+            if beta != 0.0:
+                data += np.multiply(term, beta)
+            n_node = self.mesh.n_node
+            return csr_matrix((data, indices.copy(), indptr.copy()), shape=(n_node, n_node))
+
+    def implement_dirichlet(self, coefficient: spmatrix, rhs: NDArray, values: NDArray) -> None:
         """係数行列および右辺ベクトルにDirichlet境界条件を課す関数
 
+        係数行列がCSR形式またはCSC形式の場合は非零成分の配列を直接書き換えるため,
+        計算量は拘束節点数と帯幅のみに比例する. それ以外の形式では添字代入で処理する.
+        右辺ベクトルと境界値データは(節点数, ベクトル数)の二次元配列でもよい.
+
         Args:
-            coefficient (lil_matrix): 係数行列
+            coefficient (spmatrix): 係数行列
             rhs (NDArray): 右辺ベクトル
-            values (NDArray): 境界値データ
-        """
-        local_index = BoundaryCondition.to_indices(BoundaryCondition.DIRICHLET, self.mesh.conditions)
-        global_index = [self.mesh.boundary_nodes[i] for i in local_index]
-        d = np.zeros_like(rhs)
-        d[global_index] = values[global_index]
-        rhs -= coefficient.dot(d)
-        rhs[global_index] = values[global_index]
-        coefficient[global_index, :] = 0.0
-        coefficient[:, global_index] = 0.0
-        coefficient[global_index, global_index] = 1.0
+            values (NDArray): 境界値データ（rhsと同じ形状）
+        """
+        with self.stats.phase("bc.dirichlet"):
+            global_index = self._boundary_index(BoundaryCondition.DIRICHLET)
+            if coefficient.format in ("csr", "csc"):
+                _implement_dirichlet_compressed(coefficient, rhs, global_index, values)
+                return
+            d = np.zeros_like(rhs)
+            d[global_index] = values[global_index]
+            rhs -= coefficient.dot(d)
+            rhs[global_index] = values[global_index]
+            coefficient[global_index, :] = 0.0
+            coefficient[:, global_index] = 0.0
+            coefficient[global_index, global_index] = 1.0
 
     def implement_neumann(self, rhs: NDArray, values: NDArray) -> None:
         """右辺ベクトルにNeumann境界条件を課す関数
 
         Args:
-            rhs (NDArray): 右辺ベクトル
-            values (NDArray): 境界値データ
+            rhs (NDArray): 右辺ベクトル（形状は(節点数,)または(節点数, ベクトル数)）
+            values (NDArray): 境界値データ（rhsと同じ形状）
+        """
+        with self.stats.phase("bc.neumann"):
+            local_index = BoundaryCondition.to_indices(BoundaryCondition.NEUMANN, self.mesh.conditions)
+            global_index = [self.mesh.boundary_nodes[i] for i in local_index]
+            for i, m in zip(global_index, local_index):
+                rhs[i] += self.mesh.unit_normals[m] * values[i]
+
+    def solve_system(self, coefficient: spmatrix, rhs: NDArray) -> NDArray:
+        """境界条件を課した連立一次方程式を解く関数
+
+        係数行列の帯幅が要素の次数から決まる帯幅（要素の節点番号の差の最大値）以下であれば帯行列ソルバーを用い,
+        そうでなければ疎行列LU分解で解く.
+
+        Args:
+            coefficient (spmatrix): 係数行列
+            rhs (NDArray): 右辺ベクトル（形状は(節点数,)または(節点数, ベクトル数)）
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        with self.stats.phase("solve.system"):
+            return solve_banded_or_sparse(coefficient, rhs, self._bandwidth)
+
+    def solve(
+        self, rhs: NDArray, values: NDArray, alpha: float = 1.0, beta: float = 0.0, method: str = "factorization"
+    ) -> NDArray:
+        """係数行列`alpha * K + beta * M`の境界値問題を解く関数
+
+        `K`はLaplace作用素に対応する行列, `M`は一般的な項に対応する行列である.
+        境界条件を課した係数行列の分解は`(alpha, beta, mesh.conditions)`をキーとしてキャッシュされ,
+        二回目以降の呼び出しでは右辺ベクトルへの境界条件の反映と前進・後退代入のみを行う.
+        (節点数, ベクトル数)の二次元配列を与えると全ての列を一度に解く.
+        `method`に`"spectral"`を与えると, 一様な一次要素メッシュで両端の境界条件が同じ場合に限り,
+        分解を作らずに離散正弦・余弦変換で解く（`spectral_solve`を参照）.
+        `"condensation"`を与えると, 要素内部節点を静的縮約した頂点節点のみの連立一次方程式を分解して解く
+        （二次以上の要素のみ, 縮約した分解も同様にキャッシュされる）.
+
+        Args:
+            rhs (NDArray): 境界条件を課す前の右辺ベクトル
+            values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値, rhsと同じ形状）
+            alpha (float, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+            beta (float, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
+            method (str, optional): 解法（`"factorization"`, `"spectral"`または`"condensation"`）.
+                Defaults to "factorization".
+
+        Raises:
+            ValueError: 不正な解法を指定した場合に発生
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        if method == "spectral":
+            with self.stats.phase("solve.spectral"):
+                return spectral_solve(self.mesh, rhs, values, alpha, beta)
+        elif method == "condensation":
+            return self._solve_condensed(rhs, values, alpha, beta)
+        elif method != "factorization":
+            message = f"The method `{method}` is not supported. Use 'factorization', 'spectral' or 'condensation'."
+            raise ValueError(message)
+
+        key = (float(alpha), float(beta), tuple(self.mesh.conditions))
+        cached = self._factorizations.get(key)
+        if cached is None:
+            self.stats.count("factorization.miss")
+            coefficient = self.operator(alpha, beta)
+            with self.stats.phase("solve.factorize"):
+                index = self._boundary_index(BoundaryCondition.DIRICHLET)
+                lift = coefficient[:, index].tocsc()
+                zeros = np.zeros(self.mesh.n_node)
+                _implement_dirichlet_compressed(coefficient, zeros, index, zeros)
+                cached = (factorize(coefficient, self._bandwidth), index, lift)
+            self._factorizations.put(key, cached)
+        else:
+            self.stats.count("factorization.hit")
+        factorization, index, lift = cached
+
+        rhs = np.array(rhs, dtype=float)
+        rhs -= lift.dot(values[index])
+        rhs[index] = values[index]
+        self.implement_neumann(rhs, values)
+        with self.stats.phase("solve.substitute"):
+            return np.asarray(factorization.solve(rhs))
+
+    def eigenpairs(self, n_eigen: int, sigma: float | None = None) -> Tuple[NDArray, NDArray]:
+        """一般化固有値問題`K v = λ M v`の固有対を求める関数
+
+        `K`はLaplace作用素に対応する行列, `M`は一般的な項に対応する行列である.
+        Dirichlet境界条件が課された節点は消去し（固有ベクトルの値は0）, Neumann境界条件は自然境界条件として扱う.
+        帯行列のLU分解を用いたシフト・インバート法で求めるため, 密行列を作らない.
+
+        Args:
+            n_eigen (int): 求める固有対の数
+            sigma (float | None, optional): シフト量（Noneの場合は最小の固有値から求める）. Defaults to None.
+
+        Returns:
+            Tuple[NDArray, NDArray]: 昇順に並べた固有値と対応する固有ベクトル（形状は(節点数, n_eigen)）
+        """
+        free = np.ones(self.mesh.n_node, dtype=bool)
+        free[self._boundary_index(BoundaryCondition.DIRICHLET)] = False
+        stiffness = self._stiffness()[free][:, free]
+        mass = self._mass()[free][:, free]
+        if sigma is None:
+            sigma = -1.0
+        with self.stats.phase("solve.eigen"):
+            eigenvalues, reduced = shift_invert_eigsh(stiffness, mass, n_eigen, sigma, self._bandwidth)
+        eigenvectors = np.zeros((self.mesh.n_node, reduced.shape[1]), dtype=float)
+        eigenvectors[free] = reduced
+        return eigenvalues, eigenvectors
+
+    def diffusion_matrix(self, coefficient: Coefficient) -> csr_matrix:
+        """拡散項`-(a(x) u')'`に対応する行列
+
+        係数は全要素の求積点で一括して評価し, Gauss求積で要素行列を計算する.
+
+        Args:
+            coefficient (Coefficient): 係数`a(x)`（関数, 節点値の配列, 要素ごとの値の配列または定数）
+
+        Returns:
+            csr_matrix: 拡散項に対応する行列
         """
-        local_index = BoundaryCondition.to_indices(BoundaryCondition.NEUMANN, self.mesh.conditions)
-        global_index = [self.mesh.boundary_nodes[i] for i in local_index]
-        for i, m in zip(global_index, local_index):
-            rhs[i] += self.mesh.unit_normals[m] * values[i]
+        _, derivatives, weights, values = _quadrature_data(self.mesh, coefficient)
+        h = _element_lengths(self.mesh)
+        element_matrices = np.einsum("eq,q,qa,qb->eab", values, weights, derivatives, derivatives)
+        return _assemble(self.mesh, element_matrices / h[:, np.newaxis, np.newaxis])
 
+    def reaction_matrix(self, coefficient: Coefficient) -> csr_matrix:
+        """反応項`c(x) u`に対応する行列
+
+        係数は全要素の求積点で一括して評価し, Gauss求積で要素行列を計算する.
+
+        Args:
+            coefficient (Coefficient): 係数`c(x)`（関数, 節点値の配列, 要素ごとの値の配列または定数）
+
+        Returns:
+            csr_matrix: 反応項に対応する行列
+        """
+        basis, _, weights, values = _quadrature_data(self.mesh, coefficient)
+        h = _element_lengths(self.mesh)
+        element_matrices = np.einsum("eq,q,qa,qb->eab", values, weights, basis, basis)
+        return _assemble(self.mesh, element_matrices * h[:, np.newaxis, np.newaxis])
 
-def _laplacian_matrix(mesh: LineMesh) -> lil_matrix:
-    """Laplace作用素に対応する行列（一次要素）
+    def clear_factorizations(self) -> None:
+        """キャッシュされた係数行列の分解を全て破棄する関数"""
+        self._factorizations.invalidate()
+
+    def _solve_condensed(self, rhs: NDArray, values: NDArray, alpha: float, beta: float) -> NDArray:
+        """要素内部節点を静的縮約して係数行列`alpha * K + beta * M`の境界値問題を解く関数
+
+        縮約した分解は`("condensation", alpha, beta, mesh.conditions)`をキーとしてキャッシュされる.
+
+        Args:
+            rhs (NDArray): 境界条件を課す前の右辺ベクトル
+            values (NDArray): 境界値データ（rhsと同じ形状）
+            alpha (float): Laplace作用素に対応する行列の係数
+            beta (float): 一般的な項に対応する行列の係数
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        key = ("condensation", float(alpha), float(beta), tuple(self.mesh.conditions))
+        condensation = self._factorizations.get(key)
+        if condensation is None:
+            self.stats.count("factorization.miss")
+            with self.stats.phase("solve.factorize"):
+                laplacian, term = _reference_matrices(self.mesh)
+                h = _element_lengths(self.mesh)[:, np.newaxis, np.newaxis]
+                element_matrices = alpha * laplacian[np.newaxis, :, :] / h + beta * term[np.newaxis, :, :] * h
+                condensation = StaticCondensation(self.mesh, element_matrices)
+            self._factorizations.put(key, condensation)
+        else:
+            self.stats.count("factorization.hit")
+        with self.stats.phase("solve.substitute"):
+            return condensation.solve(rhs, values)
+
+    def _assemble_laplacian(self) -> csr_matrix:
+        """Laplace作用素に対応する行列を組み立てる関数（計測付き）"""
+        with self.stats.phase("assembly.laplacian"):
+            matrix = _laplacian_matrix(self.mesh)
+        self.stats.record_bytes("laplacian_matrix", _matrix_nbytes(matrix))
+        return matrix
+
+    def _assemble_term(self) -> csr_matrix:
+        """一般的な項に対応する行列を組み立てる関数（計測付き）"""
+        with self.stats.phase("assembly.term"):
+            matrix = _term_matrix(self.mesh)
+        self.stats.record_bytes("term_matrix", _matrix_nbytes(matrix))
+        return matrix
+
+    def _stiffness(self) -> csr_matrix:
+        """Laplace作用素に対応する行列（初回に組み立てて保持する, 行列フリーモードでは毎回組み立てる, 複製しない）"""
+        if self._matrix_free:
+            return self._assemble_laplacian()
+        if self._laplacian is None:
+            if self._operator_cache is not None:
+                self._load_cached_matrices(self._operator_cache)
+            else:
+                self._laplacian = self._assemble_laplacian()
+        return self._laplacian
+
+    def _mass(self) -> csr_matrix:
+        """一般的な項に対応する行列（初回に組み立てて保持する, 行列フリーモードでは毎回組み立てる, 複製しない）"""
+        if self._matrix_free:
+            return self._assemble_term()
+        if self._term is None:
+            if self._operator_cache is not None:
+                self._load_cached_matrices(self._operator_cache)
+            else:
+                self._term = self._assemble_term()
+        return self._term
+
+    def _load_cached_matrices(self, operator_cache: OperatorCache) -> None:
+        """共有キャッシュから両行列を取得する関数（キャッシュにない場合は両行列を組み立てて登録する）"""
+        cached = operator_cache.matrices(self.mesh, lambda: (self._assemble_laplacian(), self._assemble_term()))
+        self._laplacian, self._term = cached
+
+    def _boundary_index(self, condition: str) -> List[int]:
+        """指定した境界条件が課された境界節点の全体節点番号を取得する関数
+
+        Args:
+            condition (str): 境界条件ラベル
+
+        Returns:
+            List[int]: 全体節点番号のリスト
+        """
+        local_index = BoundaryCondition.to_indices(condition, self.mesh.conditions)
+        return [self.mesh.boundary_nodes[i] for i in local_index]
+
+    def _shared_structure(self) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Laplace作用素と一般的な項に対応する行列の共通の非零構造を取得する関数
+
+        両行列は同じ要素節点番号から組み立てられるため, CSR形式の非零構造が一致する.
+        非零成分の配列のみを更新して線形結合を作る処理（波数掃引, Newton法など）に用いる.
+        保持している行列の添字が整列済みであれば複製せずに配列を返すため, 返す配列は書き換えてはならない.
+
+        Raises:
+            ValueError: 両行列の非零構造が異なる場合に発生
+
+        Returns:
+            Tuple[NDArray, NDArray, NDArray, NDArray]:
+                CSR形式の`indptr`, `indices`と, Laplace作用素および一般的な項に対応する行列の非零成分の配列
+        """
+        laplacian = self._stiffness()
+        term = self._mass()
+        if not (laplacian.has_sorted_indices and term.has_sorted_indices):
+            laplacian = laplacian.sorted_indices()
+            term = term.sorted_indices()
+        if not (np.array_equal(laplacian.indptr, term.indptr) and np.array_equal(laplacian.indices, term.indices)):
+            message = "The sparsity structures of the laplacian matrix and the term matrix must be identical."
+            raise ValueError(message)
+        return laplacian.indptr, laplacian.indices, laplacian.data, term.data
+
+
+def _matrix_nbytes(matrix: csr_matrix) -> int:
+    """CSR形式の行列が確保しているバイト数
 
     Args:
-        mesh (LineMesh): メッシュデータ
+        matrix (csr_matrix): CSR形式の行列
 
     Returns:
-        lil_matrix: Laplace作用素に対応する行列
+        int: バイト数
     """
-    n_node = mesh.n_node
-    matrix = lil_matrix((n_node, n_node))
-    for i, j in mesh.element_nodes:
-        h = mesh.x[j] - mesh.x[i]
-        matrix[i, i] += 1 / h
-        matrix[j, j] += 1 / h
-        matrix[i, j] -= 1 / h
-        matrix[j, i] -= 1 / h
-    return matrix
+    return int(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes)
 
 
-def _term_matrix(mesh: LineMesh) -> lil_matrix:
-    """一般的な項に対応する行列（一次要素）
+def _read_only_view(matrix: csr_matrix) -> csr_matrix:
+    """非零成分・非零構造の配列を共有する読み取り専用の行列を作る関数
 
     Args:
-        mesh (LineMesh): メッシュデータ
+        matrix (csr_matrix): CSR形式の行列
 
     Returns:
-        lil_matrix: 一般的な項に対応する行列
+        csr_matrix: 書き込み不可のビューを配列に持つ行列
     """
-    n_node = mesh.n_node
-    matrix = lil_matrix((n_node, n_node))
-    for i, j in mesh.element_nodes:
-        h = mesh.x[j] - mesh.x[i]
-        matrix[i, i] += h / 3
-        matrix[j, j] += h / 3
-        matrix[i, j] += h / 6
-        matrix[j, i] += h / 6
-    return matrix
+    arrays = [array.view() for array in (matrix.data, matrix.indices, matrix.indptr)]
+    for array in arrays:
+        array.setflags(write=False)
+    return csr_matrix(tuple(arrays), shape=matrix.shape)
+
+
+def _implement_dirichlet_compressed(matrix: spmatrix, rhs: NDArray, index: List[int], values: NDArray) -> None:
+    """CSR形式またはCSC形式の係数行列にDirichlet境界条件を課す関数
+
+    有限要素行列の非零構造が対称であることを利用し, 拘束節点の行（列）から隣接節点を求めて,
+    隣接節点の行（列）に含まれる拘束節点の成分のみを書き換える.
+
+    Args:
+        matrix (spmatrix): CSR形式またはCSC形式の係数行列
+        rhs (NDArray): 右辺ベクトル
+        index (List[int]): 拘束節点の全体節点番号
+        values (NDArray): 境界値データ（rhsと同じ形状）
+
+    Raises:
+        ValueError: 係数行列の非零構造が対称でない場合に発生
+    """
+    matrix.sum_duplicates()
+    positions = _dirichlet_positions(matrix, index)
+    data = matrix.data
+    for c, _, lines, _, column in positions:
+        rhs[lines] -= np.multiply.outer(data[column], values[c])
+    missing = _zero_dirichlet_entries(data, positions)
+    for c in missing:
+        matrix[c, c] = 1.0
+    rhs[index] = values[index]
 
 
-def _laplacian_matrix_high_order(mesh: LineMeshHighOrder) -> lil_matrix:
-    """Laplace作用素に対応する行列（二次要素）
+def _dirichlet_positions(matrix: spmatrix, index: List[int]) -> List[Tuple[int, NDArray, NDArray, NDArray, NDArray]]:
+    """拘束節点の行・列に含まれる非零成分の位置を求める関数
 
     Args:
-        mesh (LineMesh): メッシュデータ
+        matrix (spmatrix): CSR形式またはCSC形式の係数行列（重複成分なし）
+        index (List[int]): 拘束節点の全体節点番号
+
+    Raises:
+        ValueError: 係数行列の非零構造が対称でない場合に発生
 
     Returns:
-        lil_matrix: Laplace作用素に対応する行列
+        List[Tuple[int, NDArray, NDArray, NDArray, NDArray]]:
+            拘束節点ごとの（節点番号, 主方向の位置, 隣接節点, 交差方向の位置, 列成分の位置）
     """
-    n_node = mesh.n_node
-    matrix = lil_matrix((n_node, n_node))
-    for i, j, k in mesh.element_nodes:
-        h = mesh.x[j] - mesh.x[i]
-        matrix[i, i] += 7 / 3 / h
-        matrix[i, j] += 1 / 3 / h
-        matrix[i, k] -= 8 / 3 / h
-        matrix[j, i] += 1 / 3 / h
-        matrix[j, j] += 7 / 3 / h
-        matrix[j, k] -= 8 / 3 / h
-        matrix[k, i] -= 8 / 3 / h
-        matrix[k, j] -= 8 / 3 / h
-        matrix[k, k] += 16 / 3 / h
-    return matrix
-
-
-def _term_matrix_high_order(mesh: LineMeshHighOrder) -> lil_matrix:
-    """一般的な項に対応する行列（二次要素）
+    indptr, indices = matrix.indptr, matrix.indices
+    positions = []
+    for c in index:
+        major = np.arange(indptr[c], indptr[c + 1])
+        lines = indices[major]
+        cross = np.empty_like(major)
+        for k, j in enumerate(lines):
+            found = np.flatnonzero(indices[indptr[j] : indptr[j + 1]] == c)
+            if found.size == 0:
+                message = "The sparsity structure of the coefficient matrix must be symmetric."
+                raise ValueError(message)
+            cross[k] = indptr[j] + found[0]
+        column = cross if matrix.format == "csr" else major
+        positions.append((c, major, lines, cross, column))
+    return positions
+
+
+def _zero_dirichlet_entries(
+    data: NDArray, positions: List[Tuple[int, NDArray, NDArray, NDArray, NDArray]]
+) -> List[int]:
+    """拘束節点の行・列の非零成分を0に, 対角成分を1に書き換える関数
+
+    Args:
+        data (NDArray): 係数行列の非零成分の配列
+        positions (List[Tuple[int, NDArray, NDArray, NDArray, NDArray]]): `_dirichlet_positions`で求めた位置
+
+    Returns:
+        List[int]: 対角成分が非零構造に含まれていない拘束節点の節点番号
+    """
+    missing = []
+    for c, major, lines, cross, _ in positions:
+        data[major] = 0.0
+        data[cross] = 0.0
+        diagonal = major[lines == c]
+        if diagonal.size > 0:
+            data[diagonal[0]] = 1.0
+        else:
+            missing.append(c)
+    return missing
+
+
+_LAPLACIAN_LINEAR = np.array([[1.0, -1.0], [-1.0, 1.0]])
+"""Laplace作用素に対応する参照要素行列（一次要素, 1/h倍前）"""
+
+_TERM_LINEAR = np.array([[1 / 3, 1 / 6], [1 / 6, 1 / 3]])
+"""一般的な項に対応する参照要素行列（一次要素, h倍前）"""
+
+_LAPLACIAN_HIGH_ORDER = np.array([[7 / 3, 1 / 3, -8 / 3], [1 / 3, 7 / 3, -8 / 3], [-8 / 3, -8 / 3, 16 / 3]])
+"""Laplace作用素に対応する参照要素行列（二次要素, 1/h倍前）"""
+
+_TERM_HIGH_ORDER = np.array([[2 / 15, -1 / 30, 1 / 15], [-1 / 30, 2 / 15, 1 / 15], [1 / 15, 1 / 15, 8 / 15]])
+"""一般的な項に対応する参照要素行列（二次要素, h倍前）"""
+
+
+def _element_lengths(mesh: Mesh1D) -> NDArray:
+    """全要素の要素長を一括で計算する関数
 
     Args:
-        mesh (LineMesh): メッシュデータ
+        mesh (Mesh1D): メッシュデータ
 
     Returns:
-        lil_matrix: 一般的な項に対応する行列
+        NDArray: 要素長の配列
     """
+    element_nodes = np.asarray(mesh.element_nodes)
+    return np.asarray(mesh.x[element_nodes[:, 1]] - mesh.x[element_nodes[:, 0]])
+
+
+def _assemble(mesh: Mesh1D, element_matrices: NDArray, elements: NDArray | None = None) -> csr_matrix:
+    """要素行列から全体行列を組み立てる関数
+
+    全要素の要素行列をCOO形式で並べ, 重複成分の和を取りつつCSR形式へ一度に変換する.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        element_matrices (NDArray): 要素行列の配列（形状は(要素数, 要素節点数, 要素節点数)）
+        elements (NDArray | None, optional): 組み立てる要素の番号（Noneの場合は全要素）. Defaults to None.
+
+    Returns:
+        csr_matrix: 全体行列
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    if elements is not None:
+        element_nodes = element_nodes[elements]
+    n_local = element_nodes.shape[1]
+    rows = np.repeat(element_nodes, n_local, axis=1).ravel()
+    cols = np.tile(element_nodes, (1, n_local)).ravel()
     n_node = mesh.n_node
-    matrix = lil_matrix((n_node, n_node))
-    for i, j, k in mesh.element_nodes:
-        h = mesh.x[j] - mesh.x[i]
-        matrix[i, i] += h * 2 / 15
-        matrix[i, j] -= h / 30
-        matrix[i, k] += h / 15
-        matrix[j, i] -= h / 30
-        matrix[j, j] += h * 2 / 15
-        matrix[j, k] += h / 15
-        matrix[k, i] += h / 15
-        matrix[k, j] += h / 15
-        matrix[k, k] += h * 8 / 15
-    return matrix
+    matrix = coo_matrix((element_matrices.ravel(), (rows, cols)), shape=(n_node, n_node))
+    return matrix.tocsr()
+
+
+def _reference_matrices(mesh: Mesh1D) -> Tuple[NDArray, NDArray]:
+    """メッシュの要素に対応する参照要素行列を取得する関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Raises:
+        ValueError: 不正なメッシュデータを入力した場合に発生
+
+    Returns:
+        Tuple[NDArray, NDArray]: Laplace作用素（1/h倍前）と一般的な項（h倍前）に対応する参照要素行列
+    """
+    if isinstance(mesh, LineMesh):
+        return _LAPLACIAN_LINEAR, _TERM_LINEAR
+    elif isinstance(mesh, LineMeshHighOrder):
+        return _LAPLACIAN_HIGH_ORDER, _TERM_HIGH_ORDER
+    elif isinstance(mesh, LineMeshLagrange):
+        return lagrange_reference_matrices(mesh.degree)
+    else:
+        raise ValueError
+
+
+def _element_degree(mesh: Mesh1D) -> int:
+    """メッシュの要素の多項式の次数を取得する関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Raises:
+        ValueError: 不正なメッシュデータを入力した場合に発生
+
+    Returns:
+        int: 多項式の次数
+    """
+    if isinstance(mesh, LineMesh):
+        return 1
+    elif isinstance(mesh, LineMeshHighOrder):
+        return 2
+    elif isinstance(mesh, LineMeshLagrange):
+        return mesh.degree
+    else:
+        raise ValueError
+
+
+def _quadrature_data(mesh: Mesh1D, coefficient: Coefficient) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+    """全要素の求積点における基底関数と係数の値を計算する関数
+
+    求積点数は節点値で与えた係数を含む被積分関数を厳密に積分できる数とする.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        coefficient (Coefficient): 係数（関数, 節点値の配列, 要素ごとの値の配列または定数）
+
+    Raises:
+        ValueError: 係数の配列の長さが節点数とも要素数とも一致しない場合に発生
+
+    Returns:
+        Tuple[NDArray, NDArray, NDArray, NDArray]:
+            基底関数の値, 導関数の値（共に形状は(求積点数, 要素節点数)）, 求積の重み, 係数の値（形状は(要素数, 求積点数)）
+    """
+    degree = _element_degree(mesh)
+    points, gauss_weights = np.polynomial.legendre.leggauss(max(degree + 1, (3 * degree + 2) // 2))
+    xi = 0.5 * (points + 1.0)
+    weights = 0.5 * gauss_weights
+    basis, derivatives = lagrange_basis(degree, xi)
+
+    element_nodes = np.asarray(mesh.element_nodes)
+    n_element = element_nodes.shape[0]
+    if callable(coefficient):
+        x0 = mesh.x[element_nodes[:, 0]]
+        h = _element_lengths(mesh)
+        values = np.asarray(coefficient(x0[:, np.newaxis] + h[:, np.newaxis] * xi[np.newaxis, :]), dtype=float)
+        values = np.broadcast_to(values, (n_element, xi.size))
+    elif np.ndim(coefficient) == 0:
+        values = np.full((n_element, xi.size), coefficient, dtype=float)
+    else:
+        array = np.asarray(coefficient, dtype=float)
+        if array.shape == (mesh.n_node,):
+            values = array[element_nodes] @ basis.T
+        elif array.shape == (n_element,):
+            values = np.repeat(array[:, np.newaxis], xi.size, axis=1)
+        else:
+            message = f"The length of the array `coefficient` must be {mesh.n_node} or {n_element}."
+            raise ValueError(message)
+    return basis, derivatives, weights, values
+
+
+def _laplacian_matrix(mesh: Mesh1D) -> csr_matrix:
+    """Laplace作用素に対応する行列
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Returns:
+        csr_matrix: Laplace作用素に対応する行列
+    """
+    reference, _ = _reference_matrices(mesh)
+    h = _element_lengths(mesh)
+    return _assemble(mesh, reference[np.newaxis, :, :] / h[:, np.newaxis, np.newaxis])
+
+
+def _term_matrix(mesh: Mesh1D) -> csr_matrix:
+    """一般的な項に対応する行列
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Returns:
+        csr_matrix: 一般的な項に対応する行列
+    """
+    _, reference = _reference_matrices(mesh)
+    h = _element_lengths(mesh)
+    return _assemble(mesh, reference[np.newaxis, :, :] * h[:, np.newaxis, np.newaxis])
+
+
+def _apply_element_matrices(mesh: Mesh1D, reference: NDArray, scale: NDArray, vec: NDArray) -> NDArray:
+    """全体行列を組み立てずに要素行列を作用させる関数
+
+    節点値を要素ごとに集め（gather）, 参照要素行列と要素ごとの係数を掛けた後, 節点へ足し戻す（scatter）.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        reference (NDArray): 参照要素行列
+        scale (NDArray): 要素ごとの係数
+        vec (NDArray): 関数値データ（形状は(節点数,)または(節点数, ベクトル数)）
+
+    Returns:
+        NDArray: 要素行列を作用させた結果
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    vec = np.asarray(vec)
+    local = np.einsum("ab,eb...->ea...", reference, vec[element_nodes])
+    local *= scale.reshape(scale.shape + (1,) * (local.ndim - 1))
+    result = np.zeros(vec.shape, dtype=np.result_type(vec.dtype, float))
+    for a in range(element_nodes.shape[1]):
+        np.add.at(result, element_nodes[:, a], local[:, a])
+    return result
+
+
+def _apply_laplacian(mesh: Mesh1D, vec: NDArray) -> NDArray:
+    """Laplace作用素に対応する行列を行列を組み立てずに作用させる関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        vec (NDArray): 関数値データ
+
+    Returns:
+        NDArray: ラプラス作用素を適用した結果の離散データ
+    """
+    reference, _ = _reference_matrices(mesh)
+    return _apply_element_matrices(mesh, reference, 1.0 / _element_lengths(mesh), vec)
+
+
+def _apply_term(mesh: Mesh1D, vec: NDArray) -> NDArray:
+    """一般的な項に対応する行列を行列を組み立てずに作用させる関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        vec (NDArray): 関数値データ
+
+    Returns:
+        NDArray: 一般的な項の離散データ
+    """
+    _, reference = _reference_matrices(mesh)
+    return _apply_element_matrices(mesh, reference, _element_lengths(mesh), vec)
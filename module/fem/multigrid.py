@@ -0,0 +1,243 @@
+from typing import List
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import coo_matrix, csr_matrix, spmatrix
+from scipy.sparse.linalg import LinearOperator, SuperLU
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
+
+from .banded import BandedLU, factorize, matrix_bandwidth
+from .fem1d import _element_degree
+from .reference_element import lagrange_basis
+
+
+class GeometricMultigrid:
+    """入れ子になったメッシュの階層を用いる幾何マルチグリッド法"""
+
+    def __init__(
+        self,
+        mesh: Mesh1D,
+        coefficient: spmatrix,
+        n_level: int | None = None,
+        coarse_size: int = 33,
+        n_smooth: int = 2,
+        omega: float = 2.0 / 3.0,
+        tol: float = 1e-10,
+        max_iter: int = 100,
+    ) -> None:
+        """入れ子になったメッシュの階層を用いる幾何マルチグリッド法
+
+        隣り合う二要素を併合して要素数を半分にしたメッシュを同じ種類で順に作り（不等間隔のメッシュにも対応する）, 粗いメッシュの基底関数を細かいメッシュの節点で評価して
+        補間行列`P`を, その転置として制限行列`R = P^T`を作る. 粗いレベルの係数行列は`R A P`（Galerkin近似）で作るため,
+        変数係数の問題や境界条件を課した係数行列にもそのまま適用できる. 平滑化には各要素の内部節点をまとめて解き,
+        頂点節点を個別に解く重み付きブロックJacobi法を用いる（一次要素では通常の重み付きJacobi法と一致する）.
+        高次要素の係数行列は点Jacobi法では次数とともに平滑化が破綻するが, 要素内部のブロックを厳密に解くことで
+        収束率が次数にほぼ依存しなくなる. 最も粗いレベルには帯行列のLU分解を用いるため,
+        Vサイクル一回の計算量とメモリ使用量は節点数に比例する.
+
+        Args:
+            mesh (Mesh1D): 最も細かいレベルのメッシュデータ
+            coefficient (spmatrix): 境界条件を課した係数行列（対称正定値）
+            n_level (int | None, optional): レベル数の上限（Noneの場合は粗くできる限り作る）. Defaults to None.
+            coarse_size (int, optional): 最も粗いレベルの節点数の目安（これ以下になると粗くしない）. Defaults to 33.
+            n_smooth (int, optional): 前平滑化・後平滑化の反復回数. Defaults to 2.
+            omega (float, optional): ブロックJacobi法の重み. Defaults to 2.0 / 3.0.
+            tol (float, optional): 残差の2ノルムに対する収束判定値（右辺の2ノルムに対する相対値）. Defaults to 1e-10.
+            max_iter (int, optional): 最大反復回数. Defaults to 100.
+
+        Raises:
+            ValueError: 係数行列の形状が節点数と一致しない場合に発生
+            ValueError: レベル数の上限n_levelが1未満の場合に発生
+        """
+        n_node = mesh.n_node
+        if coefficient.shape != (n_node, n_node):
+            message = f"The shape of the matrix `coefficient` must be {(n_node, n_node)}."
+            raise ValueError(message)
+        if n_level is not None and n_level < 1:
+            message = "The number of levels `n_level` must be an integer greater than or equal to 1."
+            raise ValueError(message)
+        self.n_smooth = n_smooth
+        self.omega = omega
+        self.tol = tol
+        self.max_iter = max_iter
+        self.residual_norms: List[float] = list()
+
+        self.meshes: List[Mesh1D] = [mesh]
+        self._matrices: List[csr_matrix] = [csr_matrix(coefficient)]
+        self._prolongations: List[csr_matrix] = list()
+        while n_level is None or len(self.meshes) < n_level:
+            coarse = _coarsen(self.meshes[-1], coarse_size)
+            if coarse is None:
+                break
+            prolongation = _prolongation(self.meshes[-1], coarse)
+            matrix = prolongation.T.tocsr() @ self._matrices[-1] @ prolongation
+            self.meshes.append(coarse)
+            self._prolongations.append(prolongation)
+            self._matrices.append(csr_matrix(matrix))
+        self._smoothers = [_block_jacobi(fine, matrix) for fine, matrix in zip(self.meshes, self._matrices[:-1])]
+        coarsest = self._matrices[-1]
+        self._coarse_solver: BandedLU | SuperLU = factorize(coarsest, max(matrix_bandwidth(coarsest)))
+
+    @property
+    def n_level(self) -> int:
+        """レベル数"""
+        return len(self.meshes)
+
+    @property
+    def n_iter(self) -> int:
+        """直前の求解における反復回数"""
+        return max(len(self.residual_norms) - 1, 0)
+
+    def solve(self, rhs: NDArray, x0: NDArray | None = None) -> NDArray:
+        """Vサイクルを反復して連立一次方程式を解く関数
+
+        三回目以降の反復で残差が二回前の半分以下にならなければ, 反復が停滞した（丸め誤差の水準に達して`tol`に
+        届かない場合を含む）とみなして例外を発生させる. 各反復の残差の2ノルムは`residual_norms`に記録される.
+
+        Args:
+            rhs (NDArray): 境界条件を課した右辺ベクトル
+            x0 (NDArray | None, optional): 初期値（Noneの場合は0）. Defaults to None.
+
+        Raises:
+            RuntimeError: 最大反復回数以内に収束しなかった場合, または反復が停滞した場合に発生
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        rhs = np.asarray(rhs, dtype=float)
+        x = np.zeros_like(rhs) if x0 is None else np.array(x0, dtype=float)
+        scale = float(np.linalg.norm(rhs))
+        self.residual_norms = list()
+        norms = self.residual_norms
+        for iteration in range(self.max_iter + 1):
+            residual = rhs - self._matrices[0].dot(x)
+            norms.append(float(np.linalg.norm(residual)))
+            if norms[-1] <= self.tol * scale:
+                return x
+            if iteration >= 3 and norms[-1] > 0.5 * norms[-3]:
+                message = (
+                    f"Multigrid iteration stagnated at relative residual {norms[-1] / scale:.3e} "
+                    f"after {iteration} iterations (tol={self.tol:.3e})."
+                )
+                raise RuntimeError(message)
+            if iteration == self.max_iter:
+                break
+            x += self.v_cycle(residual)
+
+        message = f"Multigrid iteration did not converge within {self.max_iter} iterations."
+        raise RuntimeError(message)
+
+    def v_cycle(self, rhs: NDArray, level: int = 0) -> NDArray:
+        """初期値0からVサイクルを一回適用する関数
+
+        前平滑化と後平滑化の回数が等しいため, 対称正定値な係数行列に対して対称正定値な作用素となる.
+
+        Args:
+            rhs (NDArray): 右辺ベクトル
+            level (int, optional): 開始するレベル（0が最も細かい）. Defaults to 0.
+
+        Returns:
+            NDArray: 近似解
+        """
+        if level == self.n_level - 1:
+            return np.asarray(self._coarse_solver.solve(rhs))
+        matrix = self._matrices[level]
+        smoother = self._smoothers[level]
+        x = self.omega * smoother.dot(rhs)
+        for _ in range(self.n_smooth - 1):
+            x += self.omega * smoother.dot(rhs - matrix.dot(x))
+        prolongation = self._prolongations[level]
+        residual = rhs - matrix.dot(x)
+        x += prolongation.dot(self.v_cycle(prolongation.T.dot(residual), level + 1))
+        for _ in range(self.n_smooth):
+            x += self.omega * smoother.dot(rhs - matrix.dot(x))
+        return np.asarray(x)
+
+    def as_preconditioner(self) -> LinearOperator:
+        """Vサイクル一回を作用させる前処理（`scipy.sparse.linalg.cg`の引数`M`に渡す）
+
+        Returns:
+            LinearOperator: 前処理に対応する線形作用素
+        """
+        n_node = self.meshes[0].n_node
+        return LinearOperator((n_node, n_node), matvec=self.v_cycle, dtype=float)
+
+
+def _coarsen(mesh: Mesh1D, coarse_size: int) -> Mesh1D | None:
+    """隣り合う二要素を併合して要素数を半分にした同じ種類のメッシュを作る関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        coarse_size (int): 最も粗いレベルの節点数の目安
+
+    Returns:
+        Mesh1D | None: 粗いメッシュ（要素数が奇数の場合や節点数が目安以下の場合はNone）
+    """
+    if mesh.n_node <= coarse_size or mesh.n_element % 2 != 0:
+        return None
+    element_nodes = np.asarray(mesh.element_nodes)
+    vertices = mesh.x[np.append(element_nodes[::2, 0], element_nodes[-1, 1])]
+    if isinstance(mesh, LineMesh):
+        return LineMesh.from_vertices(vertices, mesh.conditions)
+    elif isinstance(mesh, LineMeshHighOrder):
+        return LineMeshHighOrder.from_vertices(vertices, mesh.conditions)
+    elif isinstance(mesh, LineMeshLagrange):
+        return LineMeshLagrange.from_vertices(vertices, mesh.degree, mesh.conditions)
+    else:
+        raise ValueError
+
+
+def _block_jacobi(mesh: Mesh1D, matrix: csr_matrix) -> csr_matrix:
+    """各要素の内部節点と各頂点節点をそれぞれブロックとする係数行列のブロック対角部分の逆行列
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+        matrix (csr_matrix): 係数行列
+
+    Returns:
+        csr_matrix: ブロック対角部分の逆行列
+    """
+    element_nodes = np.asarray(mesh.element_nodes)
+    vertices = np.append(element_nodes[:, 0], element_nodes[-1, 1])
+    rows, cols, values = [vertices], [vertices], [1.0 / matrix.diagonal()[vertices]]
+    interior = element_nodes[:, 2:]
+    n_block, size = interior.shape
+    if size > 0:
+        nodes = interior.ravel()
+        sub = matrix[nodes][:, nodes].tocoo()
+        inside = sub.row // size == sub.col // size
+        blocks = np.zeros((n_block, size, size))
+        blocks[sub.row[inside] // size, sub.row[inside] % size, sub.col[inside] % size] = sub.data[inside]
+        rows.append(np.repeat(interior, size, axis=1).ravel())
+        cols.append(np.tile(interior, (1, size)).ravel())
+        values.append(np.linalg.inv(blocks).ravel())
+    shape = matrix.shape
+    return coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=shape).tocsr()
+
+
+def _prolongation(fine: Mesh1D, coarse: Mesh1D) -> csr_matrix:
+    """粗いメッシュの基底関数を細かいメッシュの節点で評価した補間行列
+
+    Args:
+        fine (Mesh1D): 細かいメッシュ
+        coarse (Mesh1D): 粗いメッシュ
+
+    Returns:
+        csr_matrix: 補間行列（形状は(細かいメッシュの節点数, 粗いメッシュの節点数)）
+    """
+    element_nodes = np.asarray(coarse.element_nodes)
+    x0 = coarse.x[element_nodes[:, 0]]
+    h = coarse.x[element_nodes[:, 1]] - x0
+    element = np.searchsorted(coarse.x[element_nodes[:, 1]], fine.x, side="left")
+    element = np.minimum(element, element_nodes.shape[0] - 1)
+    xi = np.clip((fine.x - x0[element]) / h[element], 0.0, 1.0)
+    basis, _ = lagrange_basis(_element_degree(coarse), xi)
+    basis[np.abs(basis) < 1e-14] = 0.0
+
+    n_local = element_nodes.shape[1]
+    rows = np.repeat(np.arange(fine.n_node), n_local)
+    cols = element_nodes[element].ravel()
+    matrix = coo_matrix((basis.ravel(), (rows, cols)), shape=(fine.n_node, coarse.n_node)).tocsr()
+    matrix.eliminate_zeros()
+    return matrix
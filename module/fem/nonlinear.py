@@ -0,0 +1,106 @@
+from typing import Callable, List
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import SuperLU
+
+from module.discretization import BoundaryCondition
+
+from .banded import BandedLU, factorize
+from .fem1d import Fem1d, _dirichlet_positions, _zero_dirichlet_entries
+
+
+class NewtonSolver:
+    """Newton法による非線形反応拡散方程式`-u'' + f(u) = s`の求解"""
+
+    def __init__(
+        self,
+        fem: Fem1d,
+        reaction: Callable[[NDArray], NDArray],
+        derivative: Callable[[NDArray], NDArray],
+        tol: float = 1e-10,
+        max_iter: int = 50,
+        update_interval: int = 1,
+    ) -> None:
+        """Newton法による非線形反応拡散方程式の求解
+
+        非線形項は節点値の補間`f(u_h) ≈ Σ f(u_i) φ_i`で近似するため, 残差は`K u + M f(u) - s`,
+        Jacobi行列は`K + M diag(f'(u))`となる. `K`と`M`は共通の非零構造を持つため,
+        Jacobi行列は非零成分の配列の更新のみで作られ, 非零構造とDirichlet境界条件の位置は反復間で再利用される.
+        `update_interval`を2以上にすると, Jacobi行列の分解をその回数だけ使い回す修正Newton法となる.
+
+        Args:
+            fem (Fem1d): 一次元有限要素法
+            reaction (Callable[[NDArray], NDArray]): 反応項`f(u)`
+            derivative (Callable[[NDArray], NDArray]): 反応項の導関数`f'(u)`
+            tol (float, optional): 残差の最大ノルムに対する収束判定値（右辺の大きさに対する相対値）. Defaults to 1e-10.
+            max_iter (int, optional): 最大反復回数. Defaults to 50.
+            update_interval (int, optional): Jacobi行列を分解し直す反復間隔. Defaults to 1.
+
+        Raises:
+            ValueError: 反復間隔update_intervalが1未満の場合に発生
+        """
+        if update_interval < 1:
+            message = "The interval `update_interval` must be an integer greater than or equal to 1."
+            raise ValueError(message)
+        self.fem = fem
+        self.reaction = reaction
+        self.derivative = derivative
+        self.tol = tol
+        self.max_iter = max_iter
+        self.update_interval = update_interval
+        self._indptr, self._indices, self._laplacian, self._term = fem._shared_structure()
+        self.residual_norms: List[float] = list()
+
+    @property
+    def n_iter(self) -> int:
+        """直前の求解における反復回数"""
+        return max(len(self.residual_norms) - 1, 0)
+
+    def solve(self, rhs: NDArray, values: NDArray, u0: NDArray | None = None) -> NDArray:
+        """非線形方程式を解く関数
+
+        Args:
+            rhs (NDArray): 外力項の右辺ベクトル（`fem.term(s)`など）
+            values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値）
+            u0 (NDArray | None, optional): 初期値（Noneの場合は0）. Defaults to None.
+
+        Raises:
+            RuntimeError: 最大反復回数以内に収束しなかった場合に発生
+
+        Returns:
+            NDArray: 解ベクトル
+        """
+        n_node = self.fem.mesh.n_node
+        shape = (n_node, n_node)
+        stiffness = csr_matrix((self._laplacian, self._indices, self._indptr), shape=shape)
+        mass = csr_matrix((self._term, self._indices, self._indptr), shape=shape)
+        dirichlet = self.fem._boundary_index(BoundaryCondition.DIRICHLET)
+        positions = _dirichlet_positions(stiffness, dirichlet)
+
+        load = np.array(rhs, dtype=float)
+        self.fem.implement_neumann(load, values)
+        scale = max(1.0, float(np.max(np.abs(load))))
+
+        u = np.zeros(n_node) if u0 is None else np.array(u0, dtype=float)
+        u[dirichlet] = values[dirichlet]
+        factorization: BandedLU | SuperLU | None = None
+        self.residual_norms = list()
+        for iteration in range(self.max_iter + 1):
+            residual = stiffness.dot(u) + mass.dot(self.reaction(u)) - load
+            residual[dirichlet] = 0.0
+            self.residual_norms.append(float(np.max(np.abs(residual))))
+            if self.residual_norms[-1] <= self.tol * scale:
+                return u
+            if iteration == self.max_iter:
+                break
+            if factorization is None or iteration % self.update_interval == 0:
+                data = self._laplacian + self._term * self.derivative(u)[self._indices]
+                _zero_dirichlet_entries(data, positions)
+                jacobian = csr_matrix((data, self._indices, self._indptr), shape=shape)
+                factorization = factorize(jacobian, self.fem._bandwidth)
+            u -= factorization.solve(residual)
+
+        message = f"Newton iteration did not converge within {self.max_iter} iterations."
+        raise RuntimeError(message)
@@ -0,0 +1,176 @@
+import hashlib
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Hashable, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from module.discretization import LineMeshLagrange, Mesh1D
+
+Matrices = Tuple[csr_matrix, csr_matrix]
+"""Laplace作用素と一般的な項に対応する行列の組"""
+
+
+class OperatorCache:
+    """メッシュの種類と形状をキーとして組み立て済みの行列を共有するLRUキャッシュ"""
+
+    def __init__(self, maxsize: int = 16, max_bytes: int | None = None, directory: Path | str | None = None) -> None:
+        """メッシュの種類と形状をキーとして組み立て済みの行列を共有するLRUキャッシュ
+
+        同じ種類・節点数・領域のメッシュから作られた`Fem1d`の間で, Laplace作用素と一般的な項に対応する行列を共有する.
+        共有する行列は書き込み不可である. 保持する行列の組の数または合計バイト数が上限を超えると,
+        最も長く使われていない組を破棄する. `directory`を与えると行列をディレクトリにも保存し,
+        メモリ上にない行列はディレクトリからメモリマップで読み込む（ディレクトリ内のファイルは破棄しない）.
+
+        Args:
+            maxsize (int, optional): 保持する行列の組の最大数. Defaults to 16.
+            max_bytes (int | None, optional): 保持する行列の合計バイト数の上限（Noneの場合は制限なし）. Defaults to None.
+            directory (Path | str | None, optional): 行列の保存先のディレクトリ. Defaults to None.
+
+        Raises:
+            ValueError: 最大数maxsizeまたは上限max_bytesが負の場合に発生
+        """
+        if maxsize < 0:
+            message = "The cache size `maxsize` must be a non-negative integer."
+            raise ValueError(message)
+        if max_bytes is not None and max_bytes < 0:
+            message = "The byte limit `max_bytes` must be a non-negative integer."
+            raise ValueError(message)
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._directory = None if directory is None else Path(directory)
+        self._entries: OrderedDict[Hashable, Tuple[Matrices, int]] = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """保持する行列の組の最大数"""
+        return self._maxsize
+
+    @property
+    def nbytes(self) -> int:
+        """保持している行列の合計バイト数"""
+        return self._nbytes
+
+    @property
+    def directory(self) -> Path | None:
+        """行列の保存先のディレクトリ"""
+        return self._directory
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, mesh: Mesh1D) -> bool:
+        return mesh_key(mesh) in self._entries
+
+    def matrices(self, mesh: Mesh1D, assemble: Callable[[], Matrices]) -> Matrices:
+        """メッシュに対応する行列を取得する関数
+
+        メモリ上, ディレクトリ上の順に探し, どちらにもなければ`assemble`で組み立てて登録する.
+
+        Args:
+            mesh (Mesh1D): メッシュデータ
+            assemble (Callable[[], Matrices]): 行列を組み立てる関数
+
+        Returns:
+            Matrices: 書き込み不可のLaplace作用素と一般的な項に対応する行列
+        """
+        key = mesh_key(mesh)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+        matrices = self._load(key)
+        if matrices is None:
+            self.misses += 1
+            laplacian, term = assemble()
+            matrices = (_freeze(laplacian), _freeze(term))
+            self._save(key, matrices)
+        else:
+            self.hits += 1
+        self._put(key, matrices)
+        return matrices
+
+    def clear(self) -> None:
+        """メモリ上の行列を全て破棄する関数（ディレクトリ内のファイルは破棄しない）"""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _put(self, key: Hashable, matrices: Matrices) -> None:
+        """行列を登録し, 上限を超えた分を古い順に破棄する関数
+
+        Args:
+            key (Hashable): キャッシュのキー
+            matrices (Matrices): 行列の組
+        """
+        nbytes = sum(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes for matrix in matrices)
+        self._entries[key] = (matrices, nbytes)
+        self._nbytes += nbytes
+        while self._entries and (
+            len(self._entries) > self._maxsize or (self._max_bytes is not None and self._nbytes > self._max_bytes)
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted
+
+    def _path(self, key: Hashable) -> Path | None:
+        """キーに対応する保存先のディレクトリ"""
+        if self._directory is None:
+            return None
+        return self._directory / hashlib.sha1(repr(key).encode("utf8")).hexdigest()
+
+    def _load(self, key: Hashable) -> Matrices | None:
+        """ディレクトリから行列を読み込む関数（保存されていない場合はNone）"""
+        from module.storage import load_matrix
+
+        path = self._path(key)
+        if path is None or not path.is_dir():
+            return None
+        return load_matrix(path / "laplacian"), load_matrix(path / "term")
+
+    def _save(self, key: Hashable, matrices: Matrices) -> None:
+        """行列をディレクトリに保存する関数
+
+        一時ディレクトリに書き出した後で名前を変更するため, 他のプロセスが書き込み途中の行列を読み込むことはない.
+        """
+        from module.storage import save_matrix
+
+        path = self._path(key)
+        if path is None or path.is_dir():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=path.parent))
+        save_matrix(tmp_dir / "laplacian", matrices[0])
+        save_matrix(tmp_dir / "term", matrices[1])
+        try:
+            tmp_dir.rename(path)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def mesh_key(mesh: Mesh1D) -> Hashable:
+    """メッシュの種類と形状から決まるキャッシュのキー
+
+    不等間隔のメッシュ（`from_vertices`で生成したメッシュなど）を区別するため, 節点座標のハッシュ値を含める.
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Returns:
+        Hashable: メッシュの種類, 節点数, 領域の下限・上限, 多項式の次数, 節点座標のハッシュ値の組
+    """
+    degree = mesh.degree if isinstance(mesh, LineMeshLagrange) else None
+    digest = hashlib.sha1(np.ascontiguousarray(mesh.x, dtype=float).tobytes()).hexdigest()
+    return (type(mesh).__name__, mesh.n_node, float(mesh.x[0]), float(mesh.x[-1]), degree, digest)
+
+
+def _freeze(matrix: csr_matrix) -> csr_matrix:
+    """行列の非零成分・非零構造の配列を書き込み不可にする関数"""
+    for array in (matrix.data, matrix.indices, matrix.indptr):
+        array.setflags(write=False)
+    return matrix
@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Sequence
+
+import numpy as np
+from numpy.linalg import LinAlgError
+from numpy.typing import NDArray
+from scipy.linalg.lapack import dpttrf, dtbtrs
+
+from module.discretization import BoundaryCondition
+
+_FILES = ("x", "diagonal", "offdiagonal", "rhs", "solution")
+"""作業ディレクトリに作る`.npy`ファイル"""
+
+
+def out_of_core_solve(
+    n_node: int,
+    xmin: float,
+    xmax: float,
+    source: Callable[[NDArray], NDArray],
+    boundary_values: Sequence[float],
+    directory: Path | str,
+    alpha: float = 1.0,
+    beta: float = 0.0,
+    conditions: List[str] | None = None,
+    chunk_size: int = 1_000_000,
+) -> NDArray:
+    """一様な一次要素メッシュ上の`-alpha u'' + beta u = source`をメモリに載せずに解く関数
+
+    節点座標の生成, 係数行列の対角・副対角成分と右辺ベクトルの組み立てを`chunk_size`節点ずつ行い,
+    作業ディレクトリのメモリマップされた`.npy`ファイル（節点座標は`x.npy`）へ直接書き込む. その後, Thomas法の前進消去と後退代入を
+    それぞれファイルを一度ずつ走査して行い, 解を`solution.npy`へ書き込む. 係数行列は対称であるため副対角成分は一本のみ保存する.
+    各チャンクの消去はLAPACKの`dpttrf`（三重対角行列のLDL^T分解）と`dtbtrs`（二重対角行列の求解）で行い,
+    チャンク間では直前の節点のピボットと前進消去後の値のみを受け渡すため, 常駐するデータはO(chunk_size)である.
+    Dirichlet境界条件は境界節点を消去して課すため, 係数行列は対称正定値のまま保たれる.
+
+    Args:
+        n_node (int): 節点数（2以上）
+        xmin (float): 領域の下限
+        xmax (float): 領域の上限
+        source (Callable[[NDArray], NDArray]): 外力項（節点座標を引数に取る）
+        boundary_values (Sequence[float]): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値）
+        directory (Path | str): 作業ディレクトリ（存在しない場合は作成する）
+        alpha (float, optional): Laplace作用素に対応する行列の係数（正）. Defaults to 1.0.
+        beta (float, optional): 一般的な項に対応する行列の係数（0以上）. Defaults to 0.0.
+        conditions (List[str] | None, optional): 一次元領域に課された境界条件. Defaults to None.
+        chunk_size (int, optional): 一度に処理する節点数. Defaults to 1_000_000.
+
+    Raises:
+        ValueError: 節点数が2未満, チャンクの大きさが1未満, 境界値データの個数が2でない場合に発生
+        ValueError: 係数行列が対称正定値とならない係数（`alpha <= 0`または`beta < 0`）の場合に発生
+        LinAlgError: 係数行列が特異な場合（Neumann境界条件で`beta`が0の場合など）に発生
+
+    Returns:
+        NDArray: 解ベクトル（`solution.npy`を書き込み不可でメモリマップした配列）
+    """
+    if n_node < 2:
+        message = "The number of nodes `n_node` must be an integer greater than or equal to 2."
+        raise ValueError(message)
+    if chunk_size < 1:
+        message = "The chunk size `chunk_size` must be an integer greater than or equal to 1."
+        raise ValueError(message)
+    if len(boundary_values) != 2:
+        message = "The number of boundary values must be 2."
+        raise ValueError(message)
+    if not (alpha > 0.0 and beta >= 0.0):
+        message = "The out-of-core solver requires `alpha` > 0 and `beta` >= 0 (symmetric positive definite)."
+        raise ValueError(message)
+    conditions = [BoundaryCondition.DIRICHLET] * 2 if conditions is None else conditions
+    labels = BoundaryCondition.from_strings(conditions)
+    is_dirichlet = [label == BoundaryCondition.DIRICHLET for label in labels]
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    arrays: Dict[str, np.memmap] = {
+        name: np.lib.format.open_memmap(
+            directory / f"{name}.npy", mode="w+", dtype=float, shape=(n_node - 1 if name == "offdiagonal" else n_node,)
+        )
+        for name in _FILES
+    }
+    _assemble(arrays, n_node, xmin, xmax, source, alpha, beta, chunk_size)
+    _apply_boundary_conditions(arrays, is_dirichlet, [float(value) for value in boundary_values])
+    _forward_elimination(arrays, chunk_size)
+    _back_substitution(arrays, chunk_size)
+    for array in arrays.values():
+        array.flush()
+    del arrays
+    solution: NDArray = np.load(directory / "solution.npy", mmap_mode="r")
+    return solution
+
+
+def _assemble(
+    arrays: Mapping[str, NDArray],
+    n_node: int,
+    xmin: float,
+    xmax: float,
+    source: Callable[[NDArray], NDArray],
+    alpha: float,
+    beta: float,
+    chunk_size: int,
+) -> None:
+    """節点座標, 係数行列の対角・副対角成分と右辺ベクトルをチャンクごとに組み立てる関数
+
+    節点座標は`np.linspace`と同じく`xmin + i * h`（最後の節点は`xmax`）で生成して`x`へ書き込み, 外力項の節点値から
+    一般的な項に対応する行列との積`M f`を両隣の節点値を用いて計算する.
+
+    Args:
+        arrays (Mapping[str, NDArray]): メモリマップされた配列
+        n_node (int): 節点数
+        xmin (float): 領域の下限
+        xmax (float): 領域の上限
+        source (Callable[[NDArray], NDArray]): 外力項
+        alpha (float): Laplace作用素に対応する行列の係数
+        beta (float): 一般的な項に対応する行列の係数
+        chunk_size (int): 一度に処理する節点数
+    """
+    h = (xmax - xmin) / (n_node - 1)
+    diagonal, offdiagonal, rhs = arrays["diagonal"], arrays["offdiagonal"], arrays["rhs"]
+    for start in range(0, n_node, chunk_size):
+        stop = min(start + chunk_size, n_node)
+        lo, hi = max(start - 1, 0), min(stop + 1, n_node)
+        x = xmin + np.arange(lo, hi) * h
+        if hi == n_node:
+            x[-1] = xmax
+        f = np.zeros(stop - start + 2)  # 節点start-1からstopまでの外力項の値（領域外は0）
+        f[lo - start + 1 : hi - start + 1] = np.asarray(source(x), dtype=float)
+        arrays["x"][start:stop] = x[start - lo : stop - lo]
+        weight = np.full(stop - start, 2.0)
+        if start == 0:
+            weight[0] = 1.0
+        if stop == n_node:
+            weight[-1] = 1.0
+        diagonal[start:stop] = weight * (alpha / h + beta * h / 3.0)
+        offdiagonal[start : min(stop, n_node - 1)] = -alpha / h + beta * h / 6.0
+        rhs[start:stop] = (h / 3.0) * weight * f[1:-1] + (h / 6.0) * (f[:-2] + f[2:])
+
+
+def _apply_boundary_conditions(arrays: Mapping[str, NDArray], is_dirichlet: List[bool], values: List[float]) -> None:
+    """境界条件を課す関数（Dirichlet境界の節点は対称性を保つように消去する）
+
+    Args:
+        arrays (Mapping[str, NDArray]): メモリマップされた配列
+        is_dirichlet (List[bool]): 左右の境界がDirichlet境界か否か
+        values (List[float]): 左右の境界値データ
+    """
+    diagonal, offdiagonal, rhs = arrays["diagonal"], arrays["offdiagonal"], arrays["rhs"]
+    n_node = diagonal.shape[0]
+    for side, (node, neighbour, coupling, normal) in enumerate(((0, 1, 0, -1.0), (n_node - 1, n_node - 2, -1, 1.0))):
+        if is_dirichlet[side]:
+            rhs[neighbour] -= offdiagonal[coupling] * values[side]
+            diagonal[node] = 1.0
+            rhs[node] = values[side]
+            offdiagonal[coupling] = 0.0
+        else:
+            rhs[node] += normal * values[side]
+
+
+def _forward_elimination(arrays: Mapping[str, NDArray], chunk_size: int) -> None:
+    """前進消去をチャンクごとに行う関数
+
+    `diagonal`をピボット`D_i`で, `offdiagonal`を単位下三角因子の成分`l_i = c_i / D_i`で,
+    `rhs`を`L D y = b`の解`y`で上書きする.
+
+    Args:
+        arrays (Mapping[str, NDArray]): メモリマップされた配列
+        chunk_size (int): 一度に処理する節点数
+
+    Raises:
+        LinAlgError: 係数行列が特異な場合に発生
+    """
+    diagonal, offdiagonal, rhs = arrays["diagonal"], arrays["offdiagonal"], arrays["rhs"]
+    n_node = diagonal.shape[0]
+    pivot = coupling = forward = 0.0
+    for start in range(0, n_node, chunk_size):
+        stop = min(start + chunk_size, n_node)
+        d = np.array(diagonal[start:stop])
+        e = np.array(offdiagonal[start : stop - 1])
+        b = np.array(rhs[start:stop])
+        if start > 0:
+            factor = coupling / pivot
+            offdiagonal[start - 1] = factor
+            d[0] -= coupling * factor
+            b[0] -= factor * forward
+        if d.size > 1:
+            d, e, info = dpttrf(d, e)
+        else:
+            info = 0 if d[0] > 0.0 else 1
+        if info != 0:
+            message = f"The coefficient matrix is singular or not positive definite (pivot {start + info - 1})."
+            raise LinAlgError(message)
+        ab = np.zeros((2, stop - start))
+        ab[1, :-1] = e
+        z, _ = dtbtrs(ab, b[:, np.newaxis], uplo="L", diag="U")
+        diagonal[start:stop] = d
+        offdiagonal[start : stop - 1] = e
+        rhs[start:stop] = z[:, 0] / d
+        pivot, forward = float(d[-1]), float(z[-1, 0])
+        if stop < n_node:
+            coupling = float(offdiagonal[stop - 1])
+
+
+def _back_substitution(arrays: Mapping[str, NDArray], chunk_size: int) -> None:
+    """後退代入をチャンクごとに末尾から行い, 解を`solution`へ書き込む関数
+
+    Args:
+        arrays (Mapping[str, NDArray]): メモリマップされた配列
+        chunk_size (int): 一度に処理する節点数
+    """
+    offdiagonal, rhs, solution = arrays["offdiagonal"], arrays["rhs"], arrays["solution"]
+    n_node = rhs.shape[0]
+    following = 0.0
+    for start in reversed(range(0, n_node, chunk_size)):
+        stop = min(start + chunk_size, n_node)
+        b = np.array(rhs[start:stop])
+        if stop < n_node:
+            b[-1] -= offdiagonal[stop - 1] * following
+        ab = np.zeros((2, stop - start))
+        ab[0, 1:] = offdiagonal[start : stop - 1]
+        x, _ = dtbtrs(ab, b[:, np.newaxis], uplo="U", diag="U")
+        solution[start:stop] = x[:, 0]
+        following = float(x[0, 0])
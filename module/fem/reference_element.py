@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def lagrange_nodes(degree: int) -> NDArray:
+    """参照要素[0, 1]上のLagrange補間節点
+
+    節点の並びは両端点（0, 1）の後に内部節点を昇順に並べたものであり, メッシュの要素節点番号の並びと一致する.
+
+    Args:
+        degree (int): 多項式の次数
+
+    Returns:
+        NDArray: 補間節点の座標
+    """
+    interior = np.arange(1, degree) / degree
+    return np.concatenate(([0.0, 1.0], interior))
+
+
+def lagrange_basis(degree: int, xi: NDArray) -> Tuple[NDArray, NDArray]:
+    """参照要素[0, 1]上のLagrange基底関数とその導関数の値
+
+    Args:
+        degree (int): 多項式の次数
+        xi (NDArray): 評価点の座標
+
+    Returns:
+        Tuple[NDArray, NDArray]: 基底関数の値と導関数の値（形状は共に(評価点数, 節点数)）
+    """
+    nodes = lagrange_nodes(degree)
+    xi = np.asarray(xi, dtype=float)
+    n_local = nodes.size
+    values = np.ones((xi.size, n_local))
+    derivatives = np.zeros((xi.size, n_local))
+    for a in range(n_local):
+        others = np.delete(nodes, a)
+        denominator = np.prod(nodes[a] - others)
+        factors = xi[:, np.newaxis] - others[np.newaxis, :]
+        values[:, a] = np.prod(factors, axis=1) / denominator
+        for m in range(others.size):
+            derivatives[:, a] += np.prod(np.delete(factors, m, axis=1), axis=1) / denominator
+    return values, derivatives
+
+
+@lru_cache(maxsize=None)
+def lagrange_reference_matrices(degree: int) -> Tuple[NDArray, NDArray]:
+    """Lagrange要素の参照要素行列をGauss求積で計算する関数
+
+    次数ごとに一度だけ計算してキャッシュする. 返す配列は書き込み不可である.
+
+    Args:
+        degree (int): 多項式の次数
+
+    Raises:
+        ValueError: 次数degreeが1未満の場合に発生
+
+    Returns:
+        Tuple[NDArray, NDArray]: Laplace作用素（1/h倍前）と一般的な項（h倍前）に対応する参照要素行列
+    """
+    if degree < 1:
+        message = "The polynomial degree `degree` must be an integer greater than or equal to 1."
+        raise ValueError(message)
+    points, gauss_weights = np.polynomial.legendre.leggauss(degree + 1)
+    xi = 0.5 * (points + 1.0)
+    weights = 0.5 * gauss_weights
+    values, derivatives = lagrange_basis(degree, xi)
+    laplacian = np.einsum("q,qa,qb->ab", weights, derivatives, derivatives)
+    term = np.einsum("q,qa,qb->ab", weights, values, values)
+    laplacian.setflags(write=False)
+    term.setflags(write=False)
+    return laplacian, term
@@ -0,0 +1,120 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.fft import dct, dst, idct, idst
+
+from module.discretization import BoundaryCondition, LineMesh, Mesh1D
+
+
+def spectral_solve(
+    mesh: Mesh1D, rhs: NDArray, values: NDArray, alpha: ArrayLike = 1.0, beta: ArrayLike = 0.0
+) -> NDArray:
+    """一様な一次要素メッシュ上で係数行列`alpha * K + beta * M`の境界値問題を離散正弦・余弦変換で解く関数
+
+    一様メッシュの一次要素では, Dirichlet境界条件を課した内部節点の`K`と`M`はDST-Iで,
+    両端にNeumann境界条件を課した`K`と`M`は重み`diag(1/2, 1, ..., 1, 1/2)`を除いてDCT-Iで同時に対角化される.
+    固有値は解析的に求まるため, 行列の組み立てや分解を行わずにO(n log n)で解ける.
+    (節点数, ベクトル数)の二次元配列を与えると全ての列を一度に解き, `alpha`と`beta`に列ごとの値の配列
+    （形状は(ベクトル数,)）を与えると列ごとに異なる係数（Helmholtz方程式の波数など）で解く.
+    右辺ベクトルが一次元で`alpha`や`beta`が配列の場合は, 共通の右辺ベクトルを全ての係数について解く.
+
+    Args:
+        mesh (Mesh1D): 一様な一次要素メッシュ（両端の境界条件が共にDirichletまたは共にNeumann）
+        rhs (NDArray): 境界条件を課す前の右辺ベクトル
+        values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値, rhsと同じ形状）
+        alpha (ArrayLike, optional): Laplace作用素に対応する行列の係数. Defaults to 1.0.
+        beta (ArrayLike, optional): 一般的な項に対応する行列の係数. Defaults to 0.0.
+
+    Raises:
+        ValueError: 一次要素メッシュでない場合, 節点が等間隔でない場合, 境界条件が混在する場合に発生
+        ValueError: 係数行列が特異な場合（Neumann境界条件で`beta`が0の場合など）に発生
+
+    Returns:
+        NDArray: 解ベクトル（形状は(節点数,)または(節点数, ベクトル数)）
+    """
+    h = _uniform_spacing(mesh)
+    alpha = np.asarray(alpha, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+    shape = rhs.shape[:1] + np.broadcast_shapes(rhs.shape[1:], alpha.shape, beta.shape)
+    rhs = np.array(np.broadcast_to(rhs.reshape(rhs.shape + (1,) * (len(shape) - rhs.ndim)), shape))
+    values = np.asarray(values, dtype=float)
+    values = np.broadcast_to(values.reshape(values.shape + (1,) * (len(shape) - values.ndim)), shape)
+    trailing = (1,) * (len(shape) - 1)
+
+    conditions = set(BoundaryCondition.from_strings(mesh.conditions))
+    if conditions == {BoundaryCondition.DIRICHLET}:
+        n_interior = mesh.n_node - 2
+        solution = np.empty(shape)
+        solution[0], solution[-1] = values[0], values[-1]
+        if n_interior == 0:
+            return solution
+        theta = np.pi * np.arange(1, n_interior + 1) / (n_interior + 1)
+        diagonal = _eigenvalues(theta, h, alpha, beta, trailing)
+        coupling = -alpha / h + beta * h / 6.0
+        interior = rhs[1:-1]
+        interior[0] -= coupling * values[0]
+        interior[-1] -= coupling * values[-1]
+        solution[1:-1] = idst(dst(interior, type=1, axis=0) / diagonal, type=1, axis=0)
+        return solution
+    elif conditions == {BoundaryCondition.NEUMANN}:
+        theta = np.pi * np.arange(mesh.n_node) / (mesh.n_node - 1)
+        diagonal = _eigenvalues(theta, h, alpha, beta, trailing)
+        for i, normal in zip(mesh.boundary_nodes, mesh.unit_normals):
+            rhs[i] += normal * values[i]
+        rhs[0] *= 2.0
+        rhs[-1] *= 2.0
+        return np.asarray(idct(dct(rhs, type=1, axis=0) / diagonal, type=1, axis=0))
+    else:
+        message = "The spectral solver requires the same boundary condition (Dirichlet or Neumann) at both ends."
+        raise ValueError(message)
+
+
+def _uniform_spacing(mesh: Mesh1D) -> float:
+    """一様な一次要素メッシュの節点間隔を求める関数
+
+    Args:
+        mesh (Mesh1D): メッシュデータ
+
+    Raises:
+        ValueError: 一次要素メッシュでない場合または節点が等間隔でない場合に発生
+
+    Returns:
+        float: 節点間隔
+    """
+    if not isinstance(mesh, LineMesh):
+        message = "The spectral solver supports only `LineMesh`."
+        raise ValueError(message)
+    spacing = np.diff(mesh.x)
+    h = float(spacing[0])
+    if not np.allclose(spacing, h, rtol=1e-8, atol=0.0):
+        message = "The spectral solver requires uniformly spaced nodes."
+        raise ValueError(message)
+    return h
+
+
+def _eigenvalues(theta: NDArray, h: float, alpha: NDArray, beta: NDArray, trailing: Tuple[int, ...]) -> NDArray:
+    """正弦・余弦変換で対角化した`alpha * K + beta * M`の固有値
+
+    Args:
+        theta (NDArray): 各モードの位相`πk/(N+1)`または`πk/(N-1)`
+        h (float): 節点間隔
+        alpha (NDArray): Laplace作用素に対応する行列の係数
+        beta (NDArray): 一般的な項に対応する行列の係数
+        trailing (Tuple[int, ...]): 右辺ベクトルの二次元目以降に合わせるための形状
+
+    Raises:
+        ValueError: 固有値に0が含まれる（係数行列が特異な）場合に発生
+
+    Returns:
+        NDArray: 固有値（形状は(モード数,)または(モード数, ベクトル数)）
+    """
+    theta = theta.reshape(theta.shape + trailing)
+    stiffness = (2.0 - 2.0 * np.cos(theta)) / h
+    mass = h * (2.0 + np.cos(theta)) / 3.0
+    diagonal = alpha * stiffness + beta * mass
+    if np.any(diagonal == 0.0):
+        message = "The coefficient matrix is singular (e.g. pure Neumann conditions with `beta` = 0)."
+        raise ValueError(message)
+    return np.asarray(diagonal)
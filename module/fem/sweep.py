@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix
+
+from module.discretization import BoundaryCondition
+
+from .banded import factorize
+from .fem1d import Fem1d, _implement_dirichlet_compressed
+
+_WORKER_STATE: Dict[str, Any] = dict()
+"""ワーカープロセスで共有する行列データ"""
+
+
+def helmholtz_sweep(
+    fem: Fem1d,
+    wavenumbers: NDArray,
+    rhs: NDArray,
+    values: NDArray,
+    n_workers: int | None = None,
+) -> NDArray:
+    """複数の波数についてHelmholtz方程式`-u'' - k^2 u = f`を解く関数
+
+    Laplace作用素に対応する行列`K`と一般的な項に対応する行列`M`は共通の非零構造を持つため,
+    非零成分の配列のみを`K - k^2 M`として更新し, 境界条件の適用と帯行列のLU分解を波数ごとに行う.
+    波数はチャンクに分割され, プロセスプールで並列に処理される.
+
+    Args:
+        fem (Fem1d): 一次元有限要素法
+        wavenumbers (NDArray): 波数の配列
+        rhs (NDArray): 境界条件を課す前の右辺ベクトル（全ての波数で共通）
+        values (NDArray): 境界値データ（Dirichlet境界では関数値, Neumann境界では法線方向微分値）
+        n_workers (int | None, optional): ワーカープロセス数（Noneの場合はCPU数）. Defaults to None.
+
+    Raises:
+        ValueError: Laplace作用素に対応する行列と一般的な項に対応する行列の非零構造が異なる場合に発生
+
+    Returns:
+        NDArray: 解の配列（形状は(波数の数, 節点数)）
+    """
+    indptr, indices, laplacian, term = fem._shared_structure()
+    rhs = np.array(rhs, dtype=float)
+    fem.implement_neumann(rhs, values)
+    state = {
+        "indptr": indptr,
+        "indices": indices,
+        "laplacian": laplacian,
+        "term": term,
+        "rhs": rhs,
+        "values": np.asarray(values, dtype=float),
+        "dirichlet": fem._boundary_index(BoundaryCondition.DIRICHLET),
+        "bandwidth": fem._bandwidth,
+    }
+
+    wavenumbers = np.asarray(wavenumbers, dtype=float).ravel()
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, wavenumbers.size))
+    if n_workers == 1:
+        _initialize_worker(state)
+        try:
+            return _solve_chunk(wavenumbers)
+        finally:
+            _WORKER_STATE.clear()
+
+    chunks: List[NDArray] = np.array_split(wavenumbers, 4 * n_workers)
+    chunks = [chunk for chunk in chunks if chunk.size > 0]
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_initialize_worker, initargs=(state,)) as executor:
+        results = list(executor.map(_solve_chunk, chunks))
+    return np.concatenate(results, axis=0)
+
+
+def _initialize_worker(state: Dict[str, Any]) -> None:
+    """ワーカープロセスに共有データを登録する関数
+
+    Args:
+        state (Dict[str, Any]): 行列データ
+    """
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+
+
+def _solve_chunk(wavenumbers: NDArray) -> NDArray:
+    """波数のチャンクについてHelmholtz方程式を解く関数
+
+    Args:
+        wavenumbers (NDArray): 波数の配列
+
+    Returns:
+        NDArray: 解の配列（形状は(波数の数, 節点数)）
+    """
+    state = _WORKER_STATE
+    n_node = state["rhs"].shape[0]
+    solutions = np.empty((wavenumbers.size, n_node), dtype=float)
+    for n, k in enumerate(wavenumbers):
+        data = state["laplacian"] - k**2 * state["term"]
+        coefficient = csr_matrix((data, state["indices"], state["indptr"]), shape=(n_node, n_node))
+        rhs = state["rhs"].copy()
+        _implement_dirichlet_compressed(coefficient, rhs, state["dirichlet"], state["values"])
+        solutions[n] = factorize(coefficient, state["bandwidth"]).solve(rhs)
+    return solutions
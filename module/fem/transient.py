@@ -0,0 +1,131 @@
+from typing import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from module.discretization import BoundaryCondition
+
+from .fem1d import Fem1d
+
+
+class ThetaMethod:
+    """θ法による一次元熱方程式`u_t - u_xx = f`の時間積分"""
+
+    def __init__(self, fem: Fem1d, dt: float, theta: float = 0.5) -> None:
+        """θ法による一次元熱方程式の時間積分
+
+        係数行列`M + θΔt K`の分解は`Fem1d`のキャッシュに保持され, 全時間ステップで再利用される.
+        θ=1で後退Euler法, θ=0.5でCrank-Nicolson法となる.
+
+        Args:
+            fem (Fem1d): 一次元有限要素法
+            dt (float): 時間刻み幅
+            theta (float, optional): θ法のパラメータ. Defaults to 0.5.
+
+        Raises:
+            ValueError: 時間刻み幅dtが0以下の場合に発生
+            ValueError: パラメータthetaが0未満または1より大きい場合に発生
+        """
+        if dt <= 0.0:
+            message = "The time step `dt` must be positive."
+            raise ValueError(message)
+        if not 0.0 <= theta <= 1.0:
+            message = "The parameter `theta` must be in the range [0, 1]."
+            raise ValueError(message)
+        self.fem = fem
+        self._dt = float(dt)
+        self._theta = float(theta)
+
+    @property
+    def dt(self) -> float:
+        """時間刻み幅"""
+        return self._dt
+
+    @property
+    def theta(self) -> float:
+        """θ法のパラメータ"""
+        return self._theta
+
+    def steps(
+        self,
+        u0: NDArray,
+        n_step: int,
+        t0: float = 0.0,
+        source: Callable[[float], NDArray] | None = None,
+        values: Callable[[float], NDArray] | None = None,
+    ) -> Iterator[NDArray]:
+        """各時間ステップの解を順に生成するジェネレータ
+
+        解の履歴は保持しないため, 使用メモリは時間ステップ数によらない.
+
+        Args:
+            u0 (NDArray): 初期値
+            n_step (int): 時間ステップ数
+            t0 (float, optional): 初期時刻. Defaults to 0.0.
+            source (Callable[[float], NDArray] | None, optional): 時刻を受け取り節点での外力項を返す関数. Defaults to None.
+            values (Callable[[float], NDArray] | None, optional): 時刻を受け取り境界値データを返す関数. Defaults to None.
+
+        Yields:
+            Iterator[NDArray]: 時刻`t0 + (n + 1) * dt`における解
+        """
+        dt, theta = self._dt, self._theta
+        n_node = self.fem.mesh.n_node
+        neumann = self.fem._boundary_index(BoundaryCondition.NEUMANN)
+        zeros = np.zeros(n_node)
+
+        u = np.array(u0, dtype=float)
+        f_old = source(t0) if source is not None else zeros
+        v_old = values(t0) if values is not None else zeros
+        for n in range(n_step):
+            t = t0 + (n + 1) * dt
+            f_new = source(t) if source is not None else zeros
+            v_new = values(t) if values is not None else zeros
+
+            rhs = self.fem.term(u + dt * (theta * f_new + (1.0 - theta) * f_old))
+            if theta < 1.0:
+                rhs -= (1.0 - theta) * dt * self.fem.laplacian(u)
+            boundary = np.array(v_new, dtype=float)
+            boundary[neumann] = dt * (theta * v_new[neumann] + (1.0 - theta) * v_old[neumann])
+
+            u = self.fem.solve(rhs, boundary, alpha=theta * dt, beta=1.0)
+            f_old, v_old = f_new, v_new
+            yield u
+
+    def run(
+        self,
+        u0: NDArray,
+        n_step: int,
+        t0: float = 0.0,
+        source: Callable[[float], NDArray] | None = None,
+        values: Callable[[float], NDArray] | None = None,
+        out: NDArray | None = None,
+    ) -> NDArray:
+        """時間積分を行い, 解の履歴を配列に書き込む関数
+
+        `out`に`np.lib.format.open_memmap`などで作成したメモリマップ配列を渡すと,
+        解の履歴をメモリに保持せずにファイルへ書き出すことができる.
+
+        Args:
+            u0 (NDArray): 初期値
+            n_step (int): 時間ステップ数
+            t0 (float, optional): 初期時刻. Defaults to 0.0.
+            source (Callable[[float], NDArray] | None, optional): 時刻を受け取り節点での外力項を返す関数. Defaults to None.
+            values (Callable[[float], NDArray] | None, optional): 時刻を受け取り境界値データを返す関数. Defaults to None.
+            out (NDArray | None, optional): 書き込み先の配列（形状は(n_step + 1, 節点数)）. Defaults to None.
+
+        Raises:
+            ValueError: 書き込み先の配列の形状が不正な場合に発生
+
+        Returns:
+            NDArray: 解の履歴（形状は(n_step + 1, 節点数)）
+        """
+        shape = (n_step + 1, self.fem.mesh.n_node)
+        if out is None:
+            out = np.empty(shape, dtype=float)
+        elif out.shape != shape:
+            message = f"The shape of the array `out` must be {shape}, but it is {out.shape}."
+            raise ValueError(message)
+        out[0] = u0
+        for n, u in enumerate(self.steps(u0, n_step, t0, source, values), start=1):
+            out[n] = u
+        return out
@@ -0,0 +1,3 @@
+from .stats import Stats
+
+__all__ = ["Stats"]
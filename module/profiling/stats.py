@@ -0,0 +1,141 @@
+import time
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List
+
+Callback = Callable[[str, str, float], None]
+"""計測値を受け取るコールバックの型（種類, 名前, 値）"""
+
+_NULL_PHASE = nullcontext()
+"""計測が無効な場合に返す何もしないコンテキストマネージャ"""
+
+
+class Stats:
+    """処理段階ごとの時間・回数・確保バイト数の計測"""
+
+    TIMER = "timer"
+    """時間計測のラベル用文字列"""
+
+    COUNTER = "counter"
+    """回数計測のラベル用文字列"""
+
+    BYTES = "bytes"
+    """確保バイト数のラベル用文字列"""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """処理段階ごとの時間・回数・確保バイト数の計測
+
+        無効な場合は`phase`が共有の空のコンテキストマネージャを返し, `count`と`record_bytes`は何もしない.
+        処理段階の時間は`with`文の区間全体を計測するため, 処理段階を入れ子にすると外側の時間は内側の時間を含む.
+        `Fem1d`の処理段階は互いに重ならないように配置しているため, 各処理段階の時間を合計しても二重に数えない.
+
+        Args:
+            enabled (bool, optional): 計測を有効にするか否か. Defaults to True.
+        """
+        self.enabled = enabled
+        self.timers: Dict[str, float] = dict()
+        self.calls: Dict[str, int] = dict()
+        self.counters: Dict[str, int] = dict()
+        self.bytes: Dict[str, int] = dict()
+        self._callbacks: List[Callback] = list()
+
+    def phase(self, name: str) -> ContextManager:
+        """処理段階の時間を計測するコンテキストマネージャ
+
+        Args:
+            name (str): 処理段階の名前
+
+        Returns:
+            ContextManager: `with`文で用いるコンテキストマネージャ
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """回数を加算する関数
+
+        Args:
+            name (str): カウンタの名前
+            n (int, optional): 加算する回数. Defaults to 1.
+        """
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + n
+        self._notify(self.COUNTER, name, n)
+
+    def record_bytes(self, name: str, nbytes: int) -> None:
+        """確保したバイト数を記録する関数
+
+        Args:
+            name (str): 記録対象の名前
+            nbytes (int): バイト数
+        """
+        if not self.enabled:
+            return
+        self.bytes[name] = nbytes
+        self._notify(self.BYTES, name, nbytes)
+
+    def add_callback(self, callback: Callback) -> None:
+        """計測値を受け取るコールバックを登録する関数
+
+        Args:
+            callback (Callback): 種類（`Stats.TIMER`など）, 名前, 値を受け取る関数
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callback) -> None:
+        """登録したコールバックを削除する関数
+
+        Args:
+            callback (Callback): 削除するコールバック
+        """
+        self._callbacks.remove(callback)
+
+    def reset(self) -> None:
+        """計測値を全て破棄する関数"""
+        self.timers.clear()
+        self.calls.clear()
+        self.counters.clear()
+        self.bytes.clear()
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """計測値を辞書として取得する関数
+
+        Returns:
+            Dict[str, Dict]: 計測値
+        """
+        return {
+            "timers": dict(self.timers),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+            "bytes": dict(self.bytes),
+        }
+
+    def _add_time(self, name: str, elapsed: float) -> None:
+        """計測した時間を加算する関数"""
+        self.timers[name] = self.timers.get(name, 0.0) + elapsed
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self._notify(self.TIMER, name, elapsed)
+
+    def _notify(self, kind: str, name: str, value: float) -> None:
+        """登録したコールバックに計測値を渡す関数"""
+        for callback in self._callbacks:
+            callback(kind, name, value)
+
+
+class _Phase:
+    """処理段階の時間を計測するコンテキストマネージャ"""
+
+    __slots__ = ("_stats", "_name", "_start")
+
+    def __init__(self, stats: Stats, name: str) -> None:
+        self._stats = stats
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Phase":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stats._add_time(self._name, time.perf_counter() - self._start)
@@ -0,0 +1,3 @@
+from .binary import load_array, load_fem, load_matrix, load_mesh, save_array, save_fem, save_matrix, save_mesh
+
+__all__ = ["load_array", "load_fem", "load_matrix", "load_mesh", "save_array", "save_fem", "save_matrix", "save_mesh"]
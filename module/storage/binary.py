@@ -0,0 +1,221 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.sparse import csr_matrix, spmatrix
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange, Mesh1D
+from module.fem import Fem1d
+
+FORMAT_VERSION = 1
+"""保存形式のバージョン"""
+
+_METADATA = "metadata.json"
+"""メタデータのファイル名"""
+
+_MESH_TYPES: Dict[str, type] = {
+    "LineMesh": LineMesh,
+    "LineMeshHighOrder": LineMeshHighOrder,
+    "LineMeshLagrange": LineMeshLagrange,
+}
+"""保存できるメッシュの種類"""
+
+
+def save_array(path: Path | str, array: NDArray) -> None:
+    """配列（解ベクトルなど）を`.npy`形式で保存する関数
+
+    Args:
+        path (Path | str): 保存先のパス
+        array (NDArray): 保存する配列
+    """
+    np.save(Path(path), np.ascontiguousarray(array), allow_pickle=False)
+
+
+def load_array(path: Path | str, mmap: bool = True) -> NDArray:
+    """`save_array`で保存した配列を読み込む関数
+
+    `mmap`が真の場合はファイルを書き込み不可でメモリマップするため, 配列の大きさによらず即座に読み込みが終わる.
+
+    Args:
+        path (Path | str): 保存先のパス
+        mmap (bool, optional): メモリマップするか否か. Defaults to True.
+
+    Returns:
+        NDArray: 配列
+    """
+    array: NDArray = np.load(Path(path), mmap_mode="r" if mmap else None, allow_pickle=False)
+    return array
+
+
+def save_mesh(path: Path | str, mesh: Mesh1D) -> None:
+    """メッシュをディレクトリに保存する関数
+
+    節点座標と要素節点番号を`.npy`形式で, 種類・境界条件・次数をJSON形式で保存する.
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        mesh (Mesh1D): メッシュデータ
+
+    Raises:
+        ValueError: 保存できない種類のメッシュを入力した場合に発生
+    """
+    name = type(mesh).__name__
+    if _MESH_TYPES.get(name) is not type(mesh):
+        message = f"The mesh type `{name}` cannot be saved."
+        raise ValueError(message)
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    save_array(path / "x.npy", mesh.x)
+    save_array(path / "element_nodes.npy", mesh.element_nodes)
+    metadata: Dict[str, Any] = {"conditions": list(mesh.conditions)}
+    if isinstance(mesh, LineMeshLagrange):
+        metadata["degree"] = mesh.degree
+    _write_metadata(path, name, metadata)
+
+
+def load_mesh(path: Path | str, mmap: bool = True) -> Mesh1D:
+    """`save_mesh`で保存したメッシュを読み込む関数
+
+    節点座標と要素節点番号は再計算せず, 保存した配列（`mmap`が真の場合は書き込み不可のメモリマップ）をそのまま用いる.
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        mmap (bool, optional): メモリマップするか否か. Defaults to True.
+
+    Raises:
+        ValueError: メッシュ以外のデータまたは対応していない形式のデータを入力した場合に発生
+
+    Returns:
+        Mesh1D: メッシュデータ
+    """
+    path = Path(path)
+    name, metadata = _read_metadata(path)
+    if name not in _MESH_TYPES:
+        message = f"The directory `{path}` does not contain a mesh."
+        raise ValueError(message)
+    x = load_array(path / "x.npy", mmap)
+    element_nodes = load_array(path / "element_nodes.npy", mmap)
+    conditions: List[str] = metadata["conditions"]
+    if name == "LineMesh":
+        return LineMesh.from_arrays(x, element_nodes, conditions)
+    elif name == "LineMeshHighOrder":
+        return LineMeshHighOrder.from_arrays(x, element_nodes, conditions)
+    else:
+        return LineMeshLagrange.from_arrays(x, element_nodes, int(metadata["degree"]), conditions)
+
+
+def save_matrix(path: Path | str, matrix: spmatrix) -> None:
+    """疎行列をCSR形式でディレクトリに保存する関数
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        matrix (spmatrix): 疎行列
+    """
+    matrix = csr_matrix(matrix)
+    matrix.sum_duplicates()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    save_array(path / "data.npy", matrix.data)
+    save_array(path / "indices.npy", matrix.indices)
+    save_array(path / "indptr.npy", matrix.indptr)
+    _write_metadata(path, "csr_matrix", {"shape": list(matrix.shape)})
+
+
+def load_matrix(path: Path | str, mmap: bool = True) -> csr_matrix:
+    """`save_matrix`で保存した疎行列を読み込む関数
+
+    `mmap`が真の場合, 返す行列の非零成分の配列は書き込み不可のメモリマップを参照する.
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        mmap (bool, optional): メモリマップするか否か. Defaults to True.
+
+    Raises:
+        ValueError: 疎行列以外のデータまたは対応していない形式のデータを入力した場合に発生
+
+    Returns:
+        csr_matrix: CSR形式の疎行列
+    """
+    path = Path(path)
+    name, metadata = _read_metadata(path)
+    if name != "csr_matrix":
+        message = f"The directory `{path}` does not contain a sparse matrix."
+        raise ValueError(message)
+    data = load_array(path / "data.npy", mmap)
+    indices = load_array(path / "indices.npy", mmap)
+    indptr = load_array(path / "indptr.npy", mmap)
+    return csr_matrix((data, indices, indptr), shape=tuple(metadata["shape"]))
+
+
+def save_fem(path: Path | str, fem: Fem1d) -> None:
+    """一次元有限要素法のメッシュと組み立て済みの行列をディレクトリに保存する関数
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        fem (Fem1d): 一次元有限要素法
+    """
+    path = Path(path)
+    save_mesh(path / "mesh", fem.mesh)
+    save_matrix(path / "laplacian", fem._stiffness())
+    save_matrix(path / "term", fem._mass())
+    _write_metadata(path, "Fem1d", dict())
+
+
+def load_fem(path: Path | str, mmap: bool = True, **kwargs: Any) -> Fem1d:
+    """`save_fem`で保存した一次元有限要素法を読み込む関数
+
+    行列の組み立てを省略するため, 複数のプロセスから同じファイルを読み込むと,
+    組み立て済みの行列をOSのページキャッシュを通じて共有できる.
+
+    Args:
+        path (Path | str): 保存先のディレクトリ
+        mmap (bool, optional): メモリマップするか否か. Defaults to True.
+        **kwargs (Any): `Fem1d`に渡すその他の引数（`cache_size`, `stats`）
+
+    Raises:
+        ValueError: 一次元有限要素法以外のデータまたは対応していない形式のデータを入力した場合に発生
+
+    Returns:
+        Fem1d: 一次元有限要素法
+    """
+    path = Path(path)
+    name, _ = _read_metadata(path)
+    if name != "Fem1d":
+        message = f"The directory `{path}` does not contain a finite element operator."
+        raise ValueError(message)
+    mesh = load_mesh(path / "mesh", mmap)
+    matrices = (load_matrix(path / "laplacian", mmap), load_matrix(path / "term", mmap))
+    return Fem1d(mesh, matrices=matrices, **kwargs)
+
+
+def _write_metadata(path: Path, name: str, metadata: Dict[str, Any]) -> None:
+    """メタデータをJSON形式で書き出す関数
+
+    Args:
+        path (Path): 保存先のディレクトリ
+        name (str): 保存したデータの種類
+        metadata (Dict[str, Any]): メタデータ
+    """
+    content = {"type": name, "version": FORMAT_VERSION, **metadata}
+    (path / _METADATA).write_text(json.dumps(content, indent=2), encoding="utf8")
+
+
+def _read_metadata(path: Path) -> Tuple[str, Dict[str, Any]]:
+    """メタデータを読み込む関数
+
+    Args:
+        path (Path): 保存先のディレクトリ
+
+    Raises:
+        ValueError: 対応していない形式のデータを入力した場合に発生
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: 保存したデータの種類とメタデータ
+    """
+    metadata = json.loads((path / _METADATA).read_text(encoding="utf8"))
+    if metadata.get("version") != FORMAT_VERSION:
+        message = f"The format version of `{path}` is not supported."
+        raise ValueError(message)
+    return metadata.pop("type"), metadata
@@ -1,23 +1,249 @@
+import csv
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
-import pandas as pd
 
+def text_to_csv(
+    in_path: Path,
+    n_workers: int = 1,
+    parquet: bool = False,
+    chunk_rows: int = 100_000,
+    encoding: str = "utf8",
+    tmp_dir: Path | None = None,
+):
+    """`key:value`形式のテキストファイルを変換する関数
 
-def text_to_csv(in_path: Path):
-    out_path = in_path.with_suffix(".csv")
+    i番目の行にはそれぞれのキーのi番目の値を並べる. 入力はキーごとの一時ファイルへ`chunk_rows`個ずつ追記して振り分けた後,
+    キーごとに一時ファイルを開いて`chunk_rows`行分の値を読み, 読み出し位置を記録して閉じることを繰り返しながら書き出す.
+    使用メモリはファイルサイズによらず, 同時に開くファイル数もキーの数によらない.
+    `n_workers`を2以上にすると, 入力をバイト範囲に分割して複数プロセスで振り分ける.
+    一時ファイルは入力ファイルと同程度の大きさになるため, 既定ではメモリ上にあることの多いシステムの一時ディレクトリではなく
+    出力ファイルと同じディレクトリに作る.
+
+    Args:
+        in_path (Path): 入力ファイルのパス
+        n_workers (int, optional): 振り分けに用いるプロセス数. Defaults to 1.
+        parquet (bool, optional): CSVの代わりにParquet形式で出力するか否か（pyarrowが必要）. Defaults to False.
+        chunk_rows (int, optional): 一度に書き出す行数. Defaults to 100_000.
+        encoding (str, optional): 入力ファイルの文字コード. Defaults to "utf8".
+        tmp_dir (Path | None, optional): 一時ファイルの作成先（Noneの場合は出力先と同じディレクトリ）. Defaults to None.
+    """
+    out_path = in_path.with_suffix(".parquet" if parquet else ".csv")
     print(f"Input  File: {in_path}")
     print(f"Output File: {out_path}")
 
-    data: Dict[str, List[str]] = dict()
-    with open(in_path, mode="r") as f:
-        for line in f:
-            key, value = line.rstrip().split(":")
-            data.setdefault(key, list())
-            data[key].append(value)
+    tmp_dir = out_path.parent if tmp_dir is None else tmp_dir
+    with tempfile.TemporaryDirectory(prefix=".text_to_csv_", dir=tmp_dir) as work:
+        ranges = _byte_ranges(in_path, max(n_workers, 1))
+        tasks = [
+            (in_path, start, end, Path(work) / str(n), encoding, chunk_rows) for n, (start, end) in enumerate(ranges)
+        ]
+        if len(tasks) == 1:
+            parts = [_split_by_key(*tasks[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                parts = list(executor.map(_split_by_key, *zip(*tasks)))
+
+        files: Dict[str, List[Path]] = dict()
+        for part in parts:
+            for key, path in part.items():
+                files.setdefault(key, list()).append(path)
+
+        keys = list(files.keys())
+        rows = _rows([_ValueReader(files[key]) for key in keys], chunk_rows)
+        if parquet:
+            _write_parquet(out_path, keys, rows, chunk_rows)
+        else:
+            _write_csv(out_path, keys, rows, chunk_rows)
+
+
+def _byte_ranges(path: Path, n_part: int) -> List[Tuple[int, int]]:
+    """ファイルを行の境界で分割したバイト範囲を求める関数
+
+    Args:
+        path (Path): ファイルのパス
+        n_part (int): 分割数
+
+    Returns:
+        List[Tuple[int, int]]: 開始位置と終了位置の組のリスト（空の範囲は含まない）
+    """
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, mode="rb") as f:
+        for n in range(1, n_part):
+            f.seek(max(size * n // n_part, boundaries[-1]))
+            if f.tell() > 0:
+                f.readline()
+            boundaries.append(max(f.tell(), boundaries[-1]))
+    boundaries.append(size)
+    ranges = [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+    return ranges if ranges else [(0, 0)]
+
+
+def _split_by_key(path: Path, start: int, end: int, out_dir: Path, encoding: str, chunk_rows: int) -> Dict[str, Path]:
+    """バイト範囲内の値をキーごとの一時ファイルへ振り分ける関数
+
+    値はキーごとにメモリ上へ溜め, 合計が`chunk_rows`個に達するたびに一時ファイルへ一つずつ開いて追記する.
+
+    Args:
+        path (Path): 入力ファイルのパス
+        start (int): 開始位置
+        end (int): 終了位置
+        out_dir (Path): 一時ファイルの出力先ディレクトリ
+        encoding (str): 入力ファイルの文字コード
+        chunk_rows (int): 一度に追記する値の個数
+
+    Returns:
+        Dict[str, Path]: キーと一時ファイルのパスの辞書（キーの初出順）
+    """
+    out_dir.mkdir()
+    paths: Dict[str, Path] = dict()
+    buffers: Dict[str, List[str]] = dict()
+    n_buffered = 0
+    with open(path, mode="rb") as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            raw = f.readline()
+            if not raw:
+                break
+            position += len(raw)
+            key, value = raw.decode(encoding).rstrip().split(":")
+            if key not in paths:
+                paths[key] = out_dir / f"{len(paths)}.txt"
+                buffers[key] = list()
+            buffers[key].append(value)
+            n_buffered += 1
+            if n_buffered >= chunk_rows:
+                _flush(paths, buffers)
+                n_buffered = 0
+    _flush(paths, buffers)
+    return paths
+
+
+def _flush(paths: Dict[str, Path], buffers: Dict[str, List[str]]) -> None:
+    """溜めた値をキーごとの一時ファイルへ追記して空にする関数
+
+    Args:
+        paths (Dict[str, Path]): キーと一時ファイルのパスの辞書
+        buffers (Dict[str, List[str]]): キーと溜めた値の辞書
+    """
+    for key, values in buffers.items():
+        with open(paths[key], mode="a", encoding="utf8", newline="\n") as f:
+            f.writelines(value + "\n" for value in values)
+        values.clear()
+
+
+class _ValueReader:
+    """一つのキーの一時ファイルから値を順に読み出すクラス（読み出しの間のみファイルを開く）"""
+
+    def __init__(self, paths: List[Path]) -> None:
+        """一つのキーの一時ファイルから値を順に読み出すクラス
+
+        Args:
+            paths (List[Path]): 一時ファイルのパスのリスト（入力の先頭側から順）
+        """
+        self._paths = paths
+        self._index = 0
+        self._offset = 0
+
+    def read(self, n_value: int) -> List[str]:
+        """続きの値を最大`n_value`個読み出す関数
+
+        Args:
+            n_value (int): 読み出す値の最大個数
+
+        Returns:
+            List[str]: 値（全て読み出した後は空のリスト）
+        """
+        values: List[str] = list()
+        while len(values) < n_value and self._index < len(self._paths):
+            with open(self._paths[self._index], mode="rb") as f:
+                f.seek(self._offset)
+                while len(values) < n_value:
+                    line = f.readline()
+                    if not line:
+                        break
+                    values.append(line[:-1].decode("utf8"))
+                self._offset = f.tell()
+            if len(values) < n_value:
+                self._index += 1
+                self._offset = 0
+        return values
+
+
+def _rows(readers: List[_ValueReader], chunk_rows: int) -> Iterator[List[str | None]]:
+    """キーごとの値を`chunk_rows`行ずつ読み出して行を組み立てるジェネレータ
+
+    Args:
+        readers (List[_ValueReader]): キーごとの値の読み出し
+        chunk_rows (int): 一度に読み出す行数
+
+    Yields:
+        Iterator[List[str | None]]: 行（値が不足するキーはNone）
+    """
+    while True:
+        columns = [reader.read(chunk_rows) for reader in readers]
+        n_row = max((len(column) for column in columns), default=0)
+        if n_row == 0:
+            return
+        for i in range(n_row):
+            yield [column[i] if i < len(column) else None for column in columns]
+
+
+def _write_csv(out_path: Path, keys: List[str], rows: Iterator[List[str | None]], chunk_rows: int) -> None:
+    """行を逐次CSVファイルへ書き出す関数
+
+    Args:
+        out_path (Path): 出力ファイルのパス
+        keys (List[str]): 列名
+        rows (Iterator[List[str | None]]): 行
+        chunk_rows (int): 一度に書き出す行数
+    """
+    with open(out_path, mode="w", encoding="utf8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow([""] + keys)
+        chunk: List[List] = list()
+        for index, row in enumerate(rows):
+            chunk.append([index] + ["" if value is None else value for value in row])
+            if len(chunk) >= chunk_rows:
+                writer.writerows(chunk)
+                chunk.clear()
+        writer.writerows(chunk)
+
+
+def _write_parquet(out_path: Path, keys: List[str], rows: Iterator[List[str | None]], chunk_rows: int) -> None:
+    """行を逐次Parquetファイルへ書き出す関数（`chunk_rows`行ごとに一つの行グループ）
+
+    Args:
+        out_path (Path): 出力ファイルのパス
+        keys (List[str]): 列名
+        rows (Iterator[List[str | None]]): 行
+        chunk_rows (int): 一度に書き出す行数
+
+    Raises:
+        ImportError: pyarrowがインストールされていない場合に発生
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        message = "Parquet output requires `pyarrow`. Install it with `pip install pyarrow`."
+        raise ImportError(message) from error
 
-    df = pd.concat([pd.Series(data[key], name=key) for key in data.keys()], axis=1)
-    df.to_csv(out_path, encoding="utf8")
+    schema = pa.schema([pa.field(key, pa.string()) for key in keys])
+    with pq.ParquetWriter(out_path, schema) as writer:
+        chunk: List[List[str | None]] = list()
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                writer.write_table(pa.Table.from_pylist([dict(zip(keys, r)) for r in chunk], schema=schema))
+                chunk.clear()
+        if chunk:
+            writer.write_table(pa.Table.from_pylist([dict(zip(keys, r)) for r in chunk], schema=schema))
 
 
 if __name__ == "__main__":
@@ -25,7 +251,12 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Convert text file to csv file.")
     parser.add_argument("text_path", type=str, help="Text File Path")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes used for parsing.")
+    parser.add_argument("--parquet", action="store_true", help="Write a Parquet file instead of a CSV file.")
+    parser.add_argument("--chunk_rows", type=int, default=100_000, help="Number of rows written at once.")
+    parser.add_argument("--tmp_dir", type=str, default=None, help="Directory for temporary files.")
     args = parser.parse_args()
 
     path = Path(args.text_path)
-    text_to_csv(path)
+    tmp_dir = None if args.tmp_dir is None else Path(args.tmp_dir)
+    text_to_csv(path, n_workers=args.workers, parquet=args.parquet, chunk_rows=args.chunk_rows, tmp_dir=tmp_dir)
@@ -3,7 +3,7 @@ import itertools
 import numpy as np
 import pytest
 
-from module.discretization import LineMesh, LineMeshHighOrder
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
 
 
 class TestLineMesh:
@@ -46,6 +46,14 @@ class TestLineMesh:
         with pytest.raises(ValueError):
             mesh.conditions = ["invalid", "condition"]
 
+    def test_element_nodes_array(self):
+        mesh = LineMesh(5, -2.0, 1.0)
+        assert mesh.element_nodes.shape == (4, 2)
+        assert mesh.element_nodes.flags.c_contiguous
+        assert np.issubdtype(mesh.element_nodes.dtype, np.integer)
+        np.testing.assert_equal(mesh[2], [2, 3])
+        assert not hasattr(mesh, "__dict__")
+
 
 class TestLineMeshHighOrder:
     def test_init(self):
@@ -91,3 +99,91 @@ class TestLineMeshHighOrder:
         mesh = LineMeshHighOrder(n_node, xmin, xmax)
         with pytest.raises(ValueError):
             mesh.conditions = ["invalid", "condition"]
+
+    def test_element_nodes_array(self):
+        mesh = LineMeshHighOrder(7, -2.0, 4.0)
+        assert mesh.element_nodes.shape == (3, 3)
+        assert mesh.element_nodes.flags.c_contiguous
+        assert np.issubdtype(mesh.element_nodes.dtype, np.integer)
+        np.testing.assert_equal(mesh[1], [2, 4, 3])
+        assert not hasattr(mesh, "__dict__")
+
+
+class TestLineMeshLagrange:
+    def test_init(self):
+        n_node, xmin, xmax, degree = 7, -2.0, 4.0, 3
+        mesh = LineMeshLagrange(n_node, xmin, xmax, degree)
+        assert mesh.n_node == n_node
+        assert mesh.n_element == 2
+        assert mesh.degree == degree
+        assert mesh.boundary_nodes == [0, n_node - 1]
+        np.testing.assert_equal(mesh.x, [-2, -1, 0, 1, 2, 3, 4])
+        np.testing.assert_equal(mesh.element_nodes, [[0, 3, 1, 2], [3, 6, 4, 5]])
+        np.testing.assert_equal(mesh[1], [3, 6, 4, 5])
+
+    @pytest.mark.parametrize("degree, mesh_type", [(1, LineMesh), (2, LineMeshHighOrder)])
+    def test_same_numbering(self, degree, mesh_type):
+        mesh = LineMeshLagrange(9, -2.0, 4.0, degree)
+        np.testing.assert_equal(mesh.element_nodes, mesh_type(9, -2.0, 4.0).element_nodes)
+
+    @pytest.mark.parametrize("n_node, degree", [(8, 3), (3, 3), (7, 0)])
+    def test_init_exception(self, n_node, degree):
+        with pytest.raises(ValueError):
+            LineMeshLagrange(n_node, -2.0, 4.0, degree)
+
+
+class TestFromVertices:
+    def test_line_mesh(self):
+        mesh = LineMesh.from_vertices([0.0, 0.1, 0.5, 2.0], ["D", "N"])
+        assert mesh.n_node == 4 and mesh.conditions == ["dirichlet", "neumann"]
+        assert mesh.xmin == 0.0 and mesh.xmax == 2.0
+        np.testing.assert_equal(mesh.x, [0.0, 0.1, 0.5, 2.0])
+        np.testing.assert_equal(mesh.element_nodes, LineMesh(4, 0.0, 2.0).element_nodes)
+
+    def test_high_order(self):
+        mesh = LineMeshHighOrder.from_vertices([0.0, 1.0, 3.0])
+        np.testing.assert_allclose(mesh.x, [0.0, 0.5, 1.0, 2.0, 3.0])
+        np.testing.assert_equal(mesh.element_nodes, [[0, 2, 1], [2, 4, 3]])
+
+    def test_lagrange(self):
+        mesh = LineMeshLagrange.from_vertices([-1.0, 2.0, 2.3], 3)
+        assert mesh.degree == 3 and mesh.n_node == 7
+        np.testing.assert_allclose(mesh.x, [-1.0, 0.0, 1.0, 2.0, 2.1, 2.2, 2.3])
+        np.testing.assert_equal(mesh.element_nodes, [[0, 3, 1, 2], [3, 6, 4, 5]])
+
+    @pytest.mark.parametrize(
+        "mesh", [LineMesh(5, 0.0, 1.0, ["N", "D"]), LineMeshHighOrder(7, -1.0, 1.0), LineMeshLagrange(10, 0.0, 3.0, 3)]
+    )
+    def test_from_arrays(self, mesh):
+        element_nodes = np.array(mesh.element_nodes)
+        if isinstance(mesh, LineMeshLagrange):
+            loaded = LineMeshLagrange.from_arrays(mesh.x, element_nodes, mesh.degree, mesh.conditions)
+            assert loaded.degree == mesh.degree
+        else:
+            loaded = type(mesh).from_arrays(mesh.x, element_nodes, mesh.conditions)
+        assert type(loaded) is type(mesh)
+        assert loaded.x is mesh.x and np.shares_memory(loaded.element_nodes, element_nodes)
+        assert loaded.n_node == mesh.n_node and loaded.n_element == mesh.n_element
+        assert loaded.boundary_nodes == mesh.boundary_nodes and loaded.conditions == mesh.conditions
+        np.testing.assert_equal(loaded.unit_normals, mesh.unit_normals)
+        assert not loaded.element_nodes.flags.writeable and element_nodes.flags.writeable
+
+    def test_from_arrays_exception(self):
+        mesh = LineMesh(5, 0.0, 1.0)
+        with pytest.raises(ValueError):
+            LineMeshHighOrder.from_arrays(mesh.x, mesh.element_nodes)
+        with pytest.raises(ValueError):
+            LineMesh.from_arrays(mesh.x[:1], mesh.element_nodes[:0])
+        with pytest.raises(ValueError):
+            LineMeshLagrange.from_arrays(mesh.x, mesh.element_nodes, 0)
+
+    @pytest.mark.parametrize("vertices", [[0.0], [0.0, 1.0, 1.0], [1.0, 0.0], [[0.0, 1.0]]])
+    def test_vertices_exception(self, vertices):
+        with pytest.raises(ValueError):
+            LineMesh.from_vertices(vertices)
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            LineMeshLagrange.from_vertices([0.0, 1.0], 0)
+        with pytest.raises(ValueError):
+            LineMesh.from_vertices([0.0, 1.0], ["invalid", "condition"])
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import AdaptiveRefinement, Fem1d
+from module.fem.adaptive import mark_elements, recovery_estimate, refine, refine_mesh, residual_estimate
+from module.fem.fem1d import _laplacian_matrix, _term_matrix
+
+MESHES = [
+    LineMesh(9, 0.0, 1.0, ["D", "N"]),
+    LineMeshHighOrder(9, -1.0, 1.0),
+    LineMeshLagrange(13, 0.0, 2.0, 3, ["N", "D"]),
+]
+
+
+def _layer(x, alpha):
+    return np.sinh(x / np.sqrt(alpha)) / np.sinh(1.0 / np.sqrt(alpha))
+
+
+class TestRefine:
+    @pytest.mark.parametrize("mesh", MESHES)
+    def test_refine_mesh(self, mesh):
+        marked = np.zeros(mesh.n_element, dtype=bool)
+        marked[[0, 2]] = True
+        refined, node_map, children = refine_mesh(mesh, marked)
+        assert type(refined) is type(mesh) and refined.conditions == mesh.conditions
+        assert refined.n_element == mesh.n_element + 2
+        np.testing.assert_equal(children, [0, 1, 3, 4])
+        kept = node_map >= 0
+        np.testing.assert_allclose(refined.x[node_map[kept]], mesh.x[kept])
+        assert np.all(np.diff(refined.x) > 0.0)
+
+    @pytest.mark.parametrize("mesh", MESHES)
+    def test_partial_reassembly(self, mesh):
+        rng = np.random.default_rng(0)
+        fem = Fem1d(mesh)
+        for _ in range(4):
+            fem = refine(fem, rng.random(fem.mesh.n_element) < 0.4)
+            expected_matrices = (_laplacian_matrix(fem.mesh), _term_matrix(fem.mesh))
+            for matrix, expected in zip((fem.laplacian_view, fem.term_view), expected_matrices):
+                np.testing.assert_equal(matrix.indptr, expected.indptr)
+                np.testing.assert_equal(matrix.indices, expected.indices)
+                np.testing.assert_allclose(matrix.data, expected.data, rtol=1e-12)
+        fem._shared_structure()
+
+    def test_matrix_free(self):
+        fem = refine(Fem1d(LineMesh(5, 0.0, 1.0), matrix_free=True), np.array([True, False, False, True]))
+        assert fem.matrix_free and fem.mesh.n_node == 7
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            refine_mesh(LineMesh(5, 0.0, 1.0), np.array([True, False]))
+
+
+class TestEstimator:
+    def test_mark_elements(self):
+        indicators = np.array([0.1, 3.0, 0.2, 2.0, 0.5])
+        np.testing.assert_equal(mark_elements(indicators, 0.5), [False, True, False, False, False])
+        np.testing.assert_equal(mark_elements(indicators, 0.9), [False, True, False, True, False])
+        assert mark_elements(indicators, 1.0).all()
+
+    @pytest.mark.parametrize("mesh", MESHES)
+    def test_exact(self, mesh):
+        u = 2.0 * mesh.x + 1.0
+        np.testing.assert_allclose(recovery_estimate(mesh, u), 0.0, atol=1e-12)
+        np.testing.assert_allclose(residual_estimate(mesh, u, 3.0 * u, beta=3.0), 0.0, atol=1e-12)
+
+    @pytest.mark.parametrize("estimator", [residual_estimate, recovery_estimate])
+    def test_convergence(self, estimator):
+        estimates = []
+        for n_node in (33, 65, 129):
+            mesh = LineMesh(n_node, 0.0, 1.0)
+            fem = Fem1d(mesh)
+            u = fem.solve(fem.term(np.pi**2 * np.sin(np.pi * mesh.x)), np.zeros(n_node))
+            args = (np.pi**2 * np.sin(np.pi * mesh.x),) if estimator is residual_estimate else ()
+            estimates.append(np.sqrt(np.sum(estimator(mesh, u, *args) ** 2)))
+        np.testing.assert_allclose(np.array(estimates[:-1]) / estimates[1:], 2.0, rtol=0.05)
+
+
+class TestAdaptiveRefinement:
+    @pytest.mark.parametrize(
+        "mesh", [LineMesh(5, 0.0, 1.0), LineMeshHighOrder(5, 0.0, 1.0), LineMeshLagrange(7, 0.0, 1.0, 3)]
+    )
+    def test_boundary_layer(self, mesh):
+        alpha = 1e-3
+        adaptive = AdaptiveRefinement(mesh, np.zeros_like, [0.0, 1.0], alpha=alpha, beta=1.0, tol=1e-2)
+        u = adaptive.solve()
+        assert adaptive.estimates[-1] <= 1e-2 and adaptive.n_nodes[-1] == adaptive.mesh.n_node
+        assert adaptive.mesh.n_node < 400
+        np.testing.assert_allclose(u, _layer(adaptive.mesh.x, alpha), atol=1e-3)
+        h = np.diff(adaptive.mesh.x)
+        assert h[-1] < h[0] / 16
+
+    def test_not_converged(self):
+        adaptive = AdaptiveRefinement(LineMesh(5, 0.0, 1.0), np.ones_like, [0.0, 0.0], tol=1e-8, max_iter=3)
+        with pytest.raises(RuntimeError):
+            adaptive.solve()
+        assert len(adaptive.estimates) == 4
+
+    def test_exception(self):
+        mesh = LineMesh(5, 0.0, 1.0)
+        with pytest.raises(ValueError):
+            AdaptiveRefinement(mesh, np.sin, [0.0])
+        with pytest.raises(ValueError):
+            AdaptiveRefinement(mesh, np.sin, [0.0, 0.0], theta=0.0)
+        with pytest.raises(ValueError):
+            AdaptiveRefinement(mesh, np.sin, [0.0, 0.0], estimator="unknown")
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix, diags
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d
+from module.fem.banded import matrix_bandwidth, solve_banded_or_sparse, to_banded
+
+
+class TestBanded:
+    def test_matrix_bandwidth(self):
+        matrix = diags([[1.0] * 4, [2.0] * 5, [3.0] * 3], [-1, 0, 2])
+        assert matrix_bandwidth(matrix) == (1, 2)
+
+    def test_to_banded(self):
+        dense = np.array([[4.0, 1.0, 0.0], [2.0, 5.0, 1.0], [0.0, 3.0, 6.0]])
+        ab = to_banded(csr_matrix(dense), 1, 1)
+        np.testing.assert_equal(ab, [[0, 1, 1], [4, 5, 6], [2, 3, 0]])
+
+    def test_to_banded_exception(self):
+        dense = np.array([[4.0, 0.0, 1.0], [0.0, 5.0, 0.0], [0.0, 0.0, 6.0]])
+        with pytest.raises(ValueError):
+            to_banded(csr_matrix(dense), 1, 1)
+
+    @pytest.mark.parametrize("max_bandwidth", [0, 1])
+    def test_solve(self, max_bandwidth):
+        dense = np.array([[4.0, 1.0, 0.0], [2.0, 5.0, 1.0], [0.0, 3.0, 6.0]])
+        rhs = np.array([1.0, 2.0, 3.0])
+        sol = solve_banded_or_sparse(csr_matrix(dense), rhs, max_bandwidth)
+        np.testing.assert_allclose(sol, np.linalg.solve(dense, rhs))
+
+
+class TestFem1dSolveSystem:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 101), (LineMeshHighOrder, 101)])
+    def test_poisson(self, mesh_type, n):
+        mesh = mesh_type(n, -0.5, 1, ["D", "N"])
+        fem = Fem1d(mesh)
+
+        coef = 2.0 * np.pi
+        u = np.cos(coef * mesh.x)
+        g = -np.sin(coef * mesh.x) * coef
+        coefficient = fem.laplacian_matrix
+        rhs = fem.term(np.cos(coef * mesh.x) * coef**2)
+        fem.implement_dirichlet(coefficient, rhs, u)
+        fem.implement_neumann(rhs, g)
+
+        expected = np.linalg.solve(coefficient.toarray(), rhs)
+        np.testing.assert_allclose(fem.solve_system(coefficient, rhs), expected, atol=1e-10)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d
+from module.fem.condensation import StaticCondensation
+
+
+class TestStaticCondensation:
+    @pytest.mark.parametrize(
+        "mesh",
+        [
+            LineMeshHighOrder(41, 0.0, 1.0, ["D", "N"]),
+            LineMeshHighOrder(41, -1.0, 1.0, ["N", "N"]),
+            LineMeshLagrange(41, 0.0, 2.0, 4, ["N", "D"]),
+            LineMeshHighOrder(3, 0.0, 1.0),
+        ],
+    )
+    def test_solve(self, mesh):
+        fem = Fem1d(mesh)
+        rng = np.random.default_rng(0)
+        rhs = rng.standard_normal((mesh.n_node, 2))
+        values = rng.standard_normal((mesh.n_node, 2))
+        for alpha, beta in [(1.0, 1.0), (2.0, -5.0)]:
+            expected = fem.solve(rhs, values, alpha, beta)
+            np.testing.assert_allclose(fem.solve(rhs, values, alpha, beta, method="condensation"), expected, atol=1e-11)
+            condensed = fem.solve(rhs[:, 0], values[:, 0], alpha, beta, method="condensation")
+            np.testing.assert_allclose(condensed, expected[:, 0], atol=1e-11)
+
+    def test_poisson(self):
+        mesh = LineMeshHighOrder(21, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh)
+        u = mesh.x**2
+        values = u.copy()
+        values[-1] = 2.0
+        sol = fem.solve(fem.term(np.full(mesh.n_node, -2.0)), values, method="condensation")
+        np.testing.assert_allclose(sol, u, atol=1e-12)
+
+    def test_size(self):
+        mesh = LineMeshHighOrder(41, 0.0, 1.0)
+        condensation = StaticCondensation(mesh, np.tile(np.eye(3), (mesh.n_element, 1, 1)))
+        assert condensation.n_vertex == 21
+
+    def test_cache(self):
+        mesh = LineMeshHighOrder(21, 0.0, 1.0)
+        fem = Fem1d(mesh)
+        rhs = np.ones(mesh.n_node)
+        values = np.zeros(mesh.n_node)
+        fem.solve(rhs, values, method="condensation")
+        fem.solve(rhs, values, method="condensation")
+        fem.solve(rhs, values)
+        assert len(fem._factorizations) == 2
+
+    def test_exception(self):
+        mesh = LineMesh(11, 0.0, 1.0)
+        with pytest.raises(ValueError):
+            Fem1d(mesh).solve(np.zeros(11), np.zeros(11), method="condensation")
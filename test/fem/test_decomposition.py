@@ -0,0 +1,46 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d, decomposition_solve
+
+
+def _problem(mesh):
+    fem = Fem1d(mesh)
+    rhs = fem.term(np.cos(3.0 * mesh.x))
+    values = np.sin(mesh.x) + 1.0
+    return fem, rhs, values
+
+
+class TestDecompositionSolve:
+    @pytest.mark.parametrize(
+        "mesh",
+        [
+            LineMesh(101, 0.0, 1.0),
+            LineMeshHighOrder(101, -1.0, 1.0),
+            LineMeshLagrange(97, 0.0, 2.0, 3),
+            LineMesh.from_vertices(np.linspace(0.0, 1.0, 60) ** 2),
+        ],
+    )
+    @pytest.mark.parametrize("conditions", list(itertools.product(["dirichlet", "neumann"], repeat=2)))
+    def test_serial(self, mesh, conditions):
+        mesh.conditions = list(conditions)
+        fem, rhs, values = _problem(mesh)
+        expected = fem.solve(rhs, values, 1.0, 0.5)
+        for n_subdomain in (1, 2, 7, 50):
+            sol = decomposition_solve(mesh, rhs, values, 1.0, 0.5, n_subdomain=n_subdomain, n_workers=1)
+            np.testing.assert_allclose(sol, expected, atol=1e-10)
+
+    def test_workers(self):
+        mesh = LineMeshHighOrder(2001, 0.0, 1.0, ["D", "N"])
+        fem, rhs, values = _problem(mesh)
+        sol = decomposition_solve(mesh, rhs, values, n_subdomain=6, n_workers=2)
+        np.testing.assert_allclose(sol, fem.solve(rhs, values), atol=1e-10)
+
+    def test_exception(self):
+        mesh = LineMesh(11, 0.0, 1.0)
+        _, rhs, values = _problem(mesh)
+        with pytest.raises(ValueError):
+            decomposition_solve(mesh, rhs, values, n_subdomain=0)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d
+
+
+class TestEigenpairs:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 401), (LineMeshHighOrder, 201)])
+    @pytest.mark.parametrize(
+        "conditions, exact",
+        [(["D", "D"], [1, 4, 9, 16]), (["N", "N"], [0, 1, 4, 9]), (["D", "N"], [0.25, 2.25, 6.25, 12.25])],
+    )
+    def test_lowest(self, mesh_type, n, conditions, exact):
+        mesh = mesh_type(n, 0.0, np.pi, conditions)
+        fem = Fem1d(mesh)
+        eigenvalues, eigenvectors = fem.eigenpairs(4)
+        np.testing.assert_allclose(eigenvalues, exact, rtol=1e-3, atol=1e-8)
+        assert eigenvectors.shape == (mesh.n_node, 4)
+        residual = fem.laplacian(eigenvectors) - fem.term(eigenvectors) * eigenvalues
+        interior = np.ones(mesh.n_node, dtype=bool)
+        interior[mesh.boundary_nodes] = False
+        np.testing.assert_allclose(residual[interior], 0.0, atol=1e-8)
+
+    def test_shift(self):
+        mesh = LineMesh(401, 0.0, np.pi)
+        eigenvalues, _ = Fem1d(mesh).eigenpairs(2, sigma=24.0)
+        np.testing.assert_allclose(eigenvalues, [16, 25], rtol=1e-2)
+
+    def test_small(self):
+        mesh = LineMesh(5, 0.0, np.pi)
+        eigenvalues, eigenvectors = Fem1d(mesh).eigenpairs(3)
+        assert eigenvalues.shape == (3,)
+        np.testing.assert_equal(eigenvectors[mesh.boundary_nodes], 0.0)
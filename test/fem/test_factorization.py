@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d
+from module.fem.factorization import FactorizationCache
+
+
+class TestFactorizationCache:
+    def test_lru(self):
+        cache = FactorizationCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert "a" in cache and "c" in cache
+        assert cache.get("b") is None
+
+    def test_invalidate(self):
+        cache = FactorizationCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.invalidate("a")
+        assert "a" not in cache and "b" in cache
+        cache.invalidate()
+        assert len(cache) == 0
+
+    def test_size_exception(self):
+        with pytest.raises(ValueError):
+            FactorizationCache(-1)
+
+
+class TestFem1dSolve:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 101), (LineMeshHighOrder, 101)])
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["D", "N"], ["N", "D"]])
+    def test_helmholtz(self, mesh_type, n, conditions):
+        mesh = mesh_type(n, -0.5, 1, conditions)
+        fem = Fem1d(mesh)
+        coef = 2.0 * np.pi
+
+        for shift in (0.0, 1.0):
+            u = np.cos(coef * mesh.x) + shift
+            g = -np.sin(coef * mesh.x) * coef
+            values = u.copy()
+            for node, condition in zip(mesh.boundary_nodes, mesh.conditions):
+                if condition == "neumann":
+                    values[node] = g[node]
+
+            coefficient = fem.laplacian_matrix - coef**2 * fem.term_matrix
+            expected_rhs = fem.term(-(coef**2) * shift * np.ones(mesh.n_node))
+            fem.implement_dirichlet(coefficient, expected_rhs, u)
+            fem.implement_neumann(expected_rhs, g)
+            expected = fem.solve_system(coefficient, expected_rhs)
+
+            sol = fem.solve(fem.term(-(coef**2) * shift * np.ones(mesh.n_node)), values, 1.0, -(coef**2))
+            np.testing.assert_allclose(sol, expected, atol=1e-10)
+        assert len(fem._factorizations) == 1
+
+    def test_conditions_change(self):
+        mesh = LineMesh(11, 0.0, 1.0, ["D", "D"])
+        fem = Fem1d(mesh, cache_size=1)
+        values = np.zeros(mesh.n_node)
+        values[-1] = 1.0
+        np.testing.assert_allclose(fem.solve(np.zeros(mesh.n_node), values), mesh.x, atol=1e-12)
+        mesh.conditions = ["D", "N"]
+        np.testing.assert_allclose(fem.solve(np.zeros(mesh.n_node), values), mesh.x, atol=1e-12)
+        assert len(fem._factorizations) == 1
+        fem.clear_factorizations()
+        assert len(fem._factorizations) == 0
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 from scipy.sparse import csc_matrix
-from scipy.sparse.linalg import splu
+from scipy.sparse.linalg import cg, splu
 
 from module.discretization import LineMesh, LineMeshHighOrder
 from module.fem import Fem1d
@@ -149,3 +149,203 @@ class TestFem1DHighOrder:
             relative_error = np.max(np.abs(u - sol) / np.abs(u).max())
             assert relative_error < error_old
             error_old = relative_error
+
+
+class TestAssembly:
+    @staticmethod
+    def _reference(mesh, local, scale):
+        matrix = np.zeros((mesh.n_node, mesh.n_node))
+        for nodes in mesh.element_nodes:
+            h = mesh.x[nodes[1]] - mesh.x[nodes[0]]
+            for a, p in enumerate(nodes):
+                for b, q in enumerate(nodes):
+                    matrix[p, q] += local[a][b] * scale(h)
+        return matrix
+
+    def test_line_mesh(self):
+        mesh = LineMesh(51, -0.5, 1)
+        fem = Fem1d(mesh)
+        laplacian = self._reference(mesh, [[1, -1], [-1, 1]], lambda h: 1 / h)
+        term = self._reference(mesh, [[1 / 3, 1 / 6], [1 / 6, 1 / 3]], lambda h: h)
+        np.testing.assert_allclose(fem.laplacian_matrix.toarray(), laplacian, rtol=1e-14, atol=1e-12)
+        np.testing.assert_allclose(fem.term_matrix.toarray(), term, rtol=1e-14, atol=1e-16)
+
+    def test_line_mesh_high_order(self):
+        mesh = LineMeshHighOrder(51, -0.5, 1)
+        fem = Fem1d(mesh)
+        laplacian = [[7 / 3, 1 / 3, -8 / 3], [1 / 3, 7 / 3, -8 / 3], [-8 / 3, -8 / 3, 16 / 3]]
+        term = [[2 / 15, -1 / 30, 1 / 15], [-1 / 30, 2 / 15, 1 / 15], [1 / 15, 1 / 15, 8 / 15]]
+        laplacian = self._reference(mesh, laplacian, lambda h: 1 / h)
+        term = self._reference(mesh, term, lambda h: h)
+        np.testing.assert_allclose(fem.laplacian_matrix.toarray(), laplacian, rtol=1e-14, atol=1e-12)
+        np.testing.assert_allclose(fem.term_matrix.toarray(), term, rtol=1e-14, atol=1e-16)
+
+
+class TestImplementDirichlet:
+    @pytest.mark.parametrize("fmt", ["csr", "csc", "lil"])
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["D", "N"], ["N", "D"]])
+    def test_formats(self, fmt, conditions):
+        mesh = LineMeshHighOrder(11, -0.5, 1, conditions)
+        fem = Fem1d(mesh)
+        values = np.linspace(1.0, 2.0, mesh.n_node)
+        rhs = fem.term(np.ones(mesh.n_node))
+
+        expected_coefficient = fem.laplacian_matrix.toarray()
+        expected_rhs = rhs.copy()
+        index = [mesh.boundary_nodes[i] for i, c in enumerate(mesh.conditions) if c == "dirichlet"]
+        expected_rhs -= expected_coefficient[:, index] @ values[index]
+        expected_rhs[index] = values[index]
+        expected_coefficient[index, :] = 0.0
+        expected_coefficient[:, index] = 0.0
+        expected_coefficient[index, index] = 1.0
+
+        coefficient = fem.laplacian_matrix.asformat(fmt)
+        fem.implement_dirichlet(coefficient, rhs, values)
+        np.testing.assert_allclose(coefficient.toarray(), expected_coefficient)
+        np.testing.assert_allclose(rhs, expected_rhs)
+
+
+class TestBatched:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 21), (LineMeshHighOrder, 21)])
+    @pytest.mark.parametrize("fmt", ["csr", "lil"])
+    def test_columns_match_single(self, mesh_type, n, fmt):
+        mesh = mesh_type(n, -0.5, 1, ["D", "N"])
+        fem = Fem1d(mesh)
+        rng = np.random.default_rng(0)
+        f = rng.standard_normal((mesh.n_node, 4))
+        values = rng.standard_normal((mesh.n_node, 4))
+
+        assert fem.laplacian(f).shape == f.shape
+        coefficient = fem.laplacian_matrix.asformat(fmt)
+        rhs = fem.term(f)
+        fem.implement_dirichlet(coefficient, rhs, values)
+        fem.implement_neumann(rhs, values)
+        batched = fem.solve_system(coefficient, rhs)
+        cached = fem.solve(fem.term(f), values)
+
+        for k in range(f.shape[1]):
+            coefficient = fem.laplacian_matrix.asformat(fmt)
+            rhs = fem.term(f[:, k])
+            fem.implement_dirichlet(coefficient, rhs, values[:, k])
+            fem.implement_neumann(rhs, values[:, k])
+            expected = fem.solve_system(coefficient, rhs)
+            np.testing.assert_allclose(batched[:, k], expected, atol=1e-12)
+            np.testing.assert_allclose(cached[:, k], expected, atol=1e-12)
+
+
+class TestLazyOperator:
+    def test_lazy(self):
+        mesh = LineMesh(21, 0.0, 1.0)
+        fem = Fem1d(mesh)
+        assert fem._laplacian is None and fem._term is None
+        fem.laplacian(np.ones(mesh.n_node))
+        assert fem._laplacian is not None and fem._term is None
+
+    def test_lazy_stiffness_only(self):
+        mesh = LineMesh(21, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh)
+        coefficient = fem.operator(2.0)
+        assert fem._term is None
+        assert abs(coefficient - 2.0 * fem.laplacian_view).max() == 0.0
+        assert not np.shares_memory(coefficient.data, fem._laplacian.data)
+        rhs = np.ones(mesh.n_node)
+        values = np.cos(mesh.x)
+        sol = fem.solve(rhs, values)
+        matrix, rhs = fem.laplacian_matrix, rhs.copy()
+        fem.implement_neumann(rhs, values)
+        fem.implement_dirichlet(matrix, rhs, values)
+        np.testing.assert_allclose(sol, fem.solve_system(matrix, rhs), atol=1e-12)
+        assert fem._term is None
+
+    @pytest.mark.parametrize("mesh_type", [LineMesh, LineMeshHighOrder])
+    def test_view(self, mesh_type):
+        fem = Fem1d(mesh_type(21, 0.0, 1.0))
+        for view, matrix in ((fem.laplacian_view, fem.laplacian_matrix), (fem.term_view, fem.term_matrix)):
+            assert not view.data.flags.writeable and not view.indices.flags.writeable
+            assert abs(view - matrix).max() == 0.0
+            with pytest.raises(ValueError):
+                view.data[0] = 0.0
+        assert np.shares_memory(fem.laplacian_view.data, fem._laplacian.data)
+        assert fem._laplacian.data.flags.writeable
+
+    @pytest.mark.parametrize("mesh_type", [LineMesh, LineMeshHighOrder])
+    def test_operator(self, mesh_type):
+        mesh = mesh_type(21, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh)
+        expected = 2.0 * fem.laplacian_matrix - 3.0 * fem.term_matrix
+        coefficient = fem.operator(2.0, -3.0)
+        assert coefficient.format == "csr"
+        np.testing.assert_allclose(coefficient.toarray(), expected.toarray(), atol=1e-12)
+
+        rhs = np.ones(mesh.n_node)
+        values = np.cos(mesh.x)
+        fem.implement_dirichlet(coefficient, rhs, values)
+        assert abs(fem.laplacian_view - fem.laplacian_matrix).max() == 0.0
+        np.testing.assert_allclose(fem.solve_system(coefficient, rhs)[0], values[0])
+
+
+class TestMatrixFree:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 51), (LineMeshHighOrder, 51)])
+    def test_apply(self, mesh_type, n):
+        mesh = mesh_type(n, -0.5, 1)
+        fem = Fem1d(mesh)
+        fem_free = Fem1d(mesh, matrix_free=True)
+        assert fem_free.matrix_free and fem_free._laplacian is None and fem_free._term is None
+        vec = np.random.default_rng(0).standard_normal((mesh.n_node, 3))
+        np.testing.assert_allclose(fem_free.laplacian(vec), fem.laplacian(vec), rtol=1e-12, atol=1e-10)
+        np.testing.assert_allclose(fem_free.term(vec[:, 0]), fem.term(vec[:, 0]), rtol=1e-12, atol=1e-14)
+        np.testing.assert_allclose(fem_free.laplacian_matrix.toarray(), fem.laplacian_matrix.toarray())
+
+    def test_linear_operator(self):
+        mesh = LineMesh(101, 0.0, 1.0)
+        fem = Fem1d(mesh, matrix_free=True)
+        operator = fem.laplacian_operator + fem.term_operator
+        rhs = fem.term(np.ones(mesh.n_node))
+        sol, info = cg(operator, rhs, rtol=1e-12, maxiter=1000)
+        assert info == 0
+        np.testing.assert_allclose(fem.laplacian(sol) + fem.term(sol), rhs, atol=1e-10)
+
+
+class TestVariableCoefficient:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 21), (LineMeshHighOrder, 21)])
+    def test_constant(self, mesh_type, n):
+        mesh = mesh_type(n, -0.5, 1)
+        fem = Fem1d(mesh)
+        for coefficient in (2.0, lambda x: 2.0 + 0.0 * x, np.full(mesh.n_node, 2.0), np.full(mesh.n_element, 2.0)):
+            np.testing.assert_allclose(
+                fem.diffusion_matrix(coefficient).toarray(), 2.0 * fem.laplacian_matrix.toarray(), atol=1e-12
+            )
+            np.testing.assert_allclose(
+                fem.reaction_matrix(coefficient).toarray(), 2.0 * fem.term_matrix.toarray(), atol=1e-14
+            )
+
+    def test_node_values_match_function(self):
+        mesh = LineMeshHighOrder(21, -0.5, 1)
+        fem = Fem1d(mesh)
+        np.testing.assert_allclose(
+            fem.diffusion_matrix(1.0 + mesh.x**2).toarray(),
+            fem.diffusion_matrix(lambda x: 1.0 + x**2).toarray(),
+            atol=1e-12,
+        )
+
+    @pytest.mark.parametrize("mesh_type", [LineMesh, LineMeshHighOrder])
+    def test_convergence(self, mesh_type):
+        error_old = 1.0
+        for n in (11, 41, 161):
+            mesh = mesh_type(n, 0.0, 1.0, ["D", "D"])
+            fem = Fem1d(mesh)
+            u = np.sin(np.pi * mesh.x)
+            f = -np.pi * np.cos(np.pi * mesh.x) + (1.0 + mesh.x) * np.pi**2 * u + u * np.exp(mesh.x)
+            coefficient = fem.diffusion_matrix(lambda x: 1.0 + x) + fem.reaction_matrix(np.exp)
+            rhs = fem.term(f)
+            fem.implement_dirichlet(coefficient, rhs, u)
+            sol = fem.solve_system(coefficient, rhs)
+            error = np.max(np.abs(sol - u))
+            assert error < error_old
+            error_old = error
+        assert error_old < 1e-3
+
+    def test_exception(self):
+        fem = Fem1d(LineMesh(11, 0.0, 1.0))
+        with pytest.raises(ValueError):
+            fem.diffusion_matrix(np.ones(5))
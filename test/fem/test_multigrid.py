@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from scipy.sparse.linalg import cg
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d, GeometricMultigrid
+from module.fem.multigrid import _coarsen, _prolongation
+
+
+def _problem(mesh, coefficient=1.0):
+    fem = Fem1d(mesh)
+    matrix = fem.diffusion_matrix(coefficient) + fem.term_matrix
+    rhs = fem.term(np.cos(3.0 * mesh.x))
+    values = np.sin(mesh.x)
+    fem.implement_neumann(rhs, values)
+    fem.implement_dirichlet(matrix, rhs, values)
+    return fem, matrix, rhs
+
+
+class TestGeometricMultigrid:
+    @pytest.mark.parametrize(
+        "mesh",
+        [
+            LineMesh(257, 0.0, 1.0, ["D", "N"]),
+            LineMeshHighOrder(257, -1.0, 1.0),
+            LineMeshLagrange(193, 0.0, 2.0, 3, ["N", "D"]),
+            LineMesh.from_vertices(np.linspace(0.0, 1.0, 257) ** 3, ["D", "N"]),
+        ],
+    )
+    def test_solve(self, mesh):
+        fem, matrix, rhs = _problem(mesh, lambda x: 1.0 + 0.5 * np.sin(10.0 * x))
+        mg = GeometricMultigrid(mesh, matrix)
+        assert mg.n_level > 3
+        sol = mg.solve(rhs)
+        expected = fem.solve_system(matrix, rhs)
+        np.testing.assert_allclose(sol, expected, atol=1e-9 * np.abs(expected).max())
+        assert mg.n_iter < 20
+
+    @pytest.mark.parametrize("degree", [3, 4, 6])
+    def test_solve_high_order(self, degree):
+        mesh = LineMeshLagrange(256 * degree + 1, 0.0, 2.0, degree, ["D", "N"])
+        _, matrix, rhs = _problem(mesh, lambda x: 1.0 + 0.5 * np.sin(10.0 * x))
+        mg = GeometricMultigrid(mesh, matrix)
+        sol = mg.solve(rhs)
+        assert np.linalg.norm(rhs - matrix.dot(sol)) <= mg.tol * np.linalg.norm(rhs)
+        assert mg.n_iter < 15
+
+    def test_stagnation(self):
+        mesh = LineMesh(257, 0.0, 1.0)
+        _, matrix, rhs = _problem(mesh)
+        mg = GeometricMultigrid(mesh, matrix, tol=1e-20)
+        with pytest.raises(RuntimeError):
+            mg.solve(rhs)
+        assert mg.n_iter >= 3 and mg.residual_norms[-1] > mg.tol * np.linalg.norm(rhs)
+
+    def test_preconditioner(self):
+        mesh = LineMesh(1025, 0.0, 1.0)
+        fem, matrix, rhs = _problem(mesh, lambda x: np.exp(3.0 * x))
+        mg = GeometricMultigrid(mesh, matrix)
+        iterates = []
+        sol, info = cg(matrix, rhs, M=mg.as_preconditioner(), rtol=1e-10, callback=iterates.append)
+        assert info == 0 and len(iterates) < 15
+        np.testing.assert_allclose(sol, fem.solve_system(matrix, rhs), atol=1e-8)
+
+    def test_prolongation(self):
+        mesh = LineMeshHighOrder(17, 0.0, 1.0)
+        coarse = _coarsen(mesh, 3)
+        assert isinstance(coarse, LineMeshHighOrder) and coarse.n_node == 9
+        prolongation = _prolongation(mesh, coarse)
+        np.testing.assert_allclose(prolongation.dot(coarse.x**2), mesh.x**2, atol=1e-14)
+        np.testing.assert_allclose(prolongation.sum(axis=1), 1.0)
+
+    def test_levels(self):
+        mesh = LineMesh(65, 0.0, 1.0)
+        _, matrix, _ = _problem(mesh)
+        assert GeometricMultigrid(mesh, matrix, n_level=2).n_level == 2
+        assert GeometricMultigrid(mesh, matrix, coarse_size=17).meshes[-1].n_node == 17
+        assert _coarsen(LineMesh(8, 0.0, 1.0), 3) is None
+
+    def test_exception(self):
+        mesh = LineMesh(9, 0.0, 1.0)
+        _, matrix, _ = _problem(mesh)
+        with pytest.raises(ValueError):
+            GeometricMultigrid(LineMesh(17, 0.0, 1.0), matrix)
+        with pytest.raises(ValueError):
+            GeometricMultigrid(mesh, matrix, n_level=0)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d, NewtonSolver
+
+
+def _problem(mesh):
+    u = np.sin(np.pi * mesh.x) + mesh.x
+    s = np.pi**2 * np.sin(np.pi * mesh.x) + u**3
+    values = u.copy()
+    values[-1] = -np.pi + 1.0 if mesh.conditions[1] == "neumann" else u[-1]
+    return u, s, values
+
+
+class TestNewtonSolver:
+    @pytest.mark.parametrize("mesh_type", [LineMesh, LineMeshHighOrder])
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["D", "N"]])
+    def test_cubic(self, mesh_type, conditions):
+        error_old = 1.0
+        for n in (21, 81, 321):
+            mesh = mesh_type(n, 0.0, 1.0, conditions)
+            fem = Fem1d(mesh)
+            u, s, values = _problem(mesh)
+            solver = NewtonSolver(fem, lambda v: v**3, lambda v: 3 * v**2)
+            sol = solver.solve(fem.term(s), values)
+            assert solver.n_iter < 10
+            error = np.max(np.abs(sol - u))
+            assert error < error_old
+            error_old = error
+        assert error_old < 1e-4
+
+    def test_modified_newton(self):
+        mesh = LineMesh(101, 0.0, 1.0)
+        fem = Fem1d(mesh)
+        u, s, values = _problem(mesh)
+        full = NewtonSolver(fem, lambda v: v**3, lambda v: 3 * v**2)
+        modified = NewtonSolver(fem, lambda v: v**3, lambda v: 3 * v**2, update_interval=100)
+        np.testing.assert_allclose(modified.solve(fem.term(s), values), full.solve(fem.term(s), values), atol=1e-9)
+        assert modified.n_iter >= full.n_iter
+
+    def test_not_converged(self):
+        mesh = LineMesh(11, 0.0, 1.0)
+        fem = Fem1d(mesh)
+        u, s, values = _problem(mesh)
+        solver = NewtonSolver(fem, lambda v: v**3, lambda v: 3 * v**2, max_iter=1)
+        with pytest.raises(RuntimeError):
+            solver.solve(fem.term(s), values)
+
+    def test_init_exception(self):
+        with pytest.raises(ValueError):
+            NewtonSolver(Fem1d(LineMesh(11, 0.0, 1.0)), np.sin, np.cos, update_interval=0)
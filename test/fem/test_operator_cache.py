@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d, OperatorCache
+
+
+class TestOperatorCache:
+    def test_shared(self):
+        cache = OperatorCache()
+        fem1 = Fem1d(LineMesh(11, 0.0, 1.0, ["D", "N"]), operator_cache=cache)
+        fem2 = Fem1d(LineMesh(11, 0.0, 1.0), operator_cache=cache)
+        assert len(cache) == 0
+        assert np.shares_memory(fem1.laplacian_view.data, fem2.laplacian_view.data)
+        assert cache.misses == 1 and cache.hits == 1
+        assert not fem1._mass().data.flags.writeable
+        reference = Fem1d(LineMesh(11, 0.0, 1.0))
+        assert abs(fem2.laplacian_matrix - reference.laplacian_matrix).max() == 0.0
+        assert abs(fem2.term_matrix - reference.term_matrix).max() == 0.0
+
+        rhs = reference.term(np.ones(11))
+        values = np.zeros(11)
+        np.testing.assert_allclose(fem1.solve(rhs, values), Fem1d(fem1.mesh).solve(rhs, values))
+        coefficient = fem1.laplacian_matrix
+        fem1.implement_dirichlet(coefficient, rhs.copy(), values)
+
+    def test_key(self):
+        cache = OperatorCache()
+        meshes = [
+            LineMesh(11, 0.0, 1.0),
+            LineMesh(11, 0.0, 2.0),
+            LineMesh(13, 0.0, 1.0),
+            LineMeshHighOrder(11, 0.0, 1.0),
+            LineMeshLagrange(11, 0.0, 1.0, 2),
+            LineMeshLagrange(11, 0.0, 1.0, 5),
+            LineMesh.from_vertices(np.linspace(0.0, 1.0, 11) ** 2),
+        ]
+        for mesh in meshes:
+            Fem1d(mesh, operator_cache=cache).term_view
+        assert cache.misses == len(meshes) and len(cache) == len(meshes)
+        assert all(mesh in cache for mesh in meshes)
+
+    def test_eviction(self):
+        cache = OperatorCache(maxsize=2)
+        meshes = [LineMesh(n, 0.0, 1.0) for n in (5, 6, 7)]
+        for mesh in meshes:
+            Fem1d(mesh, operator_cache=cache).term_view
+        assert len(cache) == 2 and meshes[0] not in cache
+
+        nbytes = cache.nbytes
+        cache = OperatorCache(max_bytes=nbytes - 1)
+        for mesh in meshes[1:]:
+            Fem1d(mesh, operator_cache=cache).term_view
+        assert len(cache) == 1 and meshes[2] in cache
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+
+    def test_directory(self, tmp_path):
+        mesh = LineMeshHighOrder(21, -1.0, 1.0)
+        cache = OperatorCache(directory=tmp_path)
+        fem1 = Fem1d(mesh, operator_cache=cache)
+        fem1.laplacian(np.ones(mesh.n_node))
+        assert cache.misses == 1
+        cache = OperatorCache(directory=tmp_path)
+        fem2 = Fem1d(mesh, operator_cache=cache)
+        fem2.term(np.ones(mesh.n_node))
+        assert cache.misses == 0 and cache.hits == 1
+        assert not fem2._stiffness().data.flags.writeable
+        assert abs(fem2.laplacian_matrix - fem1.laplacian_matrix).max() == 0.0
+        assert abs(fem2.term_matrix - fem1.term_matrix).max() == 0.0
+
+    def test_matrix_free(self):
+        cache = OperatorCache()
+        fem = Fem1d(LineMesh(11, 0.0, 1.0), matrix_free=True, operator_cache=cache)
+        fem.laplacian_matrix
+        assert fem.matrix_free and len(cache) == 0
+
+    def test_size_exception(self):
+        with pytest.raises(ValueError):
+            OperatorCache(maxsize=-1)
+        with pytest.raises(ValueError):
+            OperatorCache(max_bytes=-1)
@@ -0,0 +1,61 @@
+import itertools
+
+import numpy as np
+import pytest
+from numpy.linalg import LinAlgError
+
+from module.discretization import LineMesh
+from module.fem import Fem1d, out_of_core_solve
+
+
+def _source(x):
+    return np.cos(3.0 * x) + x
+
+
+def _poisson_source(x):
+    return np.pi**2 * np.sin(np.pi * x)
+
+
+class TestOutOfCoreSolve:
+    @pytest.mark.parametrize("conditions", list(itertools.product(["dirichlet", "neumann"], repeat=2)))
+    @pytest.mark.parametrize("n_node", [2, 3, 101])
+    def test_serial(self, tmp_path, conditions, n_node):
+        mesh = LineMesh(n_node, -1.0, 2.0, list(conditions))
+        fem = Fem1d(mesh)
+        values = np.zeros(n_node)
+        values[0], values[-1] = 0.3, -1.2
+        expected = fem.solve(fem.term(_source(mesh.x)), values, 1.5, 0.7)
+        for chunk_size in (1, 2, 7, 1000):
+            sol = out_of_core_solve(
+                n_node, -1.0, 2.0, _source, [0.3, -1.2], tmp_path, 1.5, 0.7, list(conditions), chunk_size
+            )
+            assert isinstance(sol, np.memmap) and not sol.flags.writeable
+            np.testing.assert_allclose(sol, expected, atol=1e-10)
+        assert (tmp_path / "solution.npy").exists()
+        np.testing.assert_allclose(np.load(tmp_path / "solution.npy"), expected, atol=1e-10)
+        np.testing.assert_array_equal(np.load(tmp_path / "x.npy"), mesh.x)
+
+    def test_poisson(self, tmp_path):
+        n_node = 10001
+        sol = out_of_core_solve(n_node, 0.0, 1.0, _poisson_source, [0.0, 0.0], tmp_path, chunk_size=999)
+        np.testing.assert_allclose(sol, np.sin(np.pi * np.linspace(0.0, 1.0, n_node)), atol=1e-7)
+
+    def test_singular(self, tmp_path):
+        with pytest.raises(LinAlgError):
+            out_of_core_solve(101, 0.0, 1.0, np.cos, [0.0, 0.0], tmp_path, conditions=["N", "N"], chunk_size=10)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"n_node": 1},
+            {"chunk_size": 0},
+            {"boundary_values": [0.0]},
+            {"alpha": 0.0},
+            {"beta": -1.0},
+        ],
+    )
+    def test_exception(self, tmp_path, kwargs):
+        arguments = {"n_node": 11, "xmin": 0.0, "xmax": 1.0, "source": np.cos, "boundary_values": [0.0, 0.0]}
+        arguments.update(kwargs)
+        with pytest.raises(ValueError):
+            out_of_core_solve(directory=tmp_path, **arguments)
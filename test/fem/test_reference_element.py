@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d
+from module.fem.reference_element import lagrange_basis, lagrange_reference_matrices
+
+
+class TestLagrangeReferenceElement:
+    @pytest.mark.parametrize("degree", [1, 2, 3, 5])
+    def test_basis(self, degree):
+        xi = np.linspace(0.0, 1.0, 11)
+        values, derivatives = lagrange_basis(degree, xi)
+        np.testing.assert_allclose(values.sum(axis=1), 1.0)
+        np.testing.assert_allclose(derivatives.sum(axis=1), 0.0, atol=1e-10)
+
+    @pytest.mark.parametrize("degree", [1, 2, 4])
+    def test_matrices(self, degree):
+        laplacian, term = lagrange_reference_matrices(degree)
+        np.testing.assert_allclose(laplacian.sum(axis=1), 0.0, atol=1e-10)
+        np.testing.assert_allclose(term.sum(), 1.0)
+        assert lagrange_reference_matrices(degree)[0] is laplacian
+        assert not laplacian.flags.writeable
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            lagrange_reference_matrices(0)
+
+
+class TestFem1dLagrange:
+    @pytest.mark.parametrize("degree, mesh_type", [(1, LineMesh), (2, LineMeshHighOrder)])
+    def test_matches_fixed_order(self, degree, mesh_type):
+        fem = Fem1d(LineMeshLagrange(21, -0.5, 1, degree))
+        expected = Fem1d(mesh_type(21, -0.5, 1))
+        np.testing.assert_allclose(fem.laplacian_matrix.toarray(), expected.laplacian_matrix.toarray(), atol=1e-12)
+        np.testing.assert_allclose(fem.term_matrix.toarray(), expected.term_matrix.toarray(), atol=1e-14)
+
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["D", "N"]])
+    def test_poisson(self, conditions):
+        errors = []
+        for degree in (2, 4, 6):
+            mesh = LineMeshLagrange(6 * degree + 1, -0.5, 1, degree, conditions)
+            fem = Fem1d(mesh)
+            coef = 2.0 * np.pi
+            u = np.cos(coef * mesh.x)
+            values = u.copy()
+            values[-1] = -np.sin(coef * mesh.x[-1]) * coef if conditions[1] == "N" else u[-1]
+            sol = fem.solve(fem.term(np.cos(coef * mesh.x) * coef**2), values)
+            errors.append(np.max(np.abs(sol - u)))
+        assert errors[0] > errors[1] > errors[2]
+        assert errors[2] < 1e-5
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d, spectral_solve
+
+
+class TestSpectralSolve:
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["N", "N"]])
+    @pytest.mark.parametrize("alpha, beta", [(1.0, 1.0), (2.0, -30.0), (0.5, 4.0)])
+    def test_solve(self, conditions, alpha, beta):
+        mesh = LineMesh(65, -0.5, 1.5, conditions)
+        fem = Fem1d(mesh)
+        rng = np.random.default_rng(0)
+        rhs = rng.standard_normal(mesh.n_node)
+        values = rng.standard_normal(mesh.n_node)
+        expected = fem.solve(rhs, values, alpha, beta)
+        np.testing.assert_allclose(spectral_solve(mesh, rhs, values, alpha, beta), expected, atol=1e-10)
+        np.testing.assert_allclose(fem.solve(rhs, values, alpha, beta, method="spectral"), expected, atol=1e-10)
+
+    def test_poisson(self):
+        mesh = LineMesh(33, 0.0, 1.0)
+        fem = Fem1d(mesh)
+        rhs = fem.term(np.full(mesh.n_node, 2.0))
+        values = mesh.x**2
+        np.testing.assert_allclose(fem.solve(-rhs, values, method="spectral"), fem.solve(-rhs, values), atol=1e-12)
+
+    @pytest.mark.parametrize("conditions", [["D", "D"], ["N", "N"]])
+    def test_columns(self, conditions):
+        mesh = LineMesh(41, 0.0, 1.0, conditions)
+        fem = Fem1d(mesh)
+        rng = np.random.default_rng(1)
+        wavenumbers = np.array([1.0, 2.5, 7.0])
+        rhs = rng.standard_normal((mesh.n_node, 3))
+        values = rng.standard_normal((mesh.n_node, 3))
+        solutions = spectral_solve(mesh, rhs, values, 1.0, -(wavenumbers**2))
+        shared = spectral_solve(mesh, rhs[:, 0], values[:, 0], 1.0, -(wavenumbers**2))
+        assert solutions.shape == shared.shape == (mesh.n_node, 3)
+        for k, wavenumber in enumerate(wavenumbers):
+            expected = fem.solve(rhs[:, k], values[:, k], 1.0, -(wavenumber**2))
+            np.testing.assert_allclose(solutions[:, k], expected, atol=1e-10)
+            expected = fem.solve(rhs[:, 0], values[:, 0], 1.0, -(wavenumber**2))
+            np.testing.assert_allclose(shared[:, k], expected, atol=1e-10)
+
+    @pytest.mark.parametrize("n_node", [2, 3])
+    def test_few_nodes(self, n_node):
+        mesh = LineMesh(n_node, 0.0, 1.0)
+        rhs = np.arange(1.0, n_node + 1.0)
+        values = np.array([0.5] + [0.0] * (n_node - 2) + [-1.5])
+        expected = Fem1d(mesh).solve(rhs, values, 1.0, 2.0)
+        np.testing.assert_allclose(spectral_solve(mesh, rhs, values, 1.0, 2.0), expected, atol=1e-12)
+        np.testing.assert_equal(spectral_solve(mesh, rhs, values, 1.0, 2.0)[[0, -1]], [0.5, -1.5])
+
+    def test_exception(self):
+        rhs = np.zeros(9)
+        with pytest.raises(ValueError):
+            spectral_solve(LineMesh(9, 0.0, 1.0, ["D", "N"]), rhs, rhs)
+        with pytest.raises(ValueError):
+            spectral_solve(LineMesh(9, 0.0, 1.0, ["N", "N"]), rhs, rhs)
+        with pytest.raises(ValueError):
+            spectral_solve(LineMeshHighOrder(9, 0.0, 1.0), rhs, rhs)
+        with pytest.raises(ValueError):
+            Fem1d(LineMesh(9, 0.0, 1.0)).solve(rhs, rhs, method="unknown")
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d, helmholtz_sweep
+
+
+class TestHelmholtzSweep:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 51), (LineMeshHighOrder, 51)])
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_matches_single_solve(self, mesh_type, n, n_workers):
+        mesh = mesh_type(n, -0.5, 1, ["D", "N"])
+        fem = Fem1d(mesh)
+        wavenumbers = np.linspace(1.0, 5.0, 7)
+        rhs = fem.term(np.ones(mesh.n_node))
+        values = np.cos(mesh.x)
+
+        solutions = helmholtz_sweep(fem, wavenumbers, rhs, values, n_workers=n_workers)
+        assert solutions.shape == (wavenumbers.size, mesh.n_node)
+        for k, sol in zip(wavenumbers, solutions):
+            np.testing.assert_allclose(sol, fem.solve(rhs, values, 1.0, -(k**2)), atol=1e-10)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder
+from module.fem import Fem1d, ThetaMethod
+
+
+class TestThetaMethod:
+    @pytest.mark.parametrize("mesh_type, n", [(LineMesh, 101), (LineMeshHighOrder, 101)])
+    @pytest.mark.parametrize("theta", [0.5, 1.0])
+    def test_decay(self, mesh_type, n, theta):
+        mesh = mesh_type(n, 0.0, 1.0, ["D", "D"])
+        fem = Fem1d(mesh)
+        stepper = ThetaMethod(fem, 1e-3, theta)
+        u = np.sin(np.pi * mesh.x)
+        for u in stepper.steps(u, 100):
+            pass
+        exact = np.exp(-(np.pi**2) * 0.1) * np.sin(np.pi * mesh.x)
+        assert np.max(np.abs(u - exact)) < 1e-2
+        assert len(fem._factorizations) == 1
+
+    def test_neumann_source(self):
+        mesh = LineMesh(201, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh)
+        stepper = ThetaMethod(fem, 1e-2)
+
+        def exact(t):
+            return (1.0 + t) * np.cos(mesh.x)
+
+        def source(t):
+            return (2.0 + t) * np.cos(mesh.x)
+
+        def values(t):
+            v = exact(t)
+            v[-1] = -(1.0 + t) * np.sin(1.0)
+            return v
+
+        history = stepper.run(exact(0.0), 20, source=source, values=values)
+        assert history.shape == (21, mesh.n_node)
+        np.testing.assert_allclose(history[-1], exact(0.2), atol=1e-4)
+
+    def test_run_memmap(self, tmp_path):
+        mesh = LineMesh(11, 0.0, 1.0)
+        stepper = ThetaMethod(Fem1d(mesh), 1e-2)
+        u0 = np.sin(np.pi * mesh.x)
+        out = np.lib.format.open_memmap(tmp_path / "history.npy", mode="w+", shape=(6, mesh.n_node))
+        stepper.run(u0, 5, out=out)
+        out.flush()
+        expected = [u0, *stepper.steps(u0, 5)]
+        np.testing.assert_allclose(np.load(tmp_path / "history.npy"), expected)
+
+    @pytest.mark.parametrize("dt, theta", [(0.0, 0.5), (1e-3, 1.5)])
+    def test_init_exception(self, dt, theta):
+        with pytest.raises(ValueError):
+            ThetaMethod(Fem1d(LineMesh(11, 0.0, 1.0)), dt, theta)
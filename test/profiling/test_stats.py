@@ -0,0 +1,89 @@
+import time
+
+import numpy as np
+
+from module.discretization import LineMesh
+from module.fem import Fem1d
+from module.profiling import Stats
+
+
+class TestStats:
+    def test_phase(self):
+        stats = Stats()
+        for _ in range(3):
+            with stats.phase("work"):
+                pass
+        assert stats.calls["work"] == 3
+        assert stats.timers["work"] >= 0.0
+
+    def test_counter_and_bytes(self):
+        stats = Stats()
+        stats.count("hit")
+        stats.count("hit", 2)
+        stats.record_bytes("matrix", 128)
+        assert stats.as_dict()["counters"] == {"hit": 3}
+        assert stats.as_dict()["bytes"] == {"matrix": 128}
+        stats.reset()
+        assert stats.as_dict() == {"timers": {}, "calls": {}, "counters": {}, "bytes": {}}
+
+    def test_callback(self):
+        stats = Stats()
+        events = []
+
+        def callback(kind, name, value):
+            events.append((kind, name))
+
+        stats.add_callback(callback)
+        with stats.phase("work"):
+            stats.count("hit")
+        stats.record_bytes("matrix", 8)
+        assert events == [(Stats.COUNTER, "hit"), (Stats.TIMER, "work"), (Stats.BYTES, "matrix")]
+        stats.remove_callback(callback)
+        stats.count("hit")
+        assert len(events) == 3
+
+    def test_disabled(self):
+        stats = Stats(enabled=False)
+        with stats.phase("work"):
+            stats.count("hit")
+        stats.record_bytes("matrix", 8)
+        assert stats.as_dict() == {"timers": {}, "calls": {}, "counters": {}, "bytes": {}}
+
+
+class TestFem1dStats:
+    def test_phases(self):
+        mesh = LineMesh(101, 0.0, 1.0)
+        fem = Fem1d(mesh, stats=Stats())
+        values = np.zeros(mesh.n_node)
+        coefficient = fem.laplacian_matrix
+        rhs = fem.term(np.ones(mesh.n_node))
+        fem.implement_dirichlet(coefficient, rhs, values)
+        fem.implement_neumann(rhs, values)
+        fem.solve_system(coefficient, rhs)
+        fem.solve(rhs, values)
+        fem.solve(rhs, values)
+
+        timers = fem.stats.timers
+        for name in ("assembly.laplacian", "assembly.term", "copy.laplacian_matrix", "apply.term", "bc.dirichlet"):
+            assert name in timers
+        for name in ("bc.neumann", "solve.system", "solve.factorize", "solve.substitute"):
+            assert name in timers
+        assert fem.stats.calls["solve.substitute"] == 2
+        assert fem.stats.counters == {"factorization.miss": 1, "factorization.hit": 1}
+        assert fem.stats.bytes["laplacian_matrix"] > 0
+
+    def test_phases_disjoint(self):
+        mesh = LineMesh(20001, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh, stats=Stats())
+        rhs = np.ones(mesh.n_node)
+        start = time.perf_counter()
+        fem.solve(rhs, np.zeros(mesh.n_node), beta=1.0)
+        elapsed = time.perf_counter() - start
+        assert {"assembly.operator", "solve.factorize", "solve.substitute"} <= set(fem.stats.timers)
+        assert sum(fem.stats.timers.values()) <= elapsed
+
+    def test_default_disabled(self):
+        fem = Fem1d(LineMesh(11, 0.0, 1.0))
+        fem.laplacian_matrix
+        assert not fem.stats.enabled
+        assert fem.stats.timers == {}
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from module.discretization import LineMesh, LineMeshHighOrder, LineMeshLagrange
+from module.fem import Fem1d
+from module.storage import load_array, load_fem, load_matrix, load_mesh, save_array, save_fem, save_matrix, save_mesh
+
+
+class TestArray:
+    def test_roundtrip(self, tmp_path):
+        array = np.linspace(0.0, 1.0, 11)
+        save_array(tmp_path / "u.npy", array)
+        loaded = load_array(tmp_path / "u.npy")
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        np.testing.assert_array_equal(loaded, array)
+        assert not isinstance(load_array(tmp_path / "u.npy", mmap=False), np.memmap)
+
+
+class TestMesh:
+    @pytest.mark.parametrize(
+        "mesh",
+        [
+            LineMesh(11, -1.0, 2.0, ["D", "N"]),
+            LineMeshHighOrder(11, 0.0, 1.0, ["N", "D"]),
+            LineMeshLagrange(13, 0.0, 3.0, 4),
+        ],
+    )
+    def test_roundtrip(self, tmp_path, mesh):
+        save_mesh(tmp_path, mesh)
+        loaded = load_mesh(tmp_path)
+        assert type(loaded) is type(mesh)
+        assert loaded.n_node == mesh.n_node
+        assert loaded.n_element == mesh.n_element
+        assert loaded.conditions == mesh.conditions
+        assert loaded.boundary_nodes == mesh.boundary_nodes
+        np.testing.assert_array_equal(loaded.x, mesh.x)
+        np.testing.assert_array_equal(loaded.element_nodes, mesh.element_nodes)
+        assert isinstance(loaded.x, np.memmap)
+        assert not loaded.element_nodes.flags.writeable
+        if isinstance(mesh, LineMeshLagrange):
+            assert loaded.degree == mesh.degree
+
+    def test_wrong_type(self, tmp_path):
+        save_matrix(tmp_path, Fem1d(LineMesh(5, 0.0, 1.0)).laplacian_matrix)
+        with pytest.raises(ValueError):
+            load_mesh(tmp_path)
+
+
+class TestMatrix:
+    def test_roundtrip(self, tmp_path):
+        matrix = Fem1d(LineMeshHighOrder(9, 0.0, 1.0)).laplacian_matrix
+        save_matrix(tmp_path, matrix)
+        loaded = load_matrix(tmp_path)
+        assert loaded.format == "csr"
+        assert not loaded.data.flags.writeable
+        assert abs(loaded - matrix).max() == 0.0
+
+
+class TestFem:
+    def test_roundtrip(self, tmp_path):
+        mesh = LineMesh(21, 0.0, 1.0, ["D", "N"])
+        fem = Fem1d(mesh)
+        save_fem(tmp_path, fem)
+        loaded = load_fem(tmp_path, cache_size=2)
+        assert not loaded._laplacian.data.flags.writeable
+        assert loaded._bandwidth == fem._bandwidth == 1
+        assert abs(loaded.laplacian_matrix - fem.laplacian_matrix).max() == 0.0
+        assert abs(loaded.term_matrix - fem.term_matrix).max() == 0.0
+
+        rhs = fem.term(np.ones(mesh.n_node))
+        values = np.zeros(mesh.n_node)
+        np.testing.assert_allclose(loaded.solve(rhs, values, beta=1.0), fem.solve(rhs, values, beta=1.0))
+        coefficient = loaded.laplacian_matrix
+        rhs_bc = rhs.copy()
+        loaded.implement_dirichlet(coefficient, rhs_bc, values)
+        assert coefficient.data.flags.writeable
+
+    def test_matrices_shape(self):
+        mesh = LineMesh(5, 0.0, 1.0)
+        matrices = (Fem1d(mesh).laplacian_matrix, Fem1d(LineMesh(6, 0.0, 1.0)).term_matrix)
+        with pytest.raises(ValueError):
+            Fem1d(mesh, matrices=matrices)
+        with pytest.raises(ValueError):
+            Fem1d(mesh, matrix_free=True, matrices=(matrices[0], matrices[0]))
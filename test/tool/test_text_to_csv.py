@@ -0,0 +1,74 @@
+import builtins
+
+import pytest
+
+from module.tool import text_to_csv as module
+from module.tool.text_to_csv import text_to_csv
+
+TEXT = "a:1\nb:x,y\na:2\nb:3\na:4\nc:5\n"
+EXPECTED = ',a,b,c\n0,1,"x,y",5\n1,2,3,\n2,4,,\n'
+
+
+class TestTextToCsv:
+    @pytest.mark.parametrize("n_workers", [1, 2, 4])
+    @pytest.mark.parametrize("chunk_rows", [1, 100])
+    def test_csv(self, tmp_path, n_workers, chunk_rows):
+        in_path = tmp_path / "log.txt"
+        in_path.write_text(TEXT)
+        text_to_csv(in_path, n_workers=n_workers, chunk_rows=chunk_rows)
+        assert (tmp_path / "log.csv").read_text() == EXPECTED
+
+    def test_tmp_dir(self, tmp_path, monkeypatch):
+        in_path = tmp_path / "log.txt"
+        in_path.write_text(TEXT)
+        work = tmp_path / "work"
+        work.mkdir()
+        created = []
+        original = module.tempfile.TemporaryDirectory
+
+        def _temporary_directory(**kwargs):
+            created.append(kwargs)
+            return original(**kwargs)
+
+        monkeypatch.setattr(module.tempfile, "TemporaryDirectory", _temporary_directory)
+        text_to_csv(in_path)
+        text_to_csv(in_path, tmp_dir=work)
+        assert [kwargs["dir"] for kwargs in created] == [tmp_path, work]
+        assert list(work.iterdir()) == []
+        assert (tmp_path / "log.csv").read_text() == EXPECTED
+
+    def test_many_keys(self, tmp_path, monkeypatch):
+        in_path = tmp_path / "log.txt"
+        n_key, n_row = 300, 7
+        in_path.write_text("".join(f"k{k}:{k * n_row + i}\n" for i in range(n_row) for k in range(n_key)))
+        n_open, max_open = 0, 0
+
+        class _CountedFile:
+            def __init__(self, *args, **kwargs):
+                self._file = builtins.open(*args, **kwargs)
+
+            def __enter__(self):
+                nonlocal n_open, max_open
+                n_open += 1
+                max_open = max(max_open, n_open)
+                return self._file.__enter__()
+
+            def __exit__(self, *args):
+                nonlocal n_open
+                n_open -= 1
+                return self._file.__exit__(*args)
+
+        monkeypatch.setattr(module, "open", _CountedFile, raising=False)
+        text_to_csv(in_path, chunk_rows=5)
+        lines = (tmp_path / "log.csv").read_text().splitlines()
+        assert len(lines) == n_row + 1
+        assert lines[3].split(",") == ["2"] + [str(k * n_row + 2) for k in range(n_key)]
+        assert max_open <= 2
+
+    def test_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        in_path = tmp_path / "log.txt"
+        in_path.write_text(TEXT)
+        text_to_csv(in_path, parquet=True, chunk_rows=2)
+        table = pq.read_table(tmp_path / "log.parquet")
+        assert table.to_pydict() == {"a": ["1", "2", "4"], "b": ["x,y", "3", None], "c": ["5", None, None]}